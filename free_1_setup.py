@@ -17,7 +17,7 @@ import sys # 시스템 관련 작업 파이썬 모듈
 from typing import Optional # 타입 힌트 파이썬 모듈
 from dotenv import load_dotenv # 환경변수 처리 파이썬 모듈
 from pinecone import Pinecone # Pinecone 파이썬 모듈
-from sentence_transformers import SentenceTransformer # 임베딩 모델 파이썬 모듈
+import openai # OpenAI API 클라이언트
 
 # ====== 설정 상수 ======
 # 사용할 임베딩 모델 이름 (OpenAI 유료 모델)
@@ -29,6 +29,8 @@ EMBEDDING_DIMENSION = 1536
 # Pinecone 클라우드 설정
 CLOUD_PROVIDER = "aws"
 CLOUD_REGION = "us-east-1" 
+# 모델 연결 테스트 완료 표시 파일 (머신당 한 번만 테스트)
+MODEL_VERIFIED_MARKER = ".model_verified"
 
 # python에서 화살표 (->) 는 함수의 반환 타입을 나타냅니다. (함수가 특정 타입의 값을 반환해야 함을 알려주는 역할)
 # 예를 들어, -> None 은 함수가 아무것도 반환하지 않음을 의미합니다.
@@ -85,6 +87,17 @@ def load_and_test_model() -> str:
             sys.exit(1)
         
         print("✓ OpenAI API 키 확인 완료!")
+        
+        # 실제 API 테스트 호출 (VERIFY_APIS=1이고 아직 검증되지 않은 경우만)
+        if os.path.exists(MODEL_VERIFIED_MARKER):
+            print("✓ 이전에 모델 연결 테스트 완료됨 (테스트 생략)")
+        elif os.getenv("VERIFY_APIS") == "1":
+            openai_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+            openai_client.embeddings.create(model=MODEL_NAME, input="test")
+            with open(MODEL_VERIFIED_MARKER, 'w') as f:
+                f.write(MODEL_NAME)
+            print("✓ 모델 연결 테스트 완료!")
+        
         print("✓ text-embedding-3-small 모델 사용 준비 완료!")
         
         # OpenAI 모델은 직접 로드하지 않고 API 호출 시 사용
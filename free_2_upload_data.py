@@ -25,13 +25,18 @@ from pinecone import Pinecone # Pinecone 클라이언트 파이썬 모듈
 import time # 진행 상황 모니터링
 import re # 정규식 검사 파이썬 모듈
 from datetime import datetime # 진행 상황 모니터링
-from sentence_transformers import SentenceTransformer # 임베딩 모델 파이썬 모듈
 import html # HTML 태그 처리 파이썬 모듈
-from typing import Optional, List, Dict, Any # 타입 힌트 파이썬 모듈
+import codecs # 인코딩 검증용 점진적 디코더
+from typing import Optional, List, Dict, Any, Iterator # 타입 힌트 파이썬 모듈
 import unicodedata # 유니코드 문자 처리
 import logging # 로그 기록 파이썬 모듈
 import openai # OpenAI API 클라이언트
 
+try:
+    import chardet # 파일 인코딩 감지 파이썬 모듈 (선택적)
+except ImportError:
+    chardet = None
+
 # ====== 설정 상수 ======
 MODEL_NAME = 'text-embedding-3-small'
 INDEX_NAME = "bible-app-support-1536-openai"
@@ -40,6 +45,52 @@ EMBEDDING_DIMENSION = 1536
 DEFAULT_BATCH_SIZE = 20
 MAX_TEXT_LENGTH = 8000
 MAX_METADATA_LENGTH = 1000
+CSV_USECOLS = ['seq', 'contents', 'reply_contents']
+CSV_DTYPES = {'seq': 'int32', 'contents': 'string', 'reply_contents': 'string'}
+ENCODING_SAMPLE_SIZE = 65536
+DECODE_CHECK_BLOCK_SIZE = 1 << 20 # 인코딩 검증시 한 번에 읽을 바이트 수 (파일 전체를 메모리에 올리지 않음)
+CSV_CHUNK_SIZE = 5000
+EMBEDDING_BATCH_SIZE = 2048        # 임베딩 API 한 번의 요청에 담을 최대 텍스트 수 (API 입력 개수 상한)
+EMBEDDING_BATCH_MAX_CHARS = 200000 # 한 요청에 담을 최대 문자 수 (요청당 토큰 상한을 넘지 않도록 여유 있게 설정)
+
+# ====== 전처리 정규식 (모듈 로드시 한 번만 컴파일, 적용 순서 유지) ======
+# HTML 태그 → 텍스트 구조 변환
+HTML_TAG_SUBS = [
+    (re.compile(r'<br\s*/?>', re.IGNORECASE), '\n'),
+    (re.compile(r'</p>', re.IGNORECASE), '\n'),
+    (re.compile(r'<p[^>]*>', re.IGNORECASE), '\n'),
+    (re.compile(r'<li[^>]*>', re.IGNORECASE), '\n- '),
+    (re.compile(r'</li>', re.IGNORECASE), ''),
+    (re.compile(r'<(strong|b)[^>]*>', re.IGNORECASE), '**'),
+    (re.compile(r'</(strong|b)>', re.IGNORECASE), '**'),
+    (re.compile(r'<[^>]+>'), ''),
+]
+# 특수 공백 문자 (NBSP, 폭 없는 공백 등)
+SPECIAL_SPACE_RE = re.compile(r'[\u00A0\u2000-\u200B\u202F\u205F\u3000\uFEFF]')
+# 노이즈 제거 (반복 기호/자모, URL, 이메일, 전화번호 마스킹)
+NOISE_SUBS = [
+    (re.compile(r'([!?.]){2,}'), r'\1'),
+    (re.compile(r'([ㄱ-ㅎㅏ-ㅣ])\1{3,}'), r'\1\1'),
+    (re.compile(r'https?://\S+|www\.\S+'), '[URL]'),
+    (re.compile(r'\S+@\S+\.\S+'), '[EMAIL]'),
+    (re.compile(r'\d{2,4}-\d{3,4}-\d{4}'), '[PHONE]'),
+]
+# 메타데이터용 공백 정리 (줄바꿈 유지, 빈 줄은 이후 줄 단위 정리에서 제거되므로 줄바꿈 묶음 축소는 생략)
+METADATA_SPACE_SUBS = [
+    (re.compile(r'\r\n|\r'), '\n'),
+    (re.compile(r'[ \t]+'), ' '),
+]
+# 임베딩용 공백 정리
+EMBEDDING_SPACE_SUBS = [
+    (re.compile(r'\s+'), ' '),
+    (re.compile(r'\s+([.,!?;:])'), r'\1'),
+    (re.compile(r'([.,!?;:])\s+'), r'\1 '),
+    (re.compile(r'\(\s+'), '('),
+    (re.compile(r'\s+\)'), ')'),
+]
+# 키워드 추출 패턴
+BIBLE_VERSE_RE = re.compile(r'[가-힣]+[서복음기록상하전후편]+\s*\d+[장절:]+\s*\d*')
+HYMN_NUMBER_RE = re.compile(r'찬송가?\s*\d+장?')
 
 # 도메인 특화 중요 키워드 (가중치를 높일 단어들)
 DOMAIN_KEYWORDS = set([
@@ -130,13 +181,15 @@ def initialize_services() -> tuple[Pinecone, Any, Any]:
         # OpenAI 클라이언트 초기화 (기본 설정만 사용)
         openai_client = openai.OpenAI()
         
-        # 간단한 테스트 호출로 연결 확인
-        test_response = openai_client.embeddings.create(
-            model=MODEL_NAME,
-            input="test"
-        )
-        
-        print("✓ OpenAI 클라이언트 초기화 및 연결 테스트 완료!")
+        # 간단한 테스트 호출로 연결 확인 (VERIFY_APIS=1일 때만 - 불필요한 왕복/비용 방지)
+        if os.getenv("VERIFY_APIS") == "1":
+            test_response = openai_client.embeddings.create(
+                model=MODEL_NAME,
+                input="test"
+            )
+            print("✓ OpenAI 클라이언트 초기화 및 연결 테스트 완료!")
+        else:
+            print("✓ OpenAI 클라이언트 초기화 완료! (연결 테스트 생략)")
         
     except Exception as e:
         print(f"❌ OpenAI 클라이언트 초기화 실패: {e}")
@@ -148,11 +201,12 @@ def initialize_services() -> tuple[Pinecone, Any, Any]:
             print(" 대안 방법으로 OpenAI 클라이언트 초기화 시도...")
             openai_client = openai.OpenAI(api_key=openai_api_key)
             
-            # 테스트 호출
-            test_response = openai_client.embeddings.create(
-                model=MODEL_NAME,
-                input="test"
-            )
+            # 테스트 호출 (VERIFY_APIS=1일 때만)
+            if os.getenv("VERIFY_APIS") == "1":
+                test_response = openai_client.embeddings.create(
+                    model=MODEL_NAME,
+                    input="test"
+                )
             
             print("✓ 대안 방법으로 OpenAI 클라이언트 초기화 성공!")
         except Exception as e2:
@@ -171,51 +225,39 @@ def initialize_services() -> tuple[Pinecone, Any, Any]:
 #     str: 전처리된 텍스트
 def preprocess_text(text: str, for_metadata: bool = False) -> str:
 
-    if not text or pd.isna(text):
+    if text is None or pd.isna(text) or not text:
         return ""
     
     # 1. 기본 전처리
     text = str(text)
-    text = html.unescape(text)
-    
-    # 2. HTML 태그 제거
-    text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'</p>', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'<p[^>]*>', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'<li[^>]*>', '\n- ', text, flags=re.IGNORECASE)
-    text = re.sub(r'</li>', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'<(strong|b)[^>]*>', '**', text, flags=re.IGNORECASE)
-    text = re.sub(r'</(strong|b)>', '**', text, flags=re.IGNORECASE)
-    text = re.sub(r'<[^>]+>', '', text)
-    
-    # 3. 유니코드 정규화
-    text = unicodedata.normalize('NFC', text)
-    text = re.sub(r'[\u00A0\u2000-\u200B\u202F\u205F\u3000\uFEFF]', ' ', text)
+    if '&' in text:  # 엔티티가 없으면 디코딩 생략
+        text = html.unescape(text)
+    
+    # 2. HTML 태그 제거 (태그가 없으면 정규식 스캔 생략)
+    if '<' in text:
+        for pattern, replacement in HTML_TAG_SUBS:
+            text = pattern.sub(replacement, text)
+    
+    # 3. 유니코드 정규화 (ASCII 텍스트는 이미 정규형)
+    if not text.isascii():
+        text = unicodedata.normalize('NFC', text)
+    text = SPECIAL_SPACE_RE.sub(' ', text)
     
     # 4. 노이즈 제거
-    text = re.sub(r'([!?.]){2,}', r'\1', text)
-    text = re.sub(r'([ㄱ-ㅎㅏ-ㅣ])\1{3,}', r'\1\1', text)
-    text = re.sub(r'https?://\S+|www\.\S+', '[URL]', text)
-    text = re.sub(r'\S+@\S+\.\S+', '[EMAIL]', text)
-    text = re.sub(r'\d{2,4}-\d{3,4}-\d{4}', '[PHONE]', text)
+    for pattern, replacement in NOISE_SUBS:
+        text = pattern.sub(replacement, text)
     
     # 5. 공백 정리
     if for_metadata:
         # 메타데이터용: 줄바꿈 유지
-        text = re.sub(r'\r\n|\r', '\n', text)
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r'[ \t]+', ' ', text)
+        for pattern, replacement in METADATA_SPACE_SUBS:
+            text = pattern.sub(replacement, text)
         lines = [line.strip() for line in text.split('\n')]
         text = '\n'.join(line for line in lines if line)
     else:
-        # 임베딩용: 줄바꿈을 공백으로
-        text = re.sub(r'\r\n|\r|\n', ' ', text)
-        text = text.replace('\t', ' ')
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\s+([.,!?;:])', r'\1', text)
-        text = re.sub(r'([.,!?;:])\s+', r'\1 ', text)
-        text = re.sub(r'\(\s+', '(', text)
-        text = re.sub(r'\s+\)', ')', text)
+        # 임베딩용: 줄바꿈/탭을 포함한 모든 공백 묶음을 단일 공백으로 (첫 번째 치환에서 처리)
+        for pattern, replacement in EMBEDDING_SPACE_SUBS:
+            text = pattern.sub(replacement, text)
     
     text = text.strip()
     
@@ -241,11 +283,11 @@ def extract_keywords(text: str) -> List[str]:
     keywords = []
     
     # 성경 구절 패턴 추출
-    bible_verses = re.findall(r'[가-힣]+[서복음기록상하전후편]+\s*\d+[장절:]+\s*\d*', text)
+    bible_verses = BIBLE_VERSE_RE.findall(text)
     keywords.extend(bible_verses) # extend: 리스트에 요소를 추가하는 내장 메서드 (반복 가능한 객체의 요소를 하나씩 꺼내서 리스트에 추가)
     
     # 찬송가 번호 추출
-    hymn_numbers = re.findall(r'찬송가?\s*\d+장?', text) # findall: 정규식 패턴과 일치하는 모든 부분을 찾아서 리스트로 반환하는 내장 메서드
+    hymn_numbers = HYMN_NUMBER_RE.findall(text) # findall: 정규식 패턴과 일치하는 모든 부분을 찾아서 리스트로 반환하는 내장 메서드
     keywords.extend(hymn_numbers) 
     
     # 도메인 키워드 추출
@@ -255,42 +297,42 @@ def extract_keywords(text: str) -> List[str]:
     
     return keywords
 
-# ★ 함수 4. 임베딩 생성 함수
-# 텍스트를 OpenAI text-embedding-3-small 모델로 1536차원 벡터로 변환합니다.
+# 임베딩 입력 텍스트 구성 (도메인 키워드 상위 3개를 앞에 붙여 강조)
 # Args:
-#     text (str): 임베딩으로 변환할 텍스트
-#     openai_client (Any): OpenAI 클라이언트 인스턴스
-#     retry_count (int): 최대 재시도 횟수       
+#     text (str): 원본 텍스트
 # Returns:
-#     Optional[List[float]]: 성공 시 1536차원 임베딩 벡터, 실패 시 None
-def create_embedding(text: str, openai_client: Any, retry_count: int = 3) -> Optional[List[float]]:
-
-    if not text or not text.strip():
-        print("⚠️ 빈 텍스트로 인해 임베딩 생성을 건너뜁니다.")
-        return None
-    
-    # 키워드 강조 처리
+#     str: 키워드가 강조된 임베딩 입력 텍스트
+def _embedding_input(text: str) -> str:
     keywords = extract_keywords(text)
     if keywords:
         keyword_str = ' '.join(keywords[:3])
         text = f"{keyword_str} {text}"
-    
-    # 재시도 로직을 포함한 임베딩 생성
+    return text
+
+# 임베딩 API 호출 (재시도 포함, 문자열 하나 또는 리스트 입력 모두 처리)
+# Args:
+#     inputs (Any): 임베딩할 텍스트 또는 텍스트 리스트
+#     openai_client (Any): OpenAI 클라이언트 인스턴스
+#     retry_count (int): 최대 재시도 횟수
+# Returns:
+#     Optional[List[List[float]]]: 입력 순서대로의 임베딩 벡터 리스트, 실패 시 None
+def _request_embeddings(inputs: Any, openai_client: Any, retry_count: int) -> Optional[List[List[float]]]:
     for attempt in range(retry_count):
         try:
             # OpenAI text-embedding-3-small 모델로 임베딩 생성
             response = openai_client.embeddings.create(
                 model=MODEL_NAME,
-                input=text
+                input=inputs
             )
             
-            embedding_list = response.data[0].embedding
+            # 응답 순서(index)대로 정렬하여 입력 순서와 맞춤
+            embeddings = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
             
             # 차원 검증
-            if len(embedding_list) != EMBEDDING_DIMENSION:
-                print(f"⚠️ 예상치 못한 임베딩 차원: {len(embedding_list)} (예상: {EMBEDDING_DIMENSION})")
+            if embeddings and len(embeddings[0]) != EMBEDDING_DIMENSION:
+                print(f"⚠️ 예상치 못한 임베딩 차원: {len(embeddings[0])} (예상: {EMBEDDING_DIMENSION})")
             
-            return embedding_list
+            return embeddings
             
         except Exception as e:
             print(f"  임베딩 생성 실패 (시도 {attempt + 1}/{retry_count}): {e}")
@@ -303,6 +345,63 @@ def create_embedding(text: str, openai_client: Any, retry_count: int = 3) -> Opt
                 print("  모든 재시도가 실패했습니다.")
                 return None
 
+# ★ 함수 4. 임베딩 생성 함수
+# 텍스트를 OpenAI text-embedding-3-small 모델로 1536차원 벡터로 변환합니다.
+# Args:
+#     text (str): 임베딩으로 변환할 텍스트
+#     openai_client (Any): OpenAI 클라이언트 인스턴스
+#     retry_count (int): 최대 재시도 횟수       
+# Returns:
+#     Optional[List[float]]: 성공 시 1536차원 임베딩 벡터, 실패 시 None
+def create_embedding(text: str, openai_client: Any, retry_count: int = 3) -> Optional[List[float]]:
+
+    if not text or not text.strip():
+        print("⚠️ 빈 텍스트로 인해 임베딩 생성을 건너뜁니다.")
+        return None
+    
+    # 단일 텍스트는 리스트로 감싸지 않고 바로 요청
+    embeddings = _request_embeddings(_embedding_input(text), openai_client, retry_count)
+    return embeddings[0] if embeddings else None
+
+# ★ 함수 4-1. 일괄 임베딩 생성 함수
+# 여러 텍스트를 EMBEDDING_BATCH_SIZE개 / EMBEDDING_BATCH_MAX_CHARS자 단위로 묶어 요청당 한 번의 API 호출로 변환합니다.
+# Args:
+#     texts (List[str]): 임베딩으로 변환할 텍스트 리스트
+#     openai_client (Any): OpenAI 클라이언트 인스턴스
+#     retry_count (int): 묶음별 최대 재시도 횟수
+# Returns:
+#     List[Optional[List[float]]]: 입력 순서대로의 임베딩 벡터 (빈 텍스트/실패 묶음 항목은 None)
+def create_embeddings_batch(texts: List[str], openai_client: Any, retry_count: int = 3) -> List[Optional[List[float]]]:
+    results: List[Optional[List[float]]] = [None] * len(texts)
+    
+    # 빈 텍스트를 제외하고 요청 묶음 구성 (개수/문자 수 상한 중 먼저 도달하는 쪽에서 분할)
+    batches: List[List[int]] = []
+    inputs: Dict[int, str] = {}
+    current: List[int] = []
+    current_chars = 0
+    for i, text in enumerate(texts):
+        if not text or not text.strip():
+            continue
+        inputs[i] = _embedding_input(text)
+        if current and (len(current) >= EMBEDDING_BATCH_SIZE
+                        or current_chars + len(inputs[i]) > EMBEDDING_BATCH_MAX_CHARS):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(i)
+        current_chars += len(inputs[i])
+    if current:
+        batches.append(current)
+    
+    # 묶음별 API 호출 (실패한 묶음만 None으로 남김)
+    for positions in batches:
+        embeddings = _request_embeddings([inputs[i] for i in positions], openai_client, retry_count)
+        if embeddings is None:
+            continue
+        for i, embedding in zip(positions, embeddings):
+            results[i] = embedding
+    
+    return results
+
 # ★ 함수 5. 질문 내용을 분석하여 자동으로 카테고리를 분류합니다.
 # Args:
 #     question (str): 분류할 질문 텍스트
@@ -321,28 +420,95 @@ def categorize_question(question: str) -> str:
     
     return '사용 문의(기타)'
 
-# ★ 함수 6. CSV 파일을 다양한 인코딩으로 시도하여 안전하게 로드합니다.
+# 파일 전체가 주어진 인코딩으로 디코딩되는지 블록 단위로 확인하는 함수
+# (업로드 도중 뒤쪽 청크에서 UnicodeDecodeError가 나지 않도록 시작 전에 검증)
+# Args:
+#     file_path (str): 확인할 파일 경로
+#     encoding (str): 확인할 인코딩
+# Returns:
+#     bool: 파일 전체 디코딩 성공 여부
+def is_decodable(file_path: str, encoding: str) -> bool:
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        with open(file_path, 'rb') as f:
+            while True:
+                block = f.read(DECODE_CHECK_BLOCK_SIZE)
+                if not block:
+                    decoder.decode(b'', final=True)
+                    return True
+                decoder.decode(block)
+    except UnicodeDecodeError:
+        return False
+
+# CSV 파일을 청크 단위로 읽는 제너레이터 (반복이 끝나거나 중단되면 파일 리더를 닫음)
+# Args:
+#     file_path (str): 로드할 CSV 파일 경로
+#     encoding (str): 검증된 파일 인코딩
+#     chunksize (int): 한 번에 읽을 행 수
+# Returns:
+#     Iterator[pd.DataFrame]: 청크 단위 데이터프레임 이터레이터
+def iter_csv_chunks(file_path: str, encoding: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    with pd.read_csv(
+        file_path,
+        encoding=encoding,
+        usecols=CSV_USECOLS,
+        dtype=CSV_DTYPES,
+        engine='c',
+        chunksize=chunksize
+    ) as reader:
+        yield from reader
+
+# ★ 함수 6. CSV 파일의 인코딩을 감지하여 필요한 컬럼만 청크 단위로 로드합니다.
+# 파일 전체를 한 번에 메모리에 올리지 않고 chunksize 단위로 스트리밍합니다.
+# 인코딩은 업로드 시작 전에 파일 전체 디코딩으로 검증하고, 컬럼 형식은 헤더만 읽어 확인합니다.
 # Args:
 #     file_path (str): 로드할 CSV 파일 경로
+#     chunksize (int): 한 번에 읽을 행 수
 # Returns:
-#     pd.DataFrame: 로드된 데이터프레임
+#     Iterator[pd.DataFrame]: 청크 단위 데이터프레임 이터레이터
 # Raises:
 #     Exception: 모든 인코딩 시도가 실패한 경우
-def load_csv_data(file_path: str) -> pd.DataFrame:
+def load_csv_data(file_path: str, chunksize: int = CSV_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
     print(f"\n📖 '{file_path}' 파일 읽는 중...")
     
     encodings = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr', 'latin1']
     
+    # 파일 앞부분만 읽어 인코딩 추정 (전체 파일 반복 파싱 방지)
+    if chardet is not None:
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read(ENCODING_SAMPLE_SIZE)
+            guess = chardet.detect(raw).get('encoding')
+            if guess:
+                guess = guess.lower()
+                if guess == 'ascii':
+                    guess = 'utf-8'
+                elif guess == 'euc-kr':
+                    guess = 'cp949'  # cp949는 euc-kr의 상위 집합
+                print(f"✓ 감지된 인코딩: '{guess}'")
+                encodings = [guess] + [enc for enc in encodings if enc != guess]
+        except Exception as e:
+            print(f"  인코딩 감지 실패, 기본 순서로 시도: {e}")
+    
     for encoding in encodings:
         try:
-            df = pd.read_csv(file_path, encoding=encoding)
+            # 파일 전체 디코딩 확인 (뒤쪽 청크의 인코딩 오류를 업로드 전에 발견)
+            if not is_decodable(file_path, encoding):
+                print(f"  인코딩 '{encoding}' 실패, 다음 인코딩 시도...")
+                continue
+            
+            # 헤더만 읽어 필요한 컬럼이 있는지 확인
+            header = pd.read_csv(file_path, encoding=encoding, usecols=CSV_USECOLS, nrows=0)
             print(f"✓ 인코딩 '{encoding}'으로 파일 읽기 성공")
-            print(f"✓ 총 {len(df)}개 행 발견")
-            print(f"✓ 컬럼: {df.columns.tolist()}")
-            return df
+            print(f"✓ 청크 크기: {chunksize}개 행")
+            print(f"✓ 컬럼: {header.columns.tolist()}")
+            return iter_csv_chunks(file_path, encoding, chunksize)
             
-        except UnicodeDecodeError:
-            print(f"  인코딩 '{encoding}' 실패, 다음 인코딩 시도...")
+        except pd.errors.EmptyDataError:
+            print("✓ 빈 파일입니다.")
+            return iter([])
+        except LookupError:
+            print(f"  인코딩 '{encoding}'을 지원하지 않음, 다음 인코딩 시도...")
             continue
         except Exception as e:
             print(f"  인코딩 '{encoding}' 오류: {e}")
@@ -351,6 +517,7 @@ def load_csv_data(file_path: str) -> pd.DataFrame:
     raise Exception(f"'{file_path}' 파일을 읽을 수 없습니다. 파일이 존재하고 올바른 CSV 형식인지 확인해주세요.")
 
 # ★ 함수 7. CSV 파일의 Q&A 데이터를 Pinecone 벡터 데이터베이스에 업로드합니다.
+# 청크 단위로 전처리 → 임베딩 → 업로드를 진행하여 메모리 사용량을 일정하게 유지합니다.
 # Args:
 #     batch_size (int): 한 번에 업로드할 벡터 수
 #     max_items (Optional[int]): 테스트용 최대 아이템 수 제한
@@ -368,39 +535,13 @@ def upload_bible_data(batch_size: int = DEFAULT_BATCH_SIZE, max_items: Optional[
     print(f"💰 OpenAI 유료 모델 사용 - 더 정확한 의미 검색!")
     print("=" * 60)
     
-    # 데이터 읽기
+    # 데이터 읽기 (청크 스트리밍)
     try:
-        df = load_csv_data(DATA_FILE)
+        chunks = load_csv_data(DATA_FILE)
     except Exception as e:
         print(f"❌ 파일 읽기 오류: {e}")
         return
     
-    # 데이터 전처리
-    print("\n🔧 데이터 전처리 중...")
-    
-    if not df.empty:
-        print("\n📝 전처리 전 샘플:")
-        sample_reply = df['reply_contents'].iloc[0]
-        print(f"원본: {sample_reply[:150]}...")
-        
-        # 전처리 적용
-        df['contents'] = df['contents'].apply(lambda x: preprocess_text(x, for_metadata=False))
-        df['reply_contents'] = df['reply_contents'].apply(lambda x: preprocess_text(x, for_metadata=False))
-        
-        print("\n📝 전처리 후 샘플:")
-        cleaned_reply = df['reply_contents'].iloc[0]
-        print(f"정리됨: {cleaned_reply[:150]}...")
-    
-    # 빈 값 제거
-    df = df[(df['contents'] != '') & (df['reply_contents'] != '')]
-    
-    # 테스트용 데이터 제한
-    if max_items and len(df) > max_items:
-        df = df.head(max_items)
-        print(f"✓ 테스트를 위해 {max_items}개로 제한")
-    
-    print(f"✓ 유효한 데이터: {len(df)}개")
-    
     # 업로드 시작
     print(f"\n📤 Pinecone 업로드 시작...")
     print(f"배치 크기: {batch_size}개")
@@ -408,61 +549,103 @@ def upload_bible_data(batch_size: int = DEFAULT_BATCH_SIZE, max_items: Optional[
     vectors_to_upsert = []
     success_count = 0
     failed_count = 0
+    processed_count = 0
     start_time = datetime.now()
     
-    for idx, row in df.iterrows():
-        # 진행 상황 표시
-        if idx % 10 == 0:
-            elapsed_time = (datetime.now() - start_time).total_seconds()
-            if idx > 0:
-                avg_time_per_item = elapsed_time / idx
-                remaining_items = len(df) - idx
-                estimated_remaining = avg_time_per_item * remaining_items
-                print(f"\n진행: {idx}/{len(df)} ({idx/len(df)*100:.1f}%) | "
-                      f"성공: {success_count} | 실패: {failed_count} | "
-                      f"예상 남은 시간: {estimated_remaining/60:.1f}분")
+    for chunk_idx, df in enumerate(chunks):
+        # 데이터 전처리
+        print(f"\n🔧 청크 {chunk_idx + 1} 전처리 중... ({len(df)}개 행)")
         
-        # 질문 벡터화 (OpenAI 클라이언트 사용)
-        embedding = create_embedding(row['contents'], openai_client)
-        
-        if embedding is None:
-            failed_count += 1
+        if df.empty:
             continue
         
-        # 카테고리 자동 분류
-        category = categorize_question(row['contents'])
+        if chunk_idx == 0:
+            print("\n📝 전처리 전 샘플:")
+            sample_reply = df['reply_contents'].iloc[0]
+            print(f"원본: {str(sample_reply)[:150]}...")
+        
+        # 전처리 적용
+        df['contents'] = df['contents'].apply(lambda x: preprocess_text(x, for_metadata=False))
+        df['reply_contents'] = df['reply_contents'].apply(lambda x: preprocess_text(x, for_metadata=False))
+        
+        if chunk_idx == 0:
+            print("\n📝 전처리 후 샘플:")
+            cleaned_reply = df['reply_contents'].iloc[0]
+            print(f"정리됨: {cleaned_reply[:150]}...")
         
-        # 메타데이터 구성 (메타데이터용 전처리 적용)
-        metadata = {
-            "seq": int(row['seq']),
-            "question": preprocess_text(row['contents'], for_metadata=True),
-            "answer": preprocess_text(row['reply_contents'], for_metadata=True),
-            "category": category,
-            "source": "data_2025_sample_free"
-        }
+        # 빈 값 제거
+        df = df[(df['contents'] != '') & (df['reply_contents'] != '')]
         
-        # 고유 ID 생성
-        unique_id = f"qa_free_{row['seq']}"
+        # 테스트용 데이터 제한
+        if max_items:
+            remaining = max_items - processed_count
+            if len(df) > remaining:
+                df = df.head(remaining)
+                print(f"✓ 테스트를 위해 {max_items}개로 제한")
         
-        # 벡터 데이터 구성
-        vectors_to_upsert.append({
-            "id": unique_id,
-            "values": embedding,
-            "metadata": metadata
-        })
+        # 메타데이터용 전처리 컬럼 미리 계산 (루프 내 중복 정규식 처리 방지)
+        df = df.assign(
+            contents_meta=df['contents'].apply(lambda x: preprocess_text(x, for_metadata=True)),
+            reply_meta=df['reply_contents'].apply(lambda x: preprocess_text(x, for_metadata=True))
+        )
+        
+        print(f"✓ 유효한 데이터: {len(df)}개")
+        
+        # 질문 벡터화 (청크 전체를 묶음 단위 API 호출로 한 번에 처리)
+        embeddings = create_embeddings_batch(df['contents'].tolist(), openai_client)
+        
+        for (_, row), embedding in zip(df.iterrows(), embeddings):
+            processed_count += 1
+            
+            # 진행 상황 표시
+            if processed_count % 10 == 0:
+                elapsed_time = (datetime.now() - start_time).total_seconds()
+                print(f"\n진행: {processed_count}개 처리 | "
+                      f"성공: {success_count} | 실패: {failed_count} | "
+                      f"경과 시간: {elapsed_time/60:.1f}분")
+            
+            if embedding is None:
+                failed_count += 1
+                continue
+            
+            # 카테고리 자동 분류
+            category = categorize_question(row['contents'])
+            
+            # 메타데이터 구성 (미리 계산된 메타데이터용 전처리 결과 사용)
+            metadata = {
+                "seq": int(row['seq']),
+                "question": row['contents_meta'],
+                "answer": row['reply_meta'],
+                "category": category,
+                "source": "data_2025_sample_free"
+            }
+            
+            # 고유 ID 생성
+            unique_id = f"qa_free_{row['seq']}"
+            
+            # 벡터 데이터 구성
+            vectors_to_upsert.append({
+                "id": unique_id,
+                "values": embedding,
+                "metadata": metadata
+            })
+            
+            # 배치 크기에 도달하면 업로드
+            if len(vectors_to_upsert) >= batch_size:
+                try:
+                    index.upsert(vectors=vectors_to_upsert)
+                    success_count += len(vectors_to_upsert)
+                    print(f"  ✓ {len(vectors_to_upsert)}개 벡터 업로드 완료")
+                    vectors_to_upsert = []
+                    time.sleep(1)  # API 제한 방지
+                except Exception as e:
+                    print(f"  ❌ 업로드 오류: {e}")
+                    failed_count += len(vectors_to_upsert)
+                    vectors_to_upsert = []
         
-        # 배치 크기에 도달하면 업로드
-        if len(vectors_to_upsert) >= batch_size:
-            try:
-                index.upsert(vectors=vectors_to_upsert)
-                success_count += len(vectors_to_upsert)
-                print(f"  ✓ {len(vectors_to_upsert)}개 벡터 업로드 완료")
-                vectors_to_upsert = []
-                time.sleep(1)  # API 제한 방지
-            except Exception as e:
-                print(f"  ❌ 업로드 오류: {e}")
-                failed_count += len(vectors_to_upsert)
-                vectors_to_upsert = []
+        # 테스트용 최대 개수 도달시 중단
+        if max_items and processed_count >= max_items:
+            break
     
     # 남은 벡터 업로드
     if vectors_to_upsert:
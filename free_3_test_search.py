@@ -20,11 +20,24 @@ API 비용 없이 의미 기반 검색을 수행합니다.
 
 import os
 import sys
-from typing import Optional, List, Dict, Any
+import base64
+import functools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Any, Callable
+import numpy as np
 from dotenv import load_dotenv
 from pinecone import Pinecone
-from sentence_transformers import SentenceTransformer
 import openai # OpenAI API 클라이언트
+import httpx # OpenAI 공유 HTTP 연결 풀
+try:
+    import h2 # HTTP/2 지원 (설치시 하나의 연결로 여러 요청 동시 전송)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+from src.utils.semantic_query_cache import SemanticQueryCache # 시맨틱 질문 캐시
 
 # ====== 설정 상수 ======
 # 사용할 임베딩 모델 이름 (OpenAI 유료 모델)
@@ -39,8 +52,81 @@ DEFAULT_TOP_K = 5
 ANSWER_PREVIEW_LENGTH = 200
 # 유사도 임계값 (이 값 이하는 관련성이 낮은 것으로 판단)
 SIMILARITY_THRESHOLD = 0.3
+# 시맨틱 캐시 설정 (이 유사도 이상인 이전 질문의 결과를 재사용)
+SEMANTIC_CACHE_THRESHOLD = 0.95
+MAX_CACHE_SIZE = 10_000
+# 질문 캐시 영구 저장 파일 (재실행시에도 이전 임베딩/검색 결과 재사용)
+QUERY_CACHE_DB = os.getenv('QUERY_CACHE_DB', 'query_cache.db')
+# 캐시된 검색 결과 유효 시간 (초) - 지나면 임베딩만 재사용하고 Pinecone은 다시 검색
+SEARCH_RESULT_TTL = 3600
+# 유사도 등급표 (_EDGES 경계 이상이면 다음 등급: 0.4 / 0.6 / 0.8)
+_GRADES = ("🔴 낮음", "🟠 보통", "🟡 높음", "🟢 매우 높음")
+_EDGES = np.array([0.4, 0.6, 0.8])
+# 배치 검색시 동시 Pinecone 질의 수
+BATCH_QUERY_WORKERS = 16
+# OpenAI HTTP 연결 풀 설정 (keep-alive 연결 재사용으로 TLS 핸드셰이크 생략)
+HTTP_MAX_KEEPALIVE = 32
+HTTP_MAX_CONNECTIONS = 64
+HTTP_TIMEOUT = 30.0
+# 배치 임베딩 요청당 최대 입력 수 (청크별로 동시 요청)
+EMBEDDING_BATCH_SIZE = 256
+# OpenAI 요청 속도 제한 / 재시도 기본값 (환경변수 OPENAI_MAX_RPM, OPENAI_RETRY_ATTEMPTS로 변경 가능)
+DEFAULT_OPENAI_MAX_RPM = 3500
+DEFAULT_OPENAI_RETRY_ATTEMPTS = 6
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+# 재시도 대상 OpenAI 예외 (일시적 오류만 재시도)
+RETRYABLE_OPENAI_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError
+)
+
+# 프로세스 내 질문 캐시 (임베딩 + 검색 결과)
+query_cache = SemanticQueryCache(
+    dimension=EMBEDDING_DIMENSION,
+    max_size=MAX_CACHE_SIZE,
+    threshold=SEMANTIC_CACHE_THRESHOLD,
+    db_path=QUERY_CACHE_DB,
+    result_ttl=SEARCH_RESULT_TTL
+)
+
+# OpenAI 요청 간격 제어용 상태 (다음 요청 허용 시각)
+_throttle_lock = threading.Lock()
+_next_request_time = 0.0
+
+# ★ 함수 1-0. Pinecone 인덱스와 OpenAI 클라이언트를 한 번만 생성합니다. (프로세스 내 싱글턴)
+# 다른 모듈에서 import하여 여러 번 호출해도 클라이언트와 연결 풀을 다시 만들지 않습니다.
+# Args:
+#     None
+# Returns:
+#     tuple: (Pinecone 인덱스, OpenAI 클라이언트)
+@functools.cache
+def _get_clients() -> tuple[Any, Any]:
+    load_dotenv()
+    
+    # Pinecone 인덱스 (배치 검색 동시 질의 수만큼 연결 풀 확보)
+    pc = Pinecone(api_key=os.getenv('PINECONE_API_KEY'))
+    index = pc.Index(INDEX_NAME, pool_threads=BATCH_QUERY_WORKERS)
+    
+    # 프로세스 전체에서 하나의 HTTP 클라이언트를 공유 (연결 재사용)
+    # HTTP/2 사용 가능하면 동시 요청을 하나의 TCP 연결에 다중화
+    http_client = httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            max_connections=HTTP_MAX_CONNECTIONS
+        ),
+        timeout=httpx.Timeout(HTTP_TIMEOUT, connect=5.0)
+    )
+    # 재시도는 embed_with_retry에서 일괄 처리 (SDK 내부 재시도와 중복 방지)
+    openai_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'), http_client=http_client, max_retries=0)
+    
+    return index, openai_client
 
 # ★ 함수 1. 필요한 서비스들을 초기화합니다.
+# 환경변수를 검증한 뒤 공유 클라이언트를 반환합니다. (인덱스 상태 조회는 DEBUG=1일 때만)
 # Args:
 #     None
 # Returns:
@@ -52,80 +138,175 @@ def initialize_services() -> tuple[Any, Any]:
     load_dotenv()
     
     # API 키 확인
-    pinecone_api_key = os.getenv('PINECONE_API_KEY')
-    openai_api_key = os.getenv('OPENAI_API_KEY')
-    
-    if not pinecone_api_key:
+    if not os.getenv('PINECONE_API_KEY'):
         print("❌ PINECONE_API_KEY가 .env 파일에 설정되지 않았습니다.")
         print("💡 .env 파일에 PINECONE_API_KEY=your_api_key를 추가하세요.")
         sys.exit(1)
     
-    if not openai_api_key:
+    if not os.getenv('OPENAI_API_KEY'):
         print("❌ OPENAI_API_KEY가 .env 파일에 설정되지 않았습니다.")
         print("💡 .env 파일에 OPENAI_API_KEY=your_api_key를 추가하세요.")
         sys.exit(1)
     
     print("✓ 환경변수 로드 완료!")
     
-    # Pinecone 초기화
-    print("🌲 Pinecone 연결 중...")
+    # Pinecone / OpenAI 클라이언트 준비
+    print("🌲 Pinecone / OpenAI 클라이언트 준비 중...")
     try:
-        pc = Pinecone(api_key=pinecone_api_key)
-        index = pc.Index(INDEX_NAME)
-        
-        # 인덱스 상태 확인
-        stats = index.describe_index_stats()
-        total_vectors = stats.get('total_vector_count', 0)
-        
-        print(f"✓ Pinecone 연결 완료! (총 {total_vectors}개 벡터)")
-        
-        if total_vectors == 0:
-            print("⚠️ 경고: 인덱스에 데이터가 없습니다.")
-            print("💡 먼저 free_2_upload_data.py를 실행하여 데이터를 업로드하세요.")
-            
+        index, openai_client = _get_clients()
+        print("✓ 클라이언트 초기화 완료!")
     except Exception as e:
-        print(f"❌ Pinecone 연결 실패: {e}")
+        print(f"❌ 클라이언트 초기화 실패: {e}")
         print("💡 API 키와 인덱스 이름을 확인하세요.")
         sys.exit(1)
     
-    # OpenAI 클라이언트 초기화
-    print(f"📦 {MODEL_NAME} 모델 로드 중...")
-    try:
-        openai_client = openai.OpenAI(api_key=openai_api_key)
-        print("✓ OpenAI 클라이언트 초기화 완료!")
-    except Exception as e:
-        print(f"❌ 모델 로드 실패: {e}")
-        print("💡 OpenAI API 키를 확인하세요.")
-        sys.exit(1)
+    # 인덱스 상태 확인 (네트워크 왕복이 필요하므로 디버그 모드에서만)
+    if os.getenv("DEBUG") == "1":
+        try:
+            stats = index.describe_index_stats()
+            total_vectors = stats.get('total_vector_count', 0)
+            print(f"📊 인덱스 상태: 총 {total_vectors}개 벡터")
+            
+            if total_vectors == 0:
+                print("⚠️ 경고: 인덱스에 데이터가 없습니다.")
+                print("💡 먼저 free_2_upload_data.py를 실행하여 데이터를 업로드하세요.")
+        except Exception as e:
+            print(f"❌ Pinecone 연결 실패: {e}")
+            print("💡 API 키와 인덱스 이름을 확인하세요.")
+            sys.exit(1)
     
     return index, openai_client
 
+# ★ 함수 1-1. OpenAI 요청 속도를 분당 최대 요청 수(OPENAI_MAX_RPM) 이하로 제한합니다.
+# 요청마다 최소 간격(60초 / RPM)을 두어 순간적인 요청 폭주로 429가 발생하지 않도록 합니다.
+# Args:
+#     None
+# Returns:
+#     None: 필요한 만큼 대기 후 반환
+def throttle_openai_request() -> None:
+    global _next_request_time
+    max_rpm = max(int(os.getenv('OPENAI_MAX_RPM', DEFAULT_OPENAI_MAX_RPM)), 1)
+    interval = 60.0 / max_rpm
+    
+    with _throttle_lock:
+        now = time.monotonic()
+        wait_time = _next_request_time - now
+        _next_request_time = max(now, _next_request_time) + interval
+    
+    if wait_time > 0:
+        time.sleep(wait_time)
+
+# ★ 함수 1-2. 재시도 전 대기 시간을 계산합니다.
+# 서버가 Retry-After 헤더를 주면 그 값을 따르고, 없으면 지수 백오프(1s, 2s, 4s, 8s...) + 지터를 사용합니다.
+# Args:
+#     error (Exception): 발생한 OpenAI 예외
+#     attempt (int): 현재 시도 번호 (0부터 시작)
+# Returns:
+#     float: 대기할 시간(초)
+def get_retry_delay(error: Exception, attempt: int) -> float:
+    response = getattr(error, 'response', None)
+    if response is not None:
+        retry_after = response.headers.get('retry-after')
+        if retry_after:
+            try:
+                return min(float(retry_after), RETRY_MAX_DELAY)
+            except ValueError:
+                pass
+    
+    delay = min(RETRY_BASE_DELAY * (2 ** attempt), RETRY_MAX_DELAY)
+    return delay + random.uniform(0, delay * 0.1)
+
+# ★ 함수 1-3. 속도 제한 + 재시도를 적용하여 임베딩 API를 호출합니다.
+# Args:
+#     create (Callable): OpenAI 임베딩 생성 메서드 (openai_client.embeddings.create)
+#     **request: 임베딩 요청 인자 (model, input, encoding_format 등)
+# Returns:
+#     Any: OpenAI 임베딩 응답 객체
+# Raises:
+#     openai.OpenAIError: 재시도 횟수를 모두 소진했거나 재시도 대상이 아닌 오류
+def embed_with_retry(create: Callable[..., Any], **request: Any) -> Any:
+    max_attempts = max(int(os.getenv('OPENAI_RETRY_ATTEMPTS', DEFAULT_OPENAI_RETRY_ATTEMPTS)), 1)
+    
+    for attempt in range(max_attempts):
+        throttle_openai_request()
+        try:
+            return create(**request)
+        except RETRYABLE_OPENAI_ERRORS as e:
+            if attempt == max_attempts - 1:
+                raise
+            delay = get_retry_delay(e, attempt)
+            print(f"⏳ 임베딩 API 일시 오류 ({type(e).__name__}), {delay:.1f}초 후 재시도... ({attempt + 1}/{max_attempts - 1})")
+            time.sleep(delay)
+
+# ★ 함수 1-4. 모델/차원이 고정된 임베딩 함수를 만듭니다.
+# 모델 이름, base64 응답 형식, 출력 차원을 클로저에 묶어 호출마다 옵션을 다시 구성하지 않습니다.
+# base64 응답은 바이트 길이가 정확하므로 count=dim 디코딩이 차원 검증을 겸합니다. (불일치시 ValueError)
+# Args:
+#     openai_client (Any): OpenAI 클라이언트 인스턴스
+#     model (str): 임베딩 모델 이름
+#     dim (int): 임베딩 벡터 차원
+# Returns:
+#     Callable[[List[str]], List[np.ndarray]]: 텍스트 리스트 → float32 임베딩 리스트 (입력 순서 유지)
+def make_embedder(openai_client: Any, model: str = MODEL_NAME,
+                  dim: int = EMBEDDING_DIMENSION) -> Callable[[List[str]], List[np.ndarray]]:
+    create = openai_client.embeddings.create
+    b64decode = base64.b64decode
+    frombuffer = np.frombuffer
+    float32 = np.float32
+    
+    def embed(texts: List[str]) -> List[np.ndarray]:
+        response = embed_with_retry(create, model=model, input=texts, encoding_format="base64")
+        data = sorted(response.data, key=lambda d: d.index)
+        return [frombuffer(b64decode(item.embedding), dtype=float32, count=dim) for item in data]
+    
+    return embed
+
+# ★ 함수 1-5. 클라이언트별 임베딩 함수를 한 번만 만들어 재사용합니다.
+# Args:
+#     openai_client (Any): OpenAI 클라이언트 인스턴스
+# Returns:
+#     Callable[[List[str]], List[np.ndarray]]: make_embedder로 만든 임베딩 함수
+@functools.cache
+def get_embedder(openai_client: Any) -> Callable[[List[str]], List[np.ndarray]]:
+    return make_embedder(openai_client)
+
 # ★ 함수 2. 텍스트를 1536차원 벡터로 변환하는 함수
 # Args:
 #     text (str): 임베딩으로 변환할 텍스트
 #     openai_client (Any): OpenAI 클라이언트 인스턴스
 # Returns:
-#     Optional[List[float]]: 성공 시 1536차원 임베딩 벡터, 실패 시 None
-def create_embedding(text: str, openai_client: Any) -> Optional[List[float]]:
+#     Optional[np.ndarray]: 성공 시 1536차원 float32 임베딩 벡터, 실패 시 None
+def create_embedding(text: str, openai_client: Any) -> Optional[np.ndarray]:
     # 빈 텍스트 검증
     if not text or not text.strip():
         print("⚠️ 빈 텍스트는 임베딩할 수 없습니다.")
         return None
     
+    # 정확 일치 캐시 확인 (동일 질문은 API 호출 생략)
+    cached = query_cache.get_exact(text)
+    if cached is not None:
+        return cached[0]
+    
+    return _embed_uncached(text, openai_client)
+
+# 캐시 조회 없이 임베딩을 생성하고 캐시에 저장하는 함수 (호출자가 이미 정확 일치 캐시를 확인한 경우 사용)
+# Args:
+#     text (str): 임베딩으로 변환할 텍스트
+#     openai_client (Any): OpenAI 클라이언트 인스턴스
+# Returns:
+#     Optional[np.ndarray]: 성공 시 정규화된 임베딩 벡터, 실패 시 None
+def _embed_uncached(text: str, openai_client: Any) -> Optional[np.ndarray]:
     try:
-        # OpenAI text-embedding-3-small 모델로 임베딩 생성
-        response = openai_client.embeddings.create(
-            model=MODEL_NAME,
-            input=text
-        )
+        # OpenAI text-embedding-3-small 모델로 임베딩 생성 (429 등 일시 오류는 재시도)
+        vec = get_embedder(openai_client)([text])[0]
         
-        embedding_list = response.data[0].embedding
+        # 단위 벡터로 정규화 (Pinecone 인덱스 metric은 cosine이라 점수 불변, 로컬 캐시는 내적만으로 비교)
+        vec = vec / max(float(np.linalg.norm(vec)), 1e-12)
         
-        # 차원 검증
-        if len(embedding_list) != EMBEDDING_DIMENSION:
-            print(f"⚠️ 예상치 못한 임베딩 차원: {len(embedding_list)} (예상: {EMBEDDING_DIMENSION})")
+        # 임베딩 캐시 저장 (검색 결과는 search_question에서 저장)
+        query_cache.put(text, vec)
         
-        return embedding_list
+        return vec
         
     except Exception as e:
         print(f"❌ 임베딩 생성 실패: {e}")
@@ -145,21 +326,43 @@ def search_question(query: str, index: Any, openai_client: Any, top_k: int = DEF
     print(f"\n🔍 검색어: '{query}'")
     print("=" * 60)
     
-    # 1. 질문을 벡터로 변환
-    print("📊 검색 벡터 생성 중...")
-    query_vector = create_embedding(query, openai_client)
+    # 0. 동일 질문 + 동일 검색 조건 캐시 확인 (임베딩 + Pinecone 왕복 모두 생략)
+    search_params = get_search_params(top_k)
+    cached = query_cache.get_exact(query, search_params)
+    if cached is not None and cached[1] is not None:
+        print(f"⚡ 캐시된 결과 사용: {len(cached[1])}개")
+        display_search_results(cached[1])
+        return cached[1]
+    
+    # 1. 질문을 벡터로 변환 (0단계에서 임베딩만 캐시되어 있었으면 재사용, 캐시 재조회 없음)
+    if cached is not None:
+        query_vector = cached[0]
+    elif not query or not query.strip():
+        print("⚠️ 빈 텍스트는 임베딩할 수 없습니다.")
+        query_vector = None
+    else:
+        print("📊 검색 벡터 생성 중...")
+        query_vector = _embed_uncached(query, openai_client)
     
     if query_vector is None:
         print("❌ 검색 벡터 생성 실패")
         return []
     
+    # 1-1. 의미적으로 거의 같은 이전 질문 확인 (Pinecone 왕복 생략)
+    similar_results = query_cache.get_similar(query_vector, search_params)
+    if similar_results is not None:
+        print(f"⚡ 유사 질문 캐시 결과 사용: {len(similar_results)}개")
+        query_cache.put(query, query_vector, similar_results, search_params)
+        display_search_results(similar_results)
+        return similar_results
+    
     try:
-        # 2. Pinecone에서 유사도 검색 수행
+        # 2. Pinecone에서 유사도 검색 수행 (점수만 받고 메타데이터는 임계값 통과분만 별도 조회)
         print("🔍 유사한 질문 검색 중...")
         results = index.query(
-            vector=query_vector,
+            vector=query_vector.tolist(),
             top_k=top_k,
-            include_metadata=True
+            include_metadata=False
         )
         
         # 3. 검색 결과 검증
@@ -169,17 +372,18 @@ def search_question(query: str, index: Any, openai_client: Any, top_k: int = DEF
             return []
         
         # 4. 결과 필터링 및 정렬 (관련성이 높은 것만)
-        filtered_results = []
-        for match in results['matches']:
-            if match['score'] >= SIMILARITY_THRESHOLD:
-                filtered_results.append(match)
+        filtered_results = filter_matches(results['matches'])
         
         if not filtered_results:
             print(f"❌ 유사도가 {SIMILARITY_THRESHOLD:.1%} 이상인 결과가 없습니다.")
             print("💡 더 구체적인 질문을 시도해보세요.")
             return []
         
-        # 5. 결과 표시
+        # 4-1. 남은 결과의 메타데이터(질문/답변)만 조회
+        filtered_results = fetch_match_metadata(index, filtered_results)
+        
+        # 5. 결과 캐시 저장 및 표시
+        query_cache.put(query, query_vector, filtered_results, search_params)
         print(f"✓ {len(filtered_results)}개의 관련 결과를 찾았습니다!")
         display_search_results(filtered_results)
         
@@ -190,6 +394,154 @@ def search_question(query: str, index: Any, openai_client: Any, top_k: int = DEF
         print("💡 네트워크 연결을 확인하고 다시 시도하세요.")
         return []
 
+# ★ 함수 3-0. 검색 결과 캐시 키로 쓸 검색 조건 문자열을 만듭니다.
+# top_k나 유사도 임계값이 바뀌면 이전 검색 결과를 재사용하지 않도록 합니다.
+# Args:
+#     top_k (int): 반환할 최대 결과 수
+# Returns:
+#     str: 검색 조건 문자열 (예: "5:0.3")
+def get_search_params(top_k: int) -> str:
+    return f"{top_k}:{SIMILARITY_THRESHOLD}"
+
+# ★ 함수 3-1. 유사도 임계값 이상인 검색 결과만 남깁니다.
+# Args:
+#     matches (List[Dict]): Pinecone 검색 결과 리스트
+# Returns:
+#     List[Dict]: 임계값 이상인 결과 리스트
+def filter_matches(matches: List[Dict]) -> List[Dict]:
+    if not matches:
+        return []
+    
+    # 점수 배열에 한 번에 임계값 마스크 적용 (top_k가 클 때 반복문 대비 빠름)
+    scores = np.fromiter((match['score'] for match in matches), dtype=np.float64, count=len(matches))
+    keep = np.flatnonzero(scores >= SIMILARITY_THRESHOLD)
+    return [matches[i] for i in keep.tolist()]
+
+# ★ 함수 3-2. 여러 질문을 한 번에 검색합니다. (배치 모드)
+# 임베딩은 한 번의 API 호출로 생성하고, Pinecone 질의는 동시에 실행합니다.
+# Args:
+#     queries (List[str]): 검색할 질문 리스트
+#     index (Any): Pinecone 인덱스 객체
+#     openai_client (Any): OpenAI 클라이언트
+#     top_k (int): 질문당 반환할 최대 결과 수 (기본값: 5)
+# Returns:
+#     List[List[Dict]]: 질문 순서대로 정렬된 검색 결과 리스트
+def search_questions_batch(queries: List[str], index: Any, openai_client: Any, top_k: int = DEFAULT_TOP_K) -> List[List[Dict]]:
+    
+    print(f"\n🔍 배치 검색: {len(queries)}개 질문")
+    print("=" * 60)
+    
+    # 0. 정규화 기준으로 중복 질문 제거 (고유 질문만 임베딩/검색 후 원래 순서로 분배)
+    normalized = [query_cache.normalize_query(query) for query in queries]
+    _, first_indices, inverse = np.unique(normalized, return_index=True, return_inverse=True)
+    unique_queries = [queries[i] for i in first_indices.tolist()]
+    if len(unique_queries) < len(queries):
+        print(f"♻️ 중복 질문 {len(queries) - len(unique_queries)}개 제외")
+    
+    unique_results: List[Optional[List[Dict]]] = [None] * len(unique_queries)
+    search_params = get_search_params(top_k)
+    
+    # 1. 캐시된 질문은 바로 결과 사용 (임베딩만 캐시된 질문은 벡터 재사용)
+    pending = []
+    pending_vectors: Dict[int, np.ndarray] = {}
+    for i, query in enumerate(unique_queries):
+        cached = query_cache.get_exact(query, search_params)
+        if cached is not None and cached[1] is not None:
+            unique_results[i] = cached[1]
+        else:
+            pending.append(i)
+            if cached is not None:
+                pending_vectors[i] = cached[0]
+    
+    to_embed = [i for i in pending if i not in pending_vectors]
+    if to_embed:
+        # 2. 임베딩이 없는 질문들만 청크 단위로 동시에 임베딩 (청크당 API 호출 1회)
+        print(f"📊 검색 벡터 {len(to_embed)}개 생성 중...")
+        embed_texts = [unique_queries[i] for i in to_embed]
+        chunks = [embed_texts[start:start + EMBEDDING_BATCH_SIZE]
+                  for start in range(0, len(embed_texts), EMBEDDING_BATCH_SIZE)]
+        try:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), BATCH_QUERY_WORKERS)) as executor:
+                chunk_vectors = list(executor.map(get_embedder(openai_client), chunks))
+            pending_vectors.update(zip(to_embed, (vector for chunk in chunk_vectors for vector in chunk)))
+        except Exception as e:
+            print(f"❌ 배치 임베딩 생성 실패: {e}")
+    
+    if pending_vectors:
+        # 3. 유사 질문 캐시 확인 후 나머지는 Pinecone에 동시 질의 (임베딩 실패 질문은 제외)
+        to_query = []
+        for i, vector in pending_vectors.items():
+            similar_results = query_cache.get_similar(vector, search_params)
+            if similar_results is not None:
+                unique_results[i] = similar_results
+                query_cache.put(unique_queries[i], vector, similar_results, search_params)
+            else:
+                to_query.append((i, vector))
+        
+        if to_query:
+            print(f"🔍 Pinecone 동시 검색 {len(to_query)}건...")
+            with ThreadPoolExecutor(max_workers=BATCH_QUERY_WORKERS) as executor:
+                futures = {
+                    executor.submit(query_filtered_matches, index, vector, top_k): (i, vector)
+                    for i, vector in to_query
+                }
+                for future in as_completed(futures):
+                    i, vector = futures[future]
+                    try:
+                        matches = future.result()
+                    except Exception as e:
+                        print(f"❌ '{unique_queries[i]}' 검색 중 오류 발생: {e}")
+                        continue
+                    unique_results[i] = matches
+                    query_cache.put(unique_queries[i], vector, matches, search_params)
+    
+    # 3-1. 고유 질문 결과를 원래 질문 순서로 분배
+    all_results = [unique_results[j] for j in inverse.reshape(-1).tolist()]
+    
+    # 4. 질문별 결과 표시
+    for query, results in zip(queries, all_results):
+        print(f"\n🔍 검색어: '{query}'")
+        if results:
+            print(f"✓ {len(results)}개의 관련 결과를 찾았습니다!")
+            display_search_results(results)
+        else:
+            print("❌ 관련 결과가 없습니다.")
+    
+    return [results or [] for results in all_results]
+
+# ★ 함수 3-3. 임계값을 통과한 결과의 메타데이터만 Pinecone에서 조회해 붙입니다.
+# 검색 단계에서 include_metadata=False로 받아 긴 답변 본문 전송을 버려질 결과까지 하지 않도록 합니다.
+# Args:
+#     index (Any): Pinecone 인덱스 객체
+#     matches (List[Dict]): 메타데이터 없는 검색 결과 리스트
+# Returns:
+#     List[Dict]: id, score, metadata를 가진 결과 리스트 (입력 순서 유지)
+def fetch_match_metadata(index: Any, matches: List[Dict]) -> List[Dict]:
+    if not matches:
+        return []
+    
+    fetched = index.fetch(ids=[match['id'] for match in matches])
+    vectors = fetched.vectors or {}
+    
+    results = []
+    for match in matches:
+        vector = vectors.get(match['id'])
+        metadata = (vector.metadata if vector is not None else None) or {}
+        results.append({'id': match['id'], 'score': match['score'], 'metadata': metadata})
+    return results
+
+# ★ 함수 3-4. 검색 → 임계값 필터 → 메타데이터 조회를 한 번에 수행합니다. (배치 검색 작업 단위)
+# Args:
+#     index (Any): Pinecone 인덱스 객체
+#     vector (np.ndarray): 질문 임베딩 벡터
+#     top_k (int): 반환할 최대 결과 수
+# Returns:
+#     List[Dict]: 임계값 이상인 결과 리스트 (메타데이터 포함)
+def query_filtered_matches(index: Any, vector: np.ndarray, top_k: int) -> List[Dict]:
+    results = index.query(vector=vector.tolist(), top_k=top_k, include_metadata=False)
+    matches = filter_matches(results.get('matches', []) if results else [])
+    return fetch_match_metadata(index, matches)
+
 # ★ 함수 4. 검색 결과를 사용자 친화적인 형식으로 표시합니다.
 # Args:
 #     results (List[Dict]): Pinecone 검색 결과 리스트
@@ -197,27 +549,23 @@ def search_question(query: str, index: Any, openai_client: Any, top_k: int = DEF
 #     None: 결과 표시 후 반환 값 없음
 def display_search_results(results: List[Dict]) -> None:
 
-    for i, match in enumerate(results, 1):
+    # 유사도 등급 판정 (전체 점수를 등급표 경계에서 한 번에 구간 검색)
+    scores = np.fromiter((match['score'] for match in results), dtype=np.float64, count=len(results))
+    grade_indices = np.searchsorted(_EDGES, scores, side='right')
+    
+    for i, (match, grade_index) in enumerate(zip(results, grade_indices.tolist()), 1):
         score = match['score']
-        metadata = match.get('metadata', {})
-        
-        # 유사도 등급 판정
-        if score >= 0.8:
-            similarity_grade = "🟢 매우 높음"
-        elif score >= 0.6:
-            similarity_grade = "🟡 높음"
-        elif score >= 0.4:
-            similarity_grade = "🟠 보통"
-        else:
-            similarity_grade = "🔴 낮음"
+        metadata = match.get('metadata') or {}
+        category = metadata.get('category', '미분류')
+        question = metadata.get('question', 'N/A')
+        answer = metadata.get('answer', 'N/A')
         
         print(f"\n📋 결과 {i}:")
-        print(f"   🎯 유사도: {score:.4f} ({score*100:.1f}%) - {similarity_grade}")
-        print(f"   📂 카테고리: {metadata.get('category', '미분류')}")
-        print(f"   ❓ 질문: {metadata.get('question', 'N/A')}")
+        print(f"   🎯 유사도: {score:.4f} ({score*100:.1f}%) - {_GRADES[grade_index]}")
+        print(f"   📂 카테고리: {category}")
+        print(f"   ❓ 질문: {question}")
         
         # 답변 미리보기 (긴 답변은 자르기)
-        answer = metadata.get('answer', 'N/A')
         if len(answer) > ANSWER_PREVIEW_LENGTH:
             answer_preview = answer[:ANSWER_PREVIEW_LENGTH] + "..."
         else:
@@ -310,6 +658,15 @@ def main() -> None:
         # 2. 서비스 초기화
         index, openai_client = initialize_services()
         
+        # 2-1. 표준 입력이 파이프/파일이면 줄 단위 질문을 배치 검색
+        if not sys.stdin.isatty():
+            queries = [line.strip() for line in sys.stdin if line.strip()]
+            queries = [query for query in queries if validate_user_input(query)]
+            if queries:
+                search_questions_batch(queries, index, openai_client)
+            print(f"\n👋 배치 검색을 종료합니다. (총 {len(queries)}개 질문)")
+            return
+        
         # 3. 검색 예시 표시
         show_search_examples()
         
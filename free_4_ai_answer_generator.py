@@ -34,8 +34,8 @@ import gc                    # 가비지 컬렉션 (메모리 관리)
 import logging               # 로깅 시스템
 import logging.handlers      # 로깅 핸들러
 import os                    # 환경변수, 파일 시스템 작업
+import queue                 # 비동기 로깅 큐
 import sys                   # 시스템 관련 기능
-import tracemalloc           # 메모리 사용량 추적 (프로덕션 모니터링용)
 from datetime import datetime # 날짜 시간 처리
 import pytz                 # 시간대 처리
 from typing import Optional, Dict, Any  # 타입 힌팅
@@ -46,7 +46,12 @@ from flask import Flask  # 웹 서버 프레임워크
 # AI 및 데이터베이스 관련
 from pinecone import Pinecone  # 벡터 데이터베이스 (유사 답변 검색용)
 import openai                  # OpenAI API (GPT, 임베딩 생성)
-import pyodbc                  # MSSQL 데이터베이스 연결
+import httpx                   # OpenAI 공유 HTTP 연결 풀 (keep-alive)
+try:
+    import h2                  # HTTP/2 지원 (설치시 하나의 연결로 여러 요청 동시 전송)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # 환경설정 및 유틸리티
 from dotenv import load_dotenv  # .env 파일에서 환경변수 로드
@@ -55,6 +60,8 @@ from dotenv import load_dotenv  # .env 파일에서 환경변수 로드
 from src.main_optimized_ai_generator import OptimizedAIAnswerGenerator  # 메인 AI 생성기
 from src.services.sync_service import SyncService                       # 데이터 동기화 서비스
 from src.api.endpoints import create_endpoints                          # API 엔드포인트 생성 함수
+from src.utils.cached_index import CachedIndex                          # Pinecone 조회 캐시 래퍼
+from src.utils.mssql_pool import get_pool, close_all_pools, build_connection_string  # MSSQL 연결 풀
 
 # ==================================================
 # 2. 시스템 초기화 및 설정
@@ -63,10 +70,13 @@ from src.api.endpoints import create_endpoints                          # API 
 # - 메모리 추적: 프로덕션에서 메모리 누수 감지용
 # - Flask 앱 생성: 웹 서버의 핵심 객체
 
-# 메모리 추적 시작 (프로덕션 모니터링용)
-# 🔍 역할: 애플리케이션의 메모리 사용량을 실시간으로 추적
-# 장점: 메모리 누수 조기 발견, 성능 최적화 가능
-tracemalloc.start()
+# 메모리 추적 (메모리 누수 조사시에만 ENABLE_TRACEMALLOC=1로 활성화)
+# 🔍 역할: 모든 메모리 할당마다 호출 스택을 기록하여 누수 위치 추적
+# 주의: 프로세스 전체의 모든 할당에 기록 비용이 붙으므로 프로덕션 기본값은 비활성화
+#       (평상시 메모리 모니터링은 /generate_answer의 RSS 샘플링으로 충분)
+if os.getenv('ENABLE_TRACEMALLOC') == '1':
+    import tracemalloc
+    tracemalloc.start(25)  # 할당 위치당 최대 25프레임 기록
 
 # Flask 웹 애플리케이션 인스턴스 생성
 # 🌐 역할: HTTP 요청을 받고 응답하는 웹 서버의 핵심 객체
@@ -80,6 +90,10 @@ app = Flask(__name__)
 # - 파일 로깅: 영구 보관, 분석용 (AWS EC2 환경 특화)
 # - UTF-8 인코딩: 한글 로그 지원
 # - 로그 중복 방지: 파일 또는 콘솔 중 하나만 선택
+# - 비동기 기록: 요청 스레드는 큐에 레코드만 넣고, 파일/콘솔 쓰기는 전용 리스너 스레드에서 처리
+
+# 로그 큐 리스너 (setup_logging에서 시작, 종료시 cleanup_on_exit에서 남은 로그 기록 후 중지)
+log_listener: Optional[logging.handlers.QueueListener] = None
 
 def setup_logging():
     """
@@ -91,6 +105,8 @@ def setup_logging():
     - 이전 날짜 로그 파일들 자동 보관 (삭제하지 않음)
     - 시스템 타임존과 무관하게 정확한 KST 기준 동작
     """
+    global log_listener
+    
     # 모든 기존 핸들러 제거 (중복 방지)
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
@@ -223,9 +239,15 @@ def setup_logging():
         console_handler.setLevel(logging.DEBUG)
         console_handler.setFormatter(formatter)
         
-        # 루트 로거에 핸들러 추가
-        root_logger.addHandler(file_handler)
-        root_logger.addHandler(console_handler)
+        # 루트 로거에는 큐 핸들러만 추가하고 실제 파일/콘솔 쓰기는 리스너 스레드에서 수행
+        # (요청 처리 스레드가 디스크/콘솔 I/O를 기다리지 않음)
+        log_queue = queue.Queue(-1)  # 크기 제한 없음 (로그 유실 방지)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler,
+            respect_handler_level=True  # 핸들러별 로그 레벨 유지
+        )
+        log_listener.start()
         
         # ===================================================
         # 하위 로거 설정 (모든 모듈의 로그가 루트 로거로 전파되도록)
@@ -300,6 +322,14 @@ INDEX_NAME = "bible-app-support-1536-openai"  # Pinecone 인덱스명 (성경 
 EMBEDDING_DIMENSION = 1536  # 임베딩 벡터 차원 (text-embedding-3-small 모델의 차원)
 MAX_TEXT_LENGTH = 8000      # 임베딩 생성시 최대 텍스트 길이 (토큰 제한)
 
+# OpenAI HTTP 연결 풀 설정
+# 🔌 요청마다 TCP+TLS 핸드셰이크를 반복하지 않도록 연결을 유지하여 재사용
+HTTP_MAX_CONNECTIONS = 32         # 최대 동시 연결 수
+HTTP_MAX_KEEPALIVE = 16           # 유지할 유휴 연결 수
+HTTP_KEEPALIVE_EXPIRY = 60.0      # 유휴 연결 유지 시간 (초)
+HTTP_TIMEOUT = 30.0               # 요청 타임아웃 (초)
+HTTP_CONNECT_TIMEOUT = 5.0        # 연결 수립 타임아웃 (초) - 응답 없는 연결 시도는 빨리 실패 후 SDK 재시도
+
 # GPT 자연어 모델 설정
 # 🧠 GPT 모델 파라미터 설정
 GPT_MODEL = 'gpt-5-mini'         # OpenAI GPT 모델 (답변 생성용)
@@ -346,11 +376,22 @@ try:
     # Pinecone 벡터 데이터베이스 연결 설정
     # 🔍 역할: 고객 질문과 유사한 기존 답변을 빠르게 찾기 위한 벡터 검색 엔진
     pc = Pinecone(api_key=os.getenv('PINECONE_API_KEY'))
-    index = pc.Index(INDEX_NAME)  # 성경 앱 전용 인덱스에 연결
+    # 반복 질문 벡터 검색은 클라이언트 측 캐시로 재사용 (upsert/delete시 캐시 무효화)
+    index = CachedIndex(pc.Index(INDEX_NAME))  # 성경 앱 전용 인덱스에 연결
     
     # OpenAI API 클라이언트 초기화
     # 🧠 역할: GPT 모델 및 임베딩 생성을 위한 OpenAI 서비스 연결
-    openai_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    # 임베딩/GPT 호출이 하나의 keep-alive HTTP 클라이언트를 공유 (HTTP/2 가능시 연결 다중화)
+    http_client = httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+        ),
+        timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
+    )
+    openai_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'), http_client=http_client)
     
     # MSSQL 데이터베이스 연결 설정
     # 📊 역할: 기존 고객 문의 데이터를 가져와서 Pinecone과 동기화
@@ -362,16 +403,13 @@ try:
     }
 
     # MSSQL Server 연결 문자열 구성 (프로덕션급 설정)
-    # 🔐 보안 설정 포함: TrustServerCertificate, Connection Timeout
-    connection_string = (
-            f"DRIVER={{ODBC Driver 17 for SQL Server}};"  # SQL Server 드라이버
-            f"SERVER={mssql_config['server']},1433;"       # 서버:포트
-            f"DATABASE={mssql_config['database']};"        # 데이터베이스명
-            f"UID={mssql_config['username']};"             # 사용자명
-            f"PWD={mssql_config['password']};"             # 비밀번호
-            f"TrustServerCertificate=yes;"                 # SSL 인증서 신뢰 (Azure SQL용)
-            f"Connection Timeout=30;"                      # 연결 타임아웃 30초
-    )
+    # 🔐 ODBC Driver 18 + 암호화, TrustServerCertificate, 큰 TDS 패킷, Connection Timeout
+    # (MSSQLUpdater와 같은 함수로 구성하여 같은 연결 풀 공유)
+    connection_string = build_connection_string(**mssql_config)
+    
+    # MSSQL 연결 풀 예열 (첫 요청에서 연결 핸드셰이크 지연이 생기지 않도록 미리 연결)
+    # 🔌 동기화 서비스와 DB 업데이트가 같은 연결 문자열의 풀을 공유
+    get_pool(connection_string).warmup()
 
 except Exception as e:
     # 연결 실패시 상세한 에러 로깅 후 시스템 종료
@@ -424,13 +462,19 @@ sync_manager = SyncService(
 # 모든 엔드포인트를 모듈화된 endpoints.py에서 등록
 # 📁 등록되는 엔드포인트들:
 # - /generate_answer: AI 답변 생성 (핵심 기능)
+# - /generate_answer_stream: AI 답변 스트리밍 생성 (Server-Sent Events)
 # - /sync_to_pinecone: 데이터 동기화
+# - /sync_to_pinecone_batch: 데이터 일괄 동기화
 # - /health: 시스템 상태 확인
 # - /optimization/stats: 최적화 통계 조회
 # - /optimization/cache/clear: 캐시 지우기
 # - /optimization/config: 최적화 설정 변경
 app = create_endpoints(app, generator, sync_manager, index)
 
+# 초기화 완료 후 지금까지 생성된 장수명 객체(모듈, 클라이언트, 서비스 인스턴스)를 GC 추적 대상에서 제외
+# ⚡ 역할: 요청 처리 중 발생하는 세대별 GC가 이 객체들을 매번 다시 순회하지 않도록 하여 지연 시간 감소
+gc.freeze()
+
 
 # ==================================================
 # 8. 애플리케이션 종료 처리
@@ -460,11 +504,22 @@ def cleanup_on_exit():
         # 🧹 정리 작업: Redis 연결 해제, 배치 프로세서 중단, API 요청 정리
         if 'generator' in globals():
             generator.cleanup()
+        
+        # 공유 HTTP 연결 풀 닫기
+        if 'http_client' in globals():
+            http_client.close()
+        
+        # MSSQL 풀의 유휴 연결 닫기
+        close_all_pools()
             
         logging.info("정리 완료")
     except Exception as e:
         # 정리 과정에서 오류가 발생해도 시스템이 안전하게 종료되도록 예외 처리
         logging.error(f"종료 정리 중 오류: {e}")
+    finally:
+        # 큐에 남은 로그를 모두 기록한 뒤 로그 리스너 스레드 중지
+        if log_listener is not None:
+            log_listener.stop()
 
 
 # 시그널 핸들러 등록 (SIGTERM, SIGINT 등에 대응)
@@ -500,7 +555,9 @@ if __name__ == "__main__":
     print("")
     print("🔧 제공 서비스:")
     print("   ├── AI 답변 생성 (/generate_answer)")
+    print("   ├── AI 답변 스트리밍 생성 (/generate_answer_stream)")
     print("   ├── Pinecone 동기화 (/sync_to_pinecone)")
+    print("   ├── Pinecone 일괄 동기화 (/sync_to_pinecone_batch)")
     print("   ├── 헬스체크 (/health)")
     print("   ├── 최적화 통계 (/optimization/stats)")
     print("   ├── 캐시 관리 (/optimization/cache/clear)")
@@ -546,7 +603,9 @@ if __name__ == "__main__":
     print(f"🧠 API 관리자: {'✅ 정상' if api_health['openai_client_available'] else '❌ 오류'}")
     # logging.info(f"API 관리자 상태: {'정상' if api_health['openai_client_available'] else '오류'}")
 
-    # Flask 웹 서버 시작 (프로덕션 설정)
+    # Flask 웹 서버 시작 (로컬 실행용)
+    # 🚀 프로덕션에서는 Flask 개발 서버 대신 Gunicorn으로 실행:
+    #    gunicorn -c gunicorn.conf.py wsgi:app
     # 🌐 서버 설정 설명:
     # - host='0.0.0.0': 모든 네트워크 인터페이스에서 접속 허용 (외부 접근 가능)
     # - port=port: 환경변수로 설정된 포트 사용
@@ -39,12 +39,14 @@ class BibleInquiryProcessorFree:
             raise ValueError(f"다음 환경변수들이 설정되지 않았습니다: {', '.join(missing_vars)}")
         
         self.connection_string = (
-            f"DRIVER={{ODBC Driver 17 for SQL Server}};"
+            f"DRIVER={{{os.getenv('MSSQL_ODBC_DRIVER', 'ODBC Driver 18 for SQL Server')}}};"
             f"SERVER={server};"
             f"DATABASE={database};"
             f"UID={username};"
             f"PWD={password};"
+            f"Encrypt=yes;"
             f"TrustServerCertificate=yes;"
+            f"Packet Size=32767;"
         )
         self.conn = None
     
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Gunicorn 프로덕션 서버 설정
+- Flask 개발 서버(app.run) 대신 사용하는 WSGI 서버 설정
+- 실행: gunicorn -c gunicorn.conf.py wsgi:app (앱 인자 생략시 wsgi_app 설정 사용)
+"""
+
+import os
+
+# ===== 앱 진입점 =====
+wsgi_app = 'wsgi:app'
+
+# ===== 바인딩 주소 (기존 FLASK_PORT 환경변수 그대로 사용) =====
+bind = f"0.0.0.0:{int(os.getenv('FLASK_PORT', 8000))}"
+
+# ===== 워커 설정 =====
+# 워커 프로세스는 1개로 유지: 임베딩/검색/답변 캐시, 배치 프로세서, Redis 연결이 모두 프로세스 내부 상태이므로
+# 여러 프로세스로 나누면 캐시 적중률이 떨어지고 백그라운드 스레드가 중복 실행됨
+workers = int(os.getenv('GUNICORN_WORKERS', 1))
+# 요청 처리 시간 대부분이 OpenAI/Pinecone/MSSQL 네트워크 대기이므로 스레드 워커로 동시 처리
+# (pyodbc는 C 확장이라 gevent 협력형 전환이 되지 않으므로 gevent 대신 gthread 사용)
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 32))
+# 앱을 마스터에서 미리 로드하지 않고 워커마다 fork 이후 import
+# Pinecone/OpenAI HTTP 연결, MSSQL 연결 풀, Redis 연결, 배치 프로세서 스레드는 fork 후 공유하면 안 되므로
+# GUNICORN_WORKERS를 늘려도 각 워커가 자기 클라이언트를 새로 만들도록 유지
+preload_app = False
+
+# ===== 연결 설정 =====
+timeout = 120           # 동기 엔드포인트(/sync_to_pinecone 등)의 GPT + 임베딩 + upsert 시간 고려
+graceful_timeout = 30   # 종료시 진행 중인 요청 완료 대기 시간
+keepalive = 5           # 클라이언트 keep-alive 유지 시간 (초)
+
+# ===== 로깅 설정 (애플리케이션 로그는 기존 로깅 시스템 사용) =====
+accesslog = None
+errorlog = '-'
+loglevel = 'info'
@@ -5,18 +5,126 @@ API 엔드포인트 모듈
 """
 
 import gc
+import itertools
 import logging
-import tracemalloc
+import logging.handlers
+import queue
 import threading
 from datetime import datetime
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from src.utils.memory_manager import memory_cleanup
 from src.utils.mssql_updater import MSSQLUpdater
 import json
 import os
 import pytz
 
+try:
+    import orjson  # C 구현 JSON 직렬화 (미설치시 Flask 기본 json 사용)
+except ImportError:
+    orjson = None
+
+try:
+    import psutil  # 현재 프로세스 RSS 조회 (미설치시 resource 모듈의 최대 RSS 사용)
+except ImportError:
+    psutil = None
+    import resource
+
+# ===== 요청 메모리 점검 설정 =====
+MEMORY_CHECK_INTERVAL = 50          # N번째 요청마다 한 번만 메모리 사용량 확인
+MEMORY_GC_THRESHOLD_MB = 500        # 이 값 이상이면 가비지 컬렉션 실행
+_REQUEST_COUNTER = itertools.count()
+
+
+# ===== seq별 비동기 로그 핸들러 =====
+# 요청 스레드에서는 로그 레코드를 큐에 넣기만 하고, seq별 로그 파일 쓰기는 전용 리스너 스레드가 수행
+# (루트 로거의 메인 로그 파일과 같은 QueueHandler + QueueListener 구조)
+class SeqQueueHandler(logging.handlers.QueueHandler):
+
+    # SeqQueueHandler 초기화 (리스너 스레드 시작)
+    # Args:
+    #     file_handler: 실제로 seq별 로그 파일에 기록할 핸들러
+    def __init__(self, file_handler: logging.Handler):
+        super().__init__(queue.SimpleQueue())
+        self._listener = logging.handlers.QueueListener(
+            self.queue, file_handler,
+            respect_handler_level=True  # 파일 핸들러의 로그 레벨 유지
+        )
+        self._listener.start()
+        self._stopped = False
+
+    # 큐에 남은 로그를 모두 기록한 뒤 리스너 스레드와 파일 핸들러 종료 (여러 번 호출해도 안전)
+    def close(self):
+        self.acquire()
+        try:
+            if not self._stopped:
+                self._stopped = True
+                self._listener.stop()
+                for handler in self._listener.handlers:
+                    handler.close()
+        finally:
+            self.release()
+        super().close()
+
+
+# 현재 프로세스 메모리 사용량(MB) 조회 (시스템 콜 한 번, 할당 테이블 순회 없음)
+# Returns:
+#     float: RSS 메모리 (MB), psutil 미설치시 최대 RSS
+def _current_rss_mb() -> float:
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / 1024 / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KB 단위
+
+
+# 샘플링된 요청에서만 메모리를 확인하고 임계값 초과시 가비지 컬렉션 실행
+def _maybe_collect_garbage():
+    if next(_REQUEST_COUNTER) % MEMORY_CHECK_INTERVAL:
+        return
+    rss_mb = _current_rss_mb()
+    logging.info(f"메모리 사용량: {rss_mb:.1f}MB")
+    if rss_mb >= MEMORY_GC_THRESHOLD_MB:
+        collected = gc.collect()
+        logging.info(f"메모리 임계값 초과 ({MEMORY_GC_THRESHOLD_MB}MB) - 가비지 컬렉션 실행: {collected}개 객체 정리")
+
+# ===== orjson 기반 JSON 직렬화 =====
+# 정수 키(dict[int, ...])와 numpy 배열/스칼라도 그대로 직렬화
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson is not None else 0
+
+
+# 객체를 UTF-8 JSON 문자열로 직렬화 (SSE 이벤트 등 Response 외부에서 사용)
+# Args:
+#     obj: 직렬화할 객체
+# Returns:
+#     str: JSON 문자열 (한글은 이스케이프하지 않음)
+def _json_dumps(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=ORJSON_OPTIONS).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+
+# jsonify / request.get_json 이 orjson을 사용하도록 하는 Flask JSON 제공자
+# - 응답 본문은 str을 거치지 않고 orjson이 만든 UTF-8 bytes를 그대로 사용
+# - 날짜/Decimal/UUID/dataclass 등은 Flask 기본 변환(default) 재사용
+# - json.dumps 옵션(indent 등)이 지정된 호출은 Flask 기본 구현으로 처리
+class OrjsonJSONProvider(DefaultJSONProvider):
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS),
+            mimetype=self.mimetype
+        )
+
 # API 엔드포인트 생성
 def create_endpoints(app: Flask, generator, sync_manager, index):
     """Flask 앱에 API 엔드포인트를 등록"""
@@ -24,6 +132,10 @@ def create_endpoints(app: Flask, generator, sync_manager, index):
     # CORS 설정 - 웹 브라우저의 교차 출처 요청 허용
     CORS(app)
 
+    # JSON 직렬화/역직렬화를 orjson으로 처리 (설치된 경우)
+    if orjson is not None:
+        app.json = OrjsonJSONProvider(app)
+
     # MSSQL 업데이터 초기화 (전역으로 한 번만 생성)
     mssql_updater = MSSQLUpdater()
 
@@ -33,8 +145,14 @@ def create_endpoints(app: Flask, generator, sync_manager, index):
     else:
         logging.info("✅ MSSQL 연결 테스트 성공 - DB 업데이트 기능 활성화")
 
+    # seq별 로그 핸들러 제거 (요청이 끝난 핸들러가 루트 로거에 계속 쌓여 모든 로그를 중복 기록하지 않도록)
+    # - 큐에 남은 로그를 파일에 모두 기록한 뒤 리스너 스레드와 파일을 닫음
+    def _remove_seq_handler(seq_handler: logging.Handler):
+        logging.getLogger().removeHandler(seq_handler)
+        seq_handler.close()
+
     # ============================== 백그라운드 작업 함수 ==============================
-    def _process_answer_in_background(seq: int, question: str, lang: str):
+    def _process_answer_in_background(seq: int, question: str, lang: str, seq_handler: logging.Handler):
         """
         백그라운드에서 AI 답변 생성 및 DB 업데이트
         - 기존의 모든 로깅 및 메모리 관리 기능 포함
@@ -43,6 +161,7 @@ def create_endpoints(app: Flask, generator, sync_manager, index):
             seq: 문의 시퀀스 번호
             question: 사용자 질문
             lang: 언어 코드
+            seq_handler: 이 요청의 seq별 로그 핸들러 (처리 완료 후 제거)
         """
         try:
             logging.info(f"🔄 백그라운드 처리 시작 - SEQ: {seq}")
@@ -74,6 +193,8 @@ def create_endpoints(app: Flask, generator, sync_manager, index):
             
         except Exception as e:
             logging.error(f"❌ 백그라운드 처리 중 오류 - SEQ: {seq}, 오류: {str(e)}")
+        finally:
+            _remove_seq_handler(seq_handler)
     
     # ===== 1. AI 답변 생성 API 엔드포인트 =====
     # ☆ 1. 사용자 질문 입력 (/generate_answer 엔드포인트)
@@ -89,78 +210,133 @@ def create_endpoints(app: Flask, generator, sync_manager, index):
         3. 프론트엔드는 응답을 기다리지 않고 즉시 다음 작업 진행 가능
         """
         try:
-            # 메모리 자동 정리 컨텍스트 시작
-            with memory_cleanup():
-                # 1단계: 요청 데이터 파싱 및 검증
-                data = request.get_json()
-                seq = data.get('seq', 0)                    # 시퀀스 ID (기본값: 0)
-                question = data.get('question', '')         # 사용자 질문
-                lang = data.get('lang', 'auto')             # 언어 설정 (자동 감지) 프론트엔드에서 받을 수 있음, 기본값 'auto'
-                
-                # seq별 로그 핸들러 추가
-                kst = pytz.timezone('Asia/Seoul')
-                current_date = datetime.now(kst).strftime('%Y%m%d')
-                log_dir = '/home/ec2-user/python/logs'
-                seq_log_file = f'{log_dir}/log_{seq}_{current_date}.log'
-
-                seq_handler = logging.FileHandler(seq_log_file, encoding='utf-8')
-                seq_handler.setLevel(logging.INFO)
-                seq_formatter = logging.Formatter(
-                    '%(asctime)s - %(levelname)s - %(name)s - %(filename)s:%(lineno)d - %(message)s',
-                    datefmt='%Y-%m-%d %H:%M:%S'
-                )
-                seq_handler.setFormatter(seq_formatter)
-
-                root_logger = logging.getLogger()
-                root_logger.addHandler(seq_handler)
-                
-                # 🔍 추가 로그
-                logging.info(f"================================= API 요청 수신 (POST /generate_answer) ====================================")
-                logging.info(f"SEQ: {seq}")
-                logging.info(f"질문: {question}")
-                logging.info(f"언어: {lang}")
-                logging.info(f"사용된 generator 타입: {type(generator).__name__}")
-
-                # 2단계: 필수 데이터 검증
-                if not seq or not question:
-                    return jsonify({
-                        "success": False, 
-                        "error": "seq와 question이 필요합니다."
-                    }), 400
-
-                # 3단계: AI 답변 생성 처리 (핵심 로직)
-                # - Pinecone에서 유사 구절 검색
-                # - 백그라운드 스레드에서 실행
-                # daemon=True로 설정하여 메인 프로그램 종료시 자동으로 종료되도록 함
-                background_thread = threading.Thread(
-                    target=_process_answer_in_background,
-                    args=(seq, question, lang),
-                    daemon=True,
-                    name=f"AIAnswerThread-{seq}"  # 스레드 이름 설정 (디버깅용)
-                )
-                background_thread.start()
-
-                # 4단계: 즉시 응답 반환
-                logging.info(f"✅ 비동기 작업 시작 - SEQ: {seq}, 질문: '{question[:50]}...'")
-                logging.info(f"백그라운드 스레드 시작: {background_thread.name}")
-                logging.info(f"==================================== API 응답 반환 (202 Accepted) ====================================")
-                
-                response = jsonify({
-                    "success": True,
-                    "message": "답변 생성 작업이 시작되었습니다. 백그라운드에서 처리 중입니다.",
-                    "seq": seq,
-                    "status": "processing",
-                    "thread_name": background_thread.name
-                })
-                response.headers['Content-Type'] = 'application/json; charset=utf-8'
-                
-                return response, 202  # HTTP 202 Accepted (비동기 처리 시작)
+            # 메모리 점검 (매 요청 전체 GC 대신 샘플링된 요청에서만 확인)
+            _maybe_collect_garbage()
+            
+            # 1단계: 요청 데이터 파싱 및 검증
+            data = request.get_json()
+            seq = data.get('seq', 0)                    # 시퀀스 ID (기본값: 0)
+            question = data.get('question', '')         # 사용자 질문
+            lang = data.get('lang', 'auto')             # 언어 설정 (자동 감지) 프론트엔드에서 받을 수 있음, 기본값 'auto'
+            
+            # seq별 로그 핸들러 추가
+            kst = pytz.timezone('Asia/Seoul')
+            current_date = datetime.now(kst).strftime('%Y%m%d')
+            log_dir = '/home/ec2-user/python/logs'
+            seq_log_file = f'{log_dir}/log_{seq}_{current_date}.log'
+
+            seq_file_handler = logging.FileHandler(seq_log_file, encoding='utf-8')
+            seq_file_handler.setLevel(logging.INFO)
+            seq_formatter = logging.Formatter(
+                '%(asctime)s - %(levelname)s - %(name)s - %(filename)s:%(lineno)d - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+            seq_file_handler.setFormatter(seq_formatter)
+
+            # 파일 쓰기는 리스너 스레드에서 수행 (요청 처리 스레드가 디스크 I/O를 기다리지 않음)
+            seq_handler = SeqQueueHandler(seq_file_handler)
+
+            root_logger = logging.getLogger()
+            root_logger.addHandler(seq_handler)
+            
+            # 🔍 추가 로그
+            logging.info(f"================================= API 요청 수신 (POST /generate_answer) ====================================")
+            logging.info(f"SEQ: {seq}")
+            logging.info(f"질문: {question}")
+            logging.info(f"언어: {lang}")
+            logging.info(f"사용된 generator 타입: {type(generator).__name__}")
+
+            # 2단계: 필수 데이터 검증
+            if not seq or not question:
+                _remove_seq_handler(seq_handler)
+                return jsonify({
+                    "success": False, 
+                    "error": "seq와 question이 필요합니다."
+                }), 400
+
+            # 3단계: AI 답변 생성 처리 (핵심 로직)
+            # - Pinecone에서 유사 구절 검색
+            # - 백그라운드 스레드에서 실행
+            # daemon=True로 설정하여 메인 프로그램 종료시 자동으로 종료되도록 함
+            background_thread = threading.Thread(
+                target=_process_answer_in_background,
+                args=(seq, question, lang, seq_handler),
+                daemon=True,
+                name=f"AIAnswerThread-{seq}"  # 스레드 이름 설정 (디버깅용)
+            )
+            background_thread.start()
+
+            # 4단계: 즉시 응답 반환
+            logging.info(f"✅ 비동기 작업 시작 - SEQ: {seq}, 질문: '{question[:50]}...'")
+            logging.info(f"백그라운드 스레드 시작: {background_thread.name}")
+            logging.info(f"==================================== API 응답 반환 (202 Accepted) ====================================")
+            
+            response = jsonify({
+                "success": True,
+                "message": "답변 생성 작업이 시작되었습니다. 백그라운드에서 처리 중입니다.",
+                "seq": seq,
+                "status": "processing",
+                "thread_name": background_thread.name
+            })
+            response.headers['Content-Type'] = 'application/json; charset=utf-8'
+            
+            return response, 202  # HTTP 202 Accepted (비동기 처리 시작)
             
         except Exception as e:
             # 예외 발생시 로깅 및 에러 응답 반환
             logging.error(f"API 호출 오류: {str(e)}")
             return jsonify({"success": False, "error": str(e)}), 500
 
+    # ===== 1-1. AI 답변 스트리밍 API 엔드포인트 (Server-Sent Events) =====
+    # 답변을 직접 받아 보여주는 클라이언트용: GPT 생성 조각을 도착하는 대로 전달
+    # (ASP 연동은 기존 /generate_answer 비동기 처리 + DB 저장 방식 그대로 사용)
+    @app.route('/generate_answer_stream', methods=['POST'])
+    def generate_answer_stream():
+        """
+        AI 답변 스트리밍 API 엔드포인트
+        
+        이벤트 형식 (text/event-stream):
+        - event: delta → data: {"content": 생성 조각}
+        - event: done  → data: /generate_answer 처리 결과와 동일한 JSON (최종 HTML 답변 포함)
+        """
+        try:
+            # 메모리 점검 (매 요청 전체 GC 대신 샘플링된 요청에서만 확인)
+            _maybe_collect_garbage()
+            
+            # 1단계: 요청 데이터 파싱 및 검증
+            data = request.get_json()
+            seq = data.get('seq', 0)                    # 시퀀스 ID (기본값: 0)
+            question = data.get('question', '')         # 사용자 질문
+            lang = data.get('lang', 'auto')             # 언어 설정 (기본값 'auto')
+            
+            logging.info(f"API 요청 수신 (POST /generate_answer_stream): SEQ={seq}, 질문={question}")
+            
+            if not seq or not question:
+                return jsonify({
+                    "success": False, 
+                    "error": "seq와 question이 필요합니다."
+                }), 400
+            
+            # 2단계: 처리 이벤트를 SSE 형식으로 변환하여 전달
+            def event_stream():
+                for event, payload in generator.process_stream(seq, question, lang):
+                    if event == 'delta':
+                        payload = {"content": payload}
+                    yield f"event: {event}\ndata: {_json_dumps(payload)}\n\n"
+            
+            return Response(
+                stream_with_context(event_stream()),
+                mimetype='text/event-stream',
+                headers={
+                    'Cache-Control': 'no-cache',
+                    'X-Accel-Buffering': 'no'   # 프록시(nginx) 버퍼링 비활성화
+                }
+            )
+            
+        except Exception as e:
+            logging.error(f"스트리밍 API 호출 오류: {str(e)}")
+            return jsonify({"success": False, "error": str(e)}), 500
+
     # ===== 2. Pinecone 동기화 API 엔드포인트 =====
     @app.route('/sync_to_pinecone', methods=['POST'])
     def sync_to_pinecone():
@@ -202,6 +378,44 @@ def create_endpoints(app: Flask, generator, sync_manager, index):
             logging.error(f"Pinecone 동기화 API 오류: {str(e)}")
             return jsonify({"success": False, "error": str(e)}), 500
 
+    # ===== 2-1. Pinecone 일괄 동기화 API 엔드포인트 =====
+    @app.route('/sync_to_pinecone_batch', methods=['POST'])
+    def sync_to_pinecone_batch():
+        """여러 MSSQL 문의를 한 번에 Pinecone에 동기화하는 API 엔드포인트"""
+        try:
+            # 1단계: 요청 데이터 파싱
+            data = request.get_json()
+            seqs = data.get('seqs')                         # 동기화할 데이터의 시퀀스 ID 리스트
+
+            logging.info(f"일괄 동기화 요청 수신: {len(seqs) if isinstance(seqs, list) else 0}개")
+            
+            # 2단계: 필수 파라미터 검증
+            if not seqs or not isinstance(seqs, list):
+                logging.warning("seqs 누락")
+                return jsonify({"success": False, "error": "seqs 리스트가 필요합니다"}), 400
+            
+            # 3단계: 데이터 타입 변환 (문자열 -> 정수)
+            seqs = [int(seq) for seq in seqs]
+            
+            # 4단계: Pinecone 일괄 동기화 실행
+            # - MSSQL 1회 조회, 임베딩 1회 일괄 생성, Pinecone 1회 업로드
+            result = sync_manager.sync_batch_to_pinecone(seqs)
+
+            logging.info(f"일괄 동기화 결과: {result}")
+            
+            # 5단계: 결과에 따른 HTTP 상태 코드 설정
+            status_code = 200 if result["success"] else 500
+            return jsonify(result), status_code
+            
+        except ValueError as e:
+            # 데이터 타입 변환 오류 처리
+            logging.error(f"잘못된 seqs 값: {str(e)}")
+            return jsonify({"success": False, "error": f"잘못된 seqs 값: {str(e)}"}), 400
+        except Exception as e:
+            # 기타 예외 처리
+            logging.error(f"Pinecone 일괄 동기화 API 오류: {str(e)}")
+            return jsonify({"success": False, "error": str(e)}), 500
+
     # ===== 3. 시스템 상태 확인 API 엔드포인트 =====
     @app.route('/health', methods=['GET'])
     def health_check():
@@ -295,6 +509,7 @@ def create_endpoints(app: Flask, generator, sync_manager, index):
                 generator.cache_manager.clear_cache_by_prefix('typo')         # 오타 수정 캐시
                 generator.cache_manager.clear_cache_by_prefix('search')       # 검색 결과 캐시
                 generator.search_service.clear_caches()                       # 검색 서비스 캐시
+                generator.clear_response_cache()                              # 답변 시맨틱 캐시
                 generator.api_manager.clear_recent_requests()                 # API 요청 기록
                 cleared_count = "all"
             else:
@@ -8,20 +8,31 @@
 import re
 import logging
 import time
-from memory_profiler import profile
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import numpy as np
-from langdetect import detect, LangDetectException
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# 줄 단위 메모리 프로파일링 (ENABLE_MEMORY_PROFILE=1일 때만 적용)
+# memory_profiler는 실행되는 모든 줄마다 RSS를 조회하므로 프로덕션에서는 원본 함수를 그대로 사용
+if os.getenv('ENABLE_MEMORY_PROFILE') == '1':
+    from memory_profiler import profile
+else:
+    def profile(func):
+        return func
 
 # 기존 모듈들
 from src.utils.text_preprocessor import TextPreprocessor
-from src.utils.memory_manager import memory_cleanup
 from src.models.answer_generator import AnswerGenerator
 from src.services.quality_validator import QualityValidator
-from src.services.sync_service import SyncService
+from src.services.sync_service import SyncService, register_sync_listener
 from src.utils.unified_text_analyzer import UnifiedTextAnalyzer
 from src.services.ai_answer_generator import AIAnswerGenerator
+from src.models.embedding_generator import EmbeddingGenerator
+from src.utils.semantic_query_cache import SemanticQueryCache
 
 # 최적화 모듈들
 from src.utils.cache_manager import CacheManager
@@ -32,6 +43,82 @@ from src.utils.intelligent_api_manager import (
 # from src.services.optimized_search_service import OptimizedSearchService
 from src.services.enhanced_search_service import EnhancedPineconeSearchService
 
+# ===== 프로세스 공용 답변 시맨틱 캐시 =====
+# 전처리된 질문 임베딩이 이전 질문과 충분히 유사하면 분석/검색/GPT 생성 없이 최종 답변 재사용
+RESPONSE_CACHE_THRESHOLD = 0.95     # 같은 질문으로 판단할 코사인 유사도
+RESPONSE_CACHE_SIZE = 5000          # 최대 캐시 항목 수 (초과시 LRU 제거)
+RESPONSE_CACHE_TTL = 24 * 3600      # 답변 유효 시간 (초)
+_response_cache = SemanticQueryCache(
+    max_size=RESPONSE_CACHE_SIZE,
+    threshold=RESPONSE_CACHE_THRESHOLD,
+    result_ttl=RESPONSE_CACHE_TTL
+)
+_response_cache_lock = threading.Lock()   # 멀티스레드 요청 간 캐시 보호
+_response_cache_generation = 0            # 캐시를 비울 때마다 증가 (비우기 전에 시작한 요청의 답변 저장 방지)
+
+
+# 답변 캐시를 비우고 세대 번호를 올리는 함수
+# Returns:
+#     int: 삭제된 캐시 항목 수
+def _clear_response_cache() -> int:
+    global _response_cache_generation
+    with _response_cache_lock:
+        cleared = len(_response_cache)
+        _response_cache.clear()
+        _response_cache_generation += 1
+    return cleared
+
+
+# Pinecone 데이터가 변경되면 이전 검색 결과 기반 답변을 모두 무효화
+# Args:
+#     seq: 동기화된 문의의 시퀀스 번호
+#     mode: 동기화 모드 ('upsert' 또는 'delete')
+def _invalidate_response_cache(seq: int, mode: str):
+    cleared = _clear_response_cache()
+    logging.info(f"답변 캐시 무효화: seq={seq}, mode={mode}, 삭제 {cleared}개")
+
+
+register_sync_listener(_invalidate_response_cache)
+
+# ===== 검색 선행 실행 (통합 분석 GPT 호출과 Pinecone 검색을 겹쳐서 실행) =====
+# 오타 수정 결과가 원문과 같으면 (대부분의 질문) 미리 실행한 검색 결과를 그대로 사용
+SEARCH_PREFETCH_WORKERS = 16        # 선행 검색 스레드 수 (Gunicorn 스레드 수의 절반)
+_search_prefetch_executor = ThreadPoolExecutor(
+    max_workers=SEARCH_PREFETCH_WORKERS,
+    thread_name_prefix='search-prefetch'
+)
+
+# 답변 특수문자 정리용 변환 테이블 (둥근 따옴표 → 일반 따옴표, 한 번의 스캔으로 처리)
+_QUOTE_FIX_TABLE = str.maketrans({
+    '\u201c': '"', '\u201d': '"',     # “ ”
+    '\u2018': "'", '\u2019': "'",     # ‘ ’
+})
+
+# 검색된 최상위 참고답변을 GPT 생성 없이 그대로 사용할 유사도 기준 (환경변수로 조정 가능)
+DIRECT_USE_THRESHOLD = float(os.getenv('DIRECT_USE_THRESHOLD', 0.88))
+
+# 단락 분리 트리거 키워드들 (문장이 이 키워드로 시작하면 새 단락)
+_KO_PARAGRAPH_TRIGGERS = (
+    '안녕하세요', '감사합니다', '감사드립니다', '바이블 애플을',
+    '따라서', '그러므로', '또한', '그리고', '또는', '하지만', '그런데',
+    '현재', '지금', '만약', '혹시', '성도님', '고객님',
+    '기능', '스피커', '버튼', '메뉴', '화면', '설정'
+)
+_EN_PARAGRAPH_TRIGGERS = (
+    'Hello', 'Thank', 'Therefore', 'However', 'Additionally',
+    'Currently', 'If', 'Please', 'Feature', 'Function'
+)
+
+# 트리거 목록을 하나의 접두어 정규식으로 컴파일 (문장당 한 번의 매칭으로 판별)
+_KO_TRIGGER_RE = re.compile('|'.join(re.escape(trigger) for trigger in _KO_PARAGRAPH_TRIGGERS))
+_EN_TRIGGER_RE = re.compile('|'.join(re.escape(trigger) for trigger in _EN_PARAGRAPH_TRIGGERS))
+
+# 문장 분리 (마침표, 느낌표, 물음표 뒤 공백 기준)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# HTML 단락 포맷팅 결과 캐시 크기 (같은 답변 텍스트는 재포맷팅 없이 재사용)
+HTML_FORMAT_CACHE_SIZE = 2048
+
 class OptimizedAIAnswerGenerator:
     """최적화된 AI 답변 생성 클래스 - 기존 인터페이스 완전 호환"""
 
@@ -48,6 +135,10 @@ class OptimizedAIAnswerGenerator:
         
         # 2단계. 유틸리티 컴포넌트 생성
         self.text_processor = TextPreprocessor()
+        # 답변 텍스트 → HTML 단락 캐시 (입력이 같으면 결과가 같은 순수 텍스트 변환)
+        self._format_html_cached = lru_cache(maxsize=HTML_FORMAT_CACHE_SIZE)(
+            self._format_answer_with_html_paragraphs
+        )
         
         # 3단계. 최적화 시스템 초기화
         self._initialize_optimization_system(redis_config) # ← REDIS_CONFIG 사용
@@ -56,6 +147,7 @@ class OptimizedAIAnswerGenerator:
         self.unified_analyzer = UnifiedTextAnalyzer(openai_client)
         self.answer_generator = AnswerGenerator(openai_client)
         self.ai_answer_generator = AIAnswerGenerator(openai_client)
+        self.embedding_generator = EmbeddingGenerator(openai_client)  # 답변 캐시 조회용 질문 임베딩
         
         # 5단계: 서비스 컴포넌트 초기화 (최적화 적용)
         # self.search_service = OptimizedSearchService(pinecone_index, self.api_manager)
@@ -82,7 +174,9 @@ class OptimizedAIAnswerGenerator:
             'total_requests': 0, # 총 요청 수
             'cache_hit_rate': 0.0, # 캐시 히트율
             'avg_processing_time': 0.0, # 평균 처리 시간
-            'api_calls_saved': 0 # 절약된 API 호출 수
+            'api_calls_saved': 0, # 절약된 API 호출 수
+            # 답변 출처별 횟수 (DIRECT_USE_THRESHOLD 조정용)
+            'answer_sources': {'cache': 0, 'direct_use': 0, 'gpt': 0, 'fallback': 0}
         }
         
         # logging.info("최적화된 AI 답변 생성기 초기화 완료")
@@ -166,8 +260,8 @@ class OptimizedAIAnswerGenerator:
         return self.answer_generator.remove_greeting_and_closing(text, lang)
 
     def format_answer_with_html_paragraphs(self, text: str, lang: str = 'ko') -> str:
-        """HTML 단락 포맷팅 (기존 호환)"""
-        return self._format_answer_with_html_paragraphs(text, lang)
+        """HTML 단락 포맷팅 (기존 호환, 결과 캐시 사용)"""
+        return self._format_html_cached(text, lang)
 
     def _format_answer_with_html_paragraphs(self, text: str, lang: str = 'ko') -> str:
         """답변 텍스트를 HTML 단락 형식으로 포맷팅하는 메서드"""
@@ -177,24 +271,13 @@ class OptimizedAIAnswerGenerator:
         text = self.text_processor.remove_old_app_name(text)
 
         # 문장을 마침표, 느낌표, 물음표로 분리
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
 
         paragraphs = []
         current_paragraph = []
 
-        # 단락 분리 트리거 키워드들
-        if lang == 'ko':
-            paragraph_triggers = [
-                '안녕하세요', '감사합니다', '감사드립니다', '바이블 애플을',
-                '따라서', '그러므로', '또한', '그리고', '또는', '하지만', '그런데',
-                '현재', '지금', '만약', '혹시', '성도님', '고객님',
-                '기능', '스피커', '버튼', '메뉴', '화면', '설정'
-            ]
-        else:  # 영어
-            paragraph_triggers = [
-                'Hello', 'Thank', 'Therefore', 'However', 'Additionally',
-                'Currently', 'If', 'Please', 'Feature', 'Function'
-            ]
+        # 단락 분리 트리거 정규식 선택
+        trigger_re = _KO_TRIGGER_RE if lang == 'ko' else _EN_TRIGGER_RE
 
         for i, sentence in enumerate(sentences):
             sentence = sentence.strip()
@@ -209,13 +292,8 @@ class OptimizedAIAnswerGenerator:
                 paragraphs.append(sentence)
                 continue
 
-            should_break = False
-
             # 트리거 키워드로 시작하는 문장은 새 단락
-            for trigger in paragraph_triggers:
-                if sentence.startswith(trigger):
-                    should_break = True
-                    break
+            should_break = trigger_re.match(sentence) is not None
 
             # 현재 단락에 2개 이상 문장이 있으면 새 단락
             if current_paragraph and len(current_paragraph) >= 2:
@@ -253,140 +331,310 @@ class OptimizedAIAnswerGenerator:
         start_time = time.time() # 현재 시간을 타임스탬프로 기록하는 코드
         
         try:
-            with memory_cleanup():
-
-                # 성능 통계 업데이트
-                self.performance_stats['total_requests'] += 1
-                
-                # 1단계: POST 요청 수신 로그
-                logging.info(f"1. POST /generate_answer: seq={seq}, question='{question}', lang='{lang}'")
-                
-                # 2단계: 전처리 (HTML 태그 제거, 앱 이름 통일, 공백 정규화)
-                preprocess_start = time.time()
-                processed_question = self.preprocess_text(question)
-                preprocess_time = time.time() - preprocess_start
-                logging.info(f"2. HTML 태그 제거, 앱 이름 통일, 공백 정규화 전처리: '{question}' → '{processed_question}', 시간={preprocess_time:.3f}s")
-
-                # 3단계: 통합 분석 (오타 수정 + 의도 분석) API 호출
-                analysis_start = time.time()    
-                corrected_text, intent_analysis = self.unified_analyzer.analyze_and_correct(processed_question)
-                core_intent = intent_analysis.get('core_intent', 'general_inquiry')
-                processed_question = corrected_text # corrected_text를 쿼리로 사용
-                semantic_keywords = intent_analysis.get('semantic_keywords', [])
-                result = ', '.join(semantic_keywords)
-
-                analysis_time = time.time() - analysis_start 
-                logging.info(f"3. 통합 분석 완료: corrected='{corrected_text}', intent={{'core_intent': '{intent_analysis.get('core_intent', 'N/A')}'}}, 시간={analysis_time:.2f}s")
-                    
-                if not processed_question:
-                    return {"success": False, "error": "질문이 비어있습니다."}
-
-                # 4단계: 언어 한국어로 고정
-                lang = 'ko'
-                search_start = time.time()
-                
-                # 5단계: 의도 기반 검색 (Pinecone 검색) API 호출
-                similar_answers = self.search_service.search_by_enhanced_intent(
-                    intent_analysis=intent_analysis,  # 전체 의도 분석 결과 전달
-                    original_query=corrected_text, # corrected_text를 쿼리로 사용 (원래 이거였음)
-                    # original_query=core_intent,
-                    # original_query= result,
-                    lang=lang,
-                    top_k=3  # 상위 3개 결과만 반환
+            # 1~5단계: 전처리, 답변 캐시 조회, 통합 분석, 검색, 답변 방식 결정
+            state = self._prepare_answer(seq, question, lang, start_time)
+            if 'result' in state:
+                return state['result']
+
+            if state['answer_source'] == 'gpt':
+                # 6단계: AI 답변 생성 (AIAnswerGenerator 사용)
+                generation_start = time.time()
+                logging.info("6. AI 답변 생성 시작")
+            
+                ai_answer = self.ai_answer_generator.generate_answer(
+                    corrected_text=state['corrected_text'],
+                    intent_analysis=state['intent_analysis'],
+                    similar_answers=state['similar_answers'],
+                    lang=state['lang']
                 )
-                
-                search_time = time.time() - search_start
-                logging.info(f"검색 완료: {len(similar_answers)}개 결과, 시간={search_time:.2f}s")
-
-                # 검색 결과 상세 로깅 (디버깅용)
-                for i, result in enumerate(similar_answers[:3], 1):
-                    logging.info(
-                        f"검색결과 상세 #{i}: "
-                        f"score={result.get('score', 0):.4f}, "
-                        f"category='{result.get('category', '')}', "
-                        f"question='{result.get('question', '')}', "
-                        f"answer_length={len(result.get('answer', ''))}자"
-                    )
-
-                # 검색 결과 확인 - 결과가 없거나 유사도가 0.4 이하면 폴백 답변 사용
-                if not similar_answers:
-                    logging.warning(f"⚠️ 검색 결과 없음 - 폴백 답변 사용")
-                    
-                    # 폴백 답변 사용
-                    generation_start = time.time()
-                    ai_answer = self.ai_answer_generator._get_fallback_answer()
-                    generation_time = time.time() - generation_start
-                    logging.info(f"폴백 답변 생성 완료: 길이={len(ai_answer)}자, 시간={generation_time:.2f}s")
-                else:
-                    # 최고 유사도 점수 확인
-                    max_score = max(result.get('score', 0) for result in similar_answers)
-                    
-                    # 유사도 임계값 체크
-                    SIMILARITY_THRESHOLD = 0.4
-
-                    if max_score <= SIMILARITY_THRESHOLD:
-                        logging.warning(
-                            f"⚠️ 최고 유사도 {max_score:.4f} <= {SIMILARITY_THRESHOLD} - 폴백 답변 사용"
-                        )
-                        logging.info(
-                            f"검색 결과 요약: "
-                            f"총 {len(similar_answers)}개 결과, "
-                            f"최고 점수={max_score:.4f}, "
-                            f"최저 점수={min(r.get('score', 0) for r in similar_answers):.4f}"
-                        )
-                        
-                        # 폴백 답변 사용
-                        generation_start = time.time()
-                        ai_answer = self.ai_answer_generator._get_fallback_answer()
-                        generation_time = time.time() - generation_start
-                        logging.info(f"폴백 답변 생성 완료: 길이={len(ai_answer)}자, 시간={generation_time:.2f}s")
-                    else:
-                        # 유사도가 충분히 높은 경우 AI 답변 생성
-                        logging.info(
-                            f"✅ 유사도 조건 충족 (최고 점수={max_score:.4f} > {SIMILARITY_THRESHOLD}) - AI 답변 생성 진행"
-                        )
-                    
-                    # 6단계: AI 답변 생성 (AIAnswerGenerator 사용)
-                    generation_start = time.time()
-                    logging.info("6. AI 답변 생성 시작")
-                    
-                    ai_answer = self.ai_answer_generator.generate_answer(
-                        corrected_text=corrected_text,
-                        intent_analysis=intent_analysis,
-                        similar_answers=similar_answers,
-                        lang=lang
-                    )
-                    
-                    generation_time = time.time() - generation_start
-                    logging.info(f"AI 답변 생성 완료: 길이={len(ai_answer)}자, 시간={generation_time:.2f}s")
-
-                # 특수문자 정리
-                ai_answer = ai_answer.replace('"', '"').replace('"', '"')
-                ai_answer = ai_answer.replace(''', "'").replace(''', "'")
-
-                # 성능 통계 업데이트
-                total_time = time.time() - start_time
-                self._update_performance_stats(total_time)
-
-                result = {
-                    "success": True,
-                    "answer": ai_answer,
-                    "similar_count": len(similar_answers),
-                    "embedding_model": "text-embedding-3-small",
-                    "generation_model": "gpt-5-mini",
-                    "detected_language": lang,
-                    "processing_time": total_time,
-                    "optimization_stats": self.get_optimization_summary()
-                }
+                self._set_generated_answer(state, ai_answer)
+            
+                generation_time = time.time() - generation_start
+                logging.info(f"AI 답변 생성 완료: 길이={len(state['ai_answer'])}자, 시간={generation_time:.2f}s")
 
-                logging.info(f"처리 완료 - SEQ: {seq}, 총 시간: {total_time:.2f}s")
-                logging.info(f"답변: {ai_answer}")
-                return result
+            return self._finalize_answer(seq, state, start_time)
 
         except Exception as e:
             logging.error(f"처리 중 오류 - SEQ: {seq}, 오류: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    # 스트리밍 답변 생성 메서드 - GPT 생성 조각을 도착하는 대로 전달
+    # - 캐시/직접 사용/폴백 답변은 생성 과정이 없으므로 ('done', 결과)만 전달
+    # Args:
+    #     seq: 문의 시퀀스 번호
+    #     question: 사용자 질문
+    #     lang: 언어 코드
+    # Returns:
+    #     Iterator[Tuple[str, object]]: ('delta', 답변 조각) 이벤트들과 마지막 ('done', process와 동일한 결과 딕셔너리)
+    def process_stream(self, seq: int, question: str, lang: str) -> Iterator[Tuple[str, object]]:
+        start_time = time.time()
+        
+        try:
+            # 1~5단계: 전처리, 답변 캐시 조회, 통합 분석, 검색, 답변 방식 결정 (process와 동일)
+            state = self._prepare_answer(seq, question, lang, start_time)
+            if 'result' in state:
+                yield 'done', state['result']
+                return
+
+            if state['answer_source'] == 'gpt':
+                # 6단계: AI 답변 스트리밍 생성 (조각은 즉시 전달, 최종 HTML은 생성 완료 후 포맷팅)
+                logging.info("6. AI 답변 스트리밍 생성 시작")
+                for event, payload in self.ai_answer_generator.generate_answer_stream(
+                    corrected_text=state['corrected_text'],
+                    intent_analysis=state['intent_analysis'],
+                    similar_answers=state['similar_answers'],
+                    lang=state['lang']
+                ):
+                    if event == 'delta':
+                        yield 'delta', payload
+                    else:
+                        self._set_generated_answer(state, payload)
+
+            yield 'done', self._finalize_answer(seq, state, start_time)
+
+        except Exception as e:
+            logging.error(f"스트리밍 처리 중 오류 - SEQ: {seq}, 오류: {str(e)}")
+            yield 'done', {"success": False, "error": str(e)}
+
+    # 답변 생성 전 단계 처리 메서드 (전처리 → 답변 캐시 → 통합 분석 → 검색 → 답변 방식 결정)
+    # Args:
+    #     seq: 문의 시퀀스 번호
+    #     question: 사용자 질문
+    #     lang: 언어 코드
+    #     start_time: 요청 처리 시작 시각
+    # Returns:
+    #     dict: 바로 반환할 결과가 있으면 {'result': 결과}, 아니면 답변 생성/마무리에 필요한 상태
+    #           (answer_source가 'gpt'면 ai_answer는 아직 생성 전)
+    def _prepare_answer(self, seq: int, question: str, lang: str, start_time: float) -> dict:
+        # 성능 통계 업데이트
+        self.performance_stats['total_requests'] += 1
+        
+        # 1단계: POST 요청 수신 로그
+        logging.info(f"1. POST /generate_answer: seq={seq}, question='{question}', lang='{lang}'")
+        
+        # 2단계: 전처리 (HTML 태그 제거, 앱 이름 통일, 공백 정규화)
+        preprocess_start = time.time()
+        processed_question = self.preprocess_text(question)
+        preprocess_time = time.time() - preprocess_start
+        logging.info(f"2. HTML 태그 제거, 앱 이름 통일, 공백 정규화 전처리: '{question}' → '{processed_question}', 시간={preprocess_time:.3f}s")
+
+        # 2-1단계: 답변 캐시 조회 (유사한 이전 질문이 있으면 분석/검색/생성 생략)
+        # 답변은 항상 한국어로 생성되므로 (4단계) 언어 조건 없이 질문 벡터만으로 비교
+        # 정규화 텍스트가 같은 질문은 임베딩 생성 없이 정확 일치로 먼저 조회
+        cache_question = processed_question
+        question_vector = None
+        with _response_cache_lock:
+            cache_generation = _response_cache_generation
+            exact = _response_cache.get_exact(cache_question)
+        cached = exact[1] if exact is not None else None
+        if cached is None:
+            question_vector = self.embedding_generator.create_embedding(cache_question)
+            if question_vector is not None:
+                with _response_cache_lock:
+                    cached = _response_cache.get_similar(question_vector)
+        if cached is not None:
+            cached_entry = cached[0]
+            total_time = time.time() - start_time
+            self._update_performance_stats(total_time)
+            self.performance_stats['answer_sources']['cache'] += 1
+            hit_type = '정확 일치' if question_vector is None else '유사 질문'
+            logging.info(f"답변 캐시 히트({hit_type}) - SEQ: {seq}, 총 시간: {total_time:.3f}s")
+            return {'result': {
+                "success": True,
+                "answer": cached_entry['answer'],
+                "answer_source": "cache",
+                "similar_count": cached_entry['similar_count'],
+                "embedding_model": "text-embedding-3-small",
+                "generation_model": "gpt-5-mini",
+                "detected_language": 'ko',
+                "processing_time": total_time,
+                "optimization_stats": self.get_optimization_summary()
+            }}
+
+        # 2-2단계: 원문 질문 벡터로 Pinecone 검색 선행 실행 (3단계 통합 분석과 동시 진행)
+        # 의도 분석 결과는 검색 결과의 참조용 메타데이터에만 쓰이므로 빈 값으로 검색
+        prefetched_search = None
+        if question_vector is not None:
+            prefetched_search = _search_prefetch_executor.submit(
+                self.search_service.search_by_enhanced_intent,
+                intent_analysis={},
+                original_query=cache_question,
+                lang='ko',
+                top_k=3,
+                query_vector=question_vector.tolist()
+            )
+
+        # 3단계: 통합 분석 (오타 수정 + 의도 분석) API 호출
+        analysis_start = time.time()    
+        corrected_text, intent_analysis = self.unified_analyzer.analyze_and_correct(processed_question)
+        core_intent = intent_analysis.get('core_intent', 'general_inquiry')
+        processed_question = corrected_text # corrected_text를 쿼리로 사용
+        semantic_keywords = intent_analysis.get('semantic_keywords', [])
+        result = ', '.join(semantic_keywords)
+
+        analysis_time = time.time() - analysis_start 
+        logging.info(f"3. 통합 분석 완료: corrected='{corrected_text}', intent={{'core_intent': '{intent_analysis.get('core_intent', 'N/A')}'}}, 시간={analysis_time:.2f}s")
+            
+        if not processed_question:
+            return {'result': {"success": False, "error": "질문이 비어있습니다."}}
+
+        # 4단계: 언어 한국어로 고정
+        lang = 'ko'
+        search_start = time.time()
+        
+        # 5단계: 의도 기반 검색 (Pinecone 검색) API 호출
+        if prefetched_search is not None and corrected_text == cache_question:
+            # 오타 수정으로 질문이 바뀌지 않았으면 2-2단계에서 미리 실행한 검색 결과 사용
+            similar_answers = prefetched_search.result()
+            logging.info("선행 검색 결과 사용 (오타 수정 전후 질문 동일)")
+        else:
+            similar_answers = self.search_service.search_by_enhanced_intent(
+                intent_analysis=intent_analysis,  # 전체 의도 분석 결과 전달
+                original_query=corrected_text, # corrected_text를 쿼리로 사용 (원래 이거였음)
+                # original_query=core_intent,
+                # original_query= result,
+                lang=lang,
+                top_k=3  # 상위 3개 결과만 반환
+            )
+        
+        search_time = time.time() - search_start
+        logging.info(f"검색 완료: {len(similar_answers)}개 결과, 시간={search_time:.2f}s")
+
+        # 검색 결과 상세 로깅 (디버깅용)
+        for i, result in enumerate(similar_answers[:3], 1):
+            logging.info(
+                f"검색결과 상세 #{i}: "
+                f"score={result.get('score', 0):.4f}, "
+                f"category='{result.get('category', '')}', "
+                f"question='{result.get('question', '')}', "
+                f"answer_length={len(result.get('answer', ''))}자"
+            )
+
+        # 검색 결과 확인 - 결과가 없거나 유사도가 0.4 이하면 폴백 답변 사용
+        if not similar_answers:
+            logging.warning(f"⚠️ 검색 결과 없음 - 폴백 답변 사용")
+            
+            # 폴백 답변 사용
+            generation_start = time.time()
+            ai_answer = self.ai_answer_generator._get_fallback_answer()
+            answer_source = 'fallback'
+            generation_time = time.time() - generation_start
+            logging.info(f"폴백 답변 생성 완료: 길이={len(ai_answer)}자, 시간={generation_time:.2f}s")
+        else:
+            # 최고 유사도 답변 및 점수 확인 (한 번의 순회로 직접 사용 후보와 점수를 함께 결정)
+            top_answer = max(similar_answers, key=lambda r: r.get('score', 0))
+            max_score = top_answer.get('score', 0)
+            
+            # 유사도 임계값 체크
+            SIMILARITY_THRESHOLD = 0.4
+
+            if max_score <= SIMILARITY_THRESHOLD:
+                logging.warning(
+                    f"⚠️ 최고 유사도 {max_score:.4f} <= {SIMILARITY_THRESHOLD} - 낮은 유사도 참고답변으로 AI 답변 생성 진행"
+                )
+                logging.info(
+                    f"검색 결과 요약: "
+                    f"총 {len(similar_answers)}개 결과, "
+                    f"최고 점수={max_score:.4f}, "
+                    f"최저 점수={min(r.get('score', 0) for r in similar_answers):.4f}"
+                )
+                
+                # 6단계 AI 답변 생성은 호출자(process / process_stream)에서 수행 (직접 사용 판단 없음)
+                ai_answer = ''
+                answer_source = 'gpt'
+            else:
+                # 유사도가 충분히 높은 경우 AI 답변 생성
+                logging.info(
+                    f"✅ 유사도 조건 충족 (최고 점수={max_score:.4f} > {SIMILARITY_THRESHOLD}) - AI 답변 생성 진행"
+                )
+            
+                # 5-1단계: 최상위 참고답변 직접 사용 판단 (유사도가 매우 높고 정상 텍스트면 GPT 생성 생략)
+                top_text = top_answer.get('answer', '')
+                if max_score >= DIRECT_USE_THRESHOLD and self.quality_validator.is_valid_text(top_text, 'ko'):
+                    logging.info(f"6. 참고답변 직접 사용 (유사도={max_score:.4f} >= {DIRECT_USE_THRESHOLD}) - GPT 생성 생략")
+                    ai_answer = self.ai_answer_generator._format_final_answer(top_text, lang)
+                    answer_source = 'direct_use'
+                else:
+                    # 6단계 AI 답변 생성은 호출자(process / process_stream)에서 수행
+                    ai_answer = ''
+                    answer_source = 'gpt'
+
+        return {
+            'lang': lang,
+            'corrected_text': corrected_text,
+            'intent_analysis': intent_analysis,
+            'similar_answers': similar_answers,
+            'question_vector': question_vector,
+            'cache_question': cache_question,
+            'cache_generation': cache_generation,
+            'ai_answer': ai_answer,
+            'answer_source': answer_source
+        }
+
+    # GPT 생성 결과를 상태에 반영하는 메서드
+    # - 생성 실패(None)면 폴백 답변으로 바꾸고 출처를 'fallback'으로 표시 (폴백 답변이 답변 캐시에 저장되지 않도록)
+    # Args:
+    #     state: _prepare_answer가 반환한 상태
+    #     ai_answer: AIAnswerGenerator가 생성한 답변 (실패시 None)
+    def _set_generated_answer(self, state: dict, ai_answer: Optional[str]):
+        if ai_answer is None:
+            ai_answer = self.ai_answer_generator._get_fallback_answer()
+            state['answer_source'] = 'fallback'
+        state['ai_answer'] = ai_answer
+
+    # 답변 마무리 메서드 (특수문자 정리, 답변 캐시 저장, 성능 통계, 결과 구성)
+    # Args:
+    #     seq: 문의 시퀀스 번호
+    #     state: _prepare_answer가 반환한 상태 (ai_answer 생성 완료)
+    #     start_time: 요청 처리 시작 시각
+    # Returns:
+    #     dict: API 응답 결과
+    def _finalize_answer(self, seq: int, state: dict, start_time: float) -> dict:
+        ai_answer = state['ai_answer']
+        answer_source = state['answer_source']
+        similar_answers = state['similar_answers']
+        question_vector = state['question_vector']
+
+        # 특수문자 정리
+        ai_answer = ai_answer.translate(_QUOTE_FIX_TABLE)
+
+        # 답변 캐시 저장 (검색 결과 기반 AI 답변만, 폴백 답변은 저장하지 않음)
+        # 처리 도중 캐시가 비워졌으면 (데이터 동기화/수동 비우기) 이전 데이터 기반 답변이므로 저장하지 않음
+        if question_vector is not None and answer_source != 'fallback' and ai_answer:
+            with _response_cache_lock:
+                if state['cache_generation'] == _response_cache_generation:
+                    _response_cache.put(state['cache_question'], question_vector,
+                                        [{'answer': ai_answer, 'similar_count': len(similar_answers)}])
+
+        # 성능 통계 업데이트
+        self.performance_stats['answer_sources'][answer_source] += 1
+        total_time = time.time() - start_time
+        self._update_performance_stats(total_time)
+
+        result = {
+            "success": True,
+            "answer": ai_answer,
+            "answer_source": answer_source,     # 답변 출처 (direct_use / gpt / fallback)
+            "similar_count": len(similar_answers),
+            "embedding_model": "text-embedding-3-small",
+            "generation_model": "gpt-5-mini",
+            "detected_language": state['lang'],
+            "processing_time": total_time,
+            "optimization_stats": self.get_optimization_summary()
+        }
+
+        logging.info(f"처리 완료 - SEQ: {seq}, 총 시간: {total_time:.2f}s")
+        logging.info(f"답변: {ai_answer}")
+        return result
+
+    # 답변 캐시 수동 비우기 메서드 (/optimization/cache/clear 에서 호출)
+    # Returns:
+    #     int: 삭제된 캐시 항목 수
+    def clear_response_cache(self) -> int:
+        cleared = _clear_response_cache()
+        logging.info(f"답변 캐시 수동 비우기: 삭제 {cleared}개")
+        return cleared
+
     def _update_performance_stats(self, processing_time: float):
         """성능 통계 업데이트"""
         api_stats = self.api_manager.get_performance_stats()
@@ -408,7 +656,8 @@ class OptimizedAIAnswerGenerator:
                 'total_requests': self.performance_stats.get('total_requests', 0),
                 'cache_hit_rate': self.performance_stats.get('cache_hit_rate', 0.0),
                 'avg_processing_time': self.performance_stats.get('avg_processing_time', 0.0),
-                'api_calls_saved': self.performance_stats.get('api_calls_saved', 0)
+                'api_calls_saved': self.performance_stats.get('api_calls_saved', 0),
+                'answer_sources': dict(self.performance_stats.get('answer_sources', {}))
             }
             
             # search_service의 통계 메서드가 있는 경우에만 호출
@@ -8,8 +8,55 @@
 """
 
 import logging
-from typing import Optional
-from src.utils.memory_manager import memory_cleanup
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+import numpy as np
+
+# ===== 프로세스 공용 임베딩 LRU 캐시 =====
+# 정규화된 텍스트 → 임베딩 벡터(읽기 전용 float16 배열) 매핑, 같은 질문의 반복 API 호출 방지
+# float16으로 저장하여 항목당 메모리를 절반(1536차원 6KB → 3KB)으로 줄이고, 조회시 float32 복사본 반환
+EMBEDDING_CACHE_SIZE = 4096                 # 최대 캐시 항목 수 (float32 저장시 2048개와 같은 메모리)
+_embedding_cache = OrderedDict()            # 삽입/사용 순서 유지 (가장 오래된 항목이 앞)
+_embedding_cache_lock = threading.Lock()    # 멀티스레드 요청 간 캐시 보호
+_cache_stats = {'hits': 0, 'misses': 0}     # 캐시 적중/실패 횟수
+
+# 임베딩 API 한 번의 요청에 담을 최대 텍스트 수 (일괄 임베딩용)
+EMBEDDING_BATCH_SIZE = 256
+
+
+# 임베딩 캐시 키 생성 (앞뒤 공백 제거, 연속 공백 통일, 소문자 변환)
+# Args:
+#     text: 원본 텍스트
+#     max_length: 최대 텍스트 길이
+# Returns:
+#     str: 정규화된 캐시 키
+def _normalize_cache_key(text: str, max_length: int) -> str:
+    return ' '.join(text.split()).lower()[:max_length]
+
+# 캐시에 임베딩 저장 (용량 초과시 가장 오래 사용되지 않은 항목 제거)
+# Args:
+#     cache_key: 정규화된 캐시 키
+#     embedding: 정규화된 float32 임베딩 벡터
+def _cache_put(cache_key: str, embedding: np.ndarray):
+    cached = embedding.astype(np.float16)
+    cached.setflags(write=False)  # 캐시 원본 보호 (호출자에게는 float32 복사본 반환)
+    with _embedding_cache_lock:
+        _embedding_cache[cache_key] = cached
+        _embedding_cache.move_to_end(cache_key)
+        while len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+            _embedding_cache.popitem(last=False)
+
+
+# API 응답의 임베딩을 단위 길이 float32 벡터로 변환
+# Args:
+#     values: API가 반환한 임베딩 값 리스트
+# Returns:
+#     np.ndarray: 단위 길이로 정규화된 float32 벡터
+def _to_unit_vector(values) -> np.ndarray:
+    embedding = np.asarray(values, dtype=np.float32)
+    embedding /= np.linalg.norm(embedding) + 1e-12
+    return embedding
 
 # ===== 텍스트 임베딩 생성을 담당하는 메인 클래스 =====
 class EmbeddingGenerator:
@@ -26,33 +73,100 @@ class EmbeddingGenerator:
     # Args:
     #     text: 임베딩을 생성할 텍스트
     # Returns:
-    #     Optional[list]: 생성된 임베딩 벡터 (실패시 None)
-    def create_embedding(self, text: str) -> Optional[list]:
+    #     Optional[np.ndarray]: 단위 길이로 정규화된 float32 임베딩 벡터 (실패시 None)
+    #                           Pinecone 호출시에만 .tolist()로 변환
+    def create_embedding(self, text: str) -> Optional[np.ndarray]:
         # ===== 1단계: 입력 텍스트 유효성 검증 =====
         # 빈 문자열뿐만 아니라 공백만 있는 문자열도 걸러냄
         if not text or not text.strip():
             return None
+        
+        # ===== 캐시 조회: 동일한 (정규화된) 텍스트는 API 호출 없이 반환 =====
+        cache_key = _normalize_cache_key(text, self.max_text_length)
+        with _embedding_cache_lock:
+            cached = _embedding_cache.get(cache_key)
+            if cached is not None:
+                _embedding_cache.move_to_end(cache_key)  # 최근 사용 항목으로 갱신
+                _cache_stats['hits'] += 1
+            else:
+                _cache_stats['misses'] += 1
+            hits, misses = _cache_stats['hits'], _cache_stats['misses']
+        
+        if cached is not None:
+            logging.info(f"임베딩 캐시 적중 (적중: {hits}, 실패: {misses})")
+            return cached.astype(np.float32)
+        logging.info(f"임베딩 캐시 미스 (적중: {hits}, 실패: {misses})")
             
         try:
-            # ===== 2단계: 메모리 최적화 컨텍스트 시작 =====
-            with memory_cleanup():
-                # ===== 3단계: OpenAI Embedding API 호출 =====
-                # - text-embedding-3-small 모델 사용 (성능과 비용의 균형)
-                # - 텍스트 길이 제한으로 API 오류 방지
+            # ===== 2단계: OpenAI Embedding API 호출 =====
+            # - text-embedding-3-small 모델 사용 (성능과 비용의 균형)
+            # - 텍스트 길이 제한으로 API 오류 방지
+            response = self.openai_client.embeddings.create(
+                model=self.model_name,
+                input=text[:self.max_text_length]  # 텍스트 길이 제한 (8000자)
+            )
+            
+            # ===== 3단계: 임베딩 벡터 추출 및 단위 벡터 정규화 =====
+            # 연속된 float32 배열로 변환하여 로컬 유사도 계산이 내적 한 번(BLAS)으로 끝나도록 함
+            embedding = _to_unit_vector(response.data[0].embedding)
+            
+            # ===== 캐시 저장 =====
+            _cache_put(cache_key, embedding)
+            
+            # ===== 4단계: 임베딩 벡터 반환 =====
+            return embedding
+            
+        except Exception as e:
+            # ===== 예외 처리: 임베딩 생성 실패 =====
+            logging.error(f"임베딩 생성 실패: {e}")
+            return None
+
+    # 여러 텍스트의 임베딩을 한 번의 API 호출로 생성하는 메서드 (캐시 적중 항목은 호출에서 제외)
+    # Args:
+    #     texts: 임베딩을 생성할 텍스트 리스트
+    # Returns:
+    #     List[Optional[np.ndarray]]: 입력 순서대로 정규화된 float32 임베딩 (빈 텍스트/실패 항목은 None)
+    def create_embeddings_batch(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        
+        # ===== 1단계: 캐시 조회 및 API 호출 대상 수집 (같은 키는 한 번만 요청) =====
+        pending = OrderedDict()   # 캐시 키 → (잘린 텍스트, 결과 위치 리스트)
+        with _embedding_cache_lock:
+            for i, text in enumerate(texts):
+                if not text or not text.strip():
+                    continue
+                cache_key = _normalize_cache_key(text, self.max_text_length)
+                cached = _embedding_cache.get(cache_key)
+                if cached is not None:
+                    _embedding_cache.move_to_end(cache_key)
+                    _cache_stats['hits'] += 1
+                    results[i] = cached.astype(np.float32)
+                    continue
+                _cache_stats['misses'] += 1
+                pending.setdefault(cache_key, (text[:self.max_text_length], []))[1].append(i)
+        
+        logging.info(f"일괄 임베딩: 전체 {len(texts)}개, API 요청 {len(pending)}개")
+        
+        # ===== 2단계: EMBEDDING_BATCH_SIZE 단위로 API 호출 =====
+        pending_items = list(pending.items())
+        for start in range(0, len(pending_items), EMBEDDING_BATCH_SIZE):
+            chunk = pending_items[start:start + EMBEDDING_BATCH_SIZE]
+            try:
                 response = self.openai_client.embeddings.create(
                     model=self.model_name,
-                    input=text[:self.max_text_length]  # 텍스트 길이 제한 (8000자)
+                    input=[text for _, (text, _) in chunk]
                 )
                 
-                # ===== 4단계: 임베딩 벡터 추출 및 메모리 최적화 =====
-                # 메모리 효율성을 위해 벡터만 복사 후 응답 객체 삭제
-                embedding = response.data[0].embedding.copy()  # 벡터 데이터만 추출
-                del response  # 원본 응답 객체 즉시 삭제 (메모리 절약)
+                # ===== 3단계: 응답 순서(index)대로 결과 배치 및 캐시 저장 =====
+                for item in response.data:
+                    cache_key, (_, positions) = chunk[item.index]
+                    embedding = _to_unit_vector(item.embedding)
+                    _cache_put(cache_key, embedding)
+                    for pos in positions:
+                        results[pos] = embedding.copy()
                 
-                # ===== 5단계: 임베딩 벡터 반환 =====
-                return embedding
-                
-        except Exception as e:
-            # ===== 예외 처리: 임베딩 생성 실패 =====
-            logging.error(f"임베딩 생성 실패: {e}")
-            return None
+            except Exception as e:
+                # ===== 예외 처리: 해당 묶음만 실패 처리 (None 유지) =====
+                logging.error(f"일괄 임베딩 생성 실패 ({len(chunk)}개): {e}")
+        
+        return results
@@ -9,10 +9,102 @@
 
 import json
 import logging
-import re
-from typing import Dict
-from langdetect import detect, LangDetectException
-from src.utils.memory_manager import memory_cleanup
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import numpy as np
+
+try:
+    import orjson  # C 구현 JSON 파싱 (미설치시 표준 json 사용)
+except ImportError:
+    orjson = None
+
+try:
+    import gcld3  # C++ 신경망 언어 판별기 (CLD3)
+except ImportError:
+    gcld3 = None
+
+try:
+    from langdetect import detect, LangDetectException  # 순수 파이썬 언어 판별기 (gcld3 미설치시 사용)
+except ImportError:
+    detect = None
+
+# ===== 언어 감지 빠른 경로 설정 =====
+LANG_DETECT_SAMPLE_CHARS = 512                  # 문자 비율 계산에 사용할 앞부분 길이
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3   # 한글 음절 코드 범위 (가-힣)
+LANG_DETECT_CACHE_SIZE = 1024                   # 언어 판별기 결과 캐시 크기
+LANG_DETECT_MAX_BYTES = 1000                    # gcld3가 판별에 사용할 최대 바이트 수
+
+# ===== 의도 분석 결과 캐시 설정 =====
+INTENT_ANALYSIS_CACHE_SIZE = 4096               # 질문 → GPT 의도 분석 결과 캐시 크기 (API 오류/파싱 실패는 캐시하지 않음)
+
+# gcld3 판별기는 생성 비용이 있으므로 모듈 로드시 한 번만 생성
+_LANG_ID = gcld3.NNetLanguageIdentifier(min_num_bytes=0, max_num_bytes=LANG_DETECT_MAX_BYTES) if gcld3 is not None else None
+
+
+# GPT 응답 JSON 파싱 (파싱 실패시 json.JSONDecodeError 발생 - orjson의 오류도 그 하위 클래스)
+# Args:
+#     text: JSON 문자열
+# Returns:
+#     Any: 파싱된 객체
+def _json_loads(text: str):
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# 한글 음절 수와 영문 알파벳 수를 세는 함수
+# - UTF-32 코드 배열에서 범위 비교로 한 번에 계산 (정규식 findall처럼 매칭 문자 리스트를 만들지 않음)
+# Args:
+#     text: 문자 수를 셀 텍스트
+# Returns:
+#     Tuple[int, int]: (한글 음절 수, 영문 알파벳 수)
+def _count_hangul_latin(text: str) -> Tuple[int, int]:
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    korean_chars = int(np.count_nonzero((codes >= _HANGUL_FIRST) & (codes <= _HANGUL_LAST)))
+    folded = codes | 0x20                                 # 대문자 → 소문자 (A-Z와 a-z를 한 번의 범위 비교로 처리)
+    english_chars = int(np.count_nonzero((folded >= 0x61) & (folded <= 0x7A)))
+    return korean_chars, english_chars
+
+
+# 언어 판별기로 언어를 판별하는 함수 (같은 텍스트는 캐시된 결과 반환)
+# - 문자 비율로 판단이 안 되는 텍스트에만 사용
+# - gcld3(C++) 설치시 우선 사용, 없으면 langdetect(순수 파이썬), 둘 다 없으면 영어로 판단
+# Args:
+#     text: 언어를 감지할 텍스트
+# Returns:
+#     str: 감지된 언어 코드 ('ko' 또는 'en')
+@lru_cache(maxsize=LANG_DETECT_CACHE_SIZE)
+def _detect_with_langdetect(text: str) -> str:
+    if _LANG_ID is not None:
+        result = _LANG_ID.FindLanguage(text=text)
+        if result.language == 'und':
+            return 'en'                                   # 판별 불가 (langdetect 감지 실패와 동일하게 처리)
+        if result.language == 'en' and result.is_reliable:
+            return 'en'
+        return 'ko'                                       # 한국어, 기타 언어, 신뢰도가 낮은 결과는 기본값(한국어)
+    
+    if detect is None:
+        # 문자 비율 판별에서 한글이 영문보다 많지 않았으므로 기존 문자 수 비교 결과와 동일
+        return 'en'
+    
+    try:
+        # ===== 1단계: langdetect 라이브러리를 사용한 자동 언어 감지 =====
+        detected = detect(text)
+        
+        # ===== 2단계: 지원 언어 검증 (한국어/영어만 지원) =====
+        if detected == 'en':
+            return 'en'                                   # 영어로 감지됨
+        elif detected == 'ko':
+            return 'ko'                                   # 한국어로 감지됨
+        else:
+            # 기타 언어는 기본값(한국어)으로 처리
+            return 'ko'
+            
+    except LangDetectException:
+        # ===== 3단계: 감지 실패시 영어로 판단 =====
+        # 문자 비율 판별에서 한글이 영문보다 많지 않았으므로 기존 문자 수 비교 결과와 동일
+        return 'en'
 
 # ===== 질문 분석 및 의도 파악을 담당하는 메인 클래스 =====
 class QuestionAnalyzer:
@@ -22,6 +114,8 @@ class QuestionAnalyzer:
     #     openai_client: OpenAI API 클라이언트 인스턴스
     def __init__(self, openai_client):
         self.openai_client = openai_client                    # GPT 분석을 위한 OpenAI 클라이언트
+        # 같은 질문의 반복 GPT 의도 분석 방지 (성공한 분석 결과만 캐시)
+        self._intent_analysis_cached = lru_cache(maxsize=INTENT_ANALYSIS_CACHE_SIZE)(self._request_intent_analysis)
     
     # 텍스트의 언어를 자동 감지하는 메서드
     # Args:
@@ -29,30 +123,16 @@ class QuestionAnalyzer:
     # Returns:
     #     str: 감지된 언어 코드 ('ko' 또는 'en')
     def detect_language(self, text: str) -> str:
-        try:
-            # ===== 1단계: langdetect 라이브러리를 사용한 자동 언어 감지 =====
-            detected = detect(text)
-            
-            # ===== 2단계: 지원 언어 검증 (한국어/영어만 지원) =====
-            if detected == 'en':
-                return 'en'                                   # 영어로 감지됨
-            elif detected == 'ko':
-                return 'ko'                                   # 한국어로 감지됨
-            else:
-                # 기타 언어는 기본값(한국어)으로 처리
-                return 'ko'
-                
-        except LangDetectException:
-            # ===== 3단계: 감지 실패시 문자 비율 기반 폴백 로직 =====
-            # 텍스트 내 한글과 영문 문자 수를 직접 카운트
-            korean_chars = len(re.findall(r'[가-힣]', text))  # 한글 문자 수
-            english_chars = len(re.findall(r'[a-zA-Z]', text)) # 영문 문자 수
-            
-            # 문자 수 비교로 언어 판단
-            if korean_chars > english_chars:
-                return 'ko'                                   # 한글이 더 많으면 한국어
-            else:
-                return 'en'                                   # 영문이 더 많으면 영어
+        # ===== 1단계: 문자 비율 기반 빠른 판별 (한국어/영어 이진 판단은 대부분 여기서 결정) =====
+        sample = text[:LANG_DETECT_SAMPLE_CHARS]
+        korean_chars, english_chars = _count_hangul_latin(sample)   # 한글 문자 수, 영문 문자 수
+        if korean_chars > english_chars:
+            return 'ko'                                   # 한글이 더 많으면 한국어
+        if english_chars >= 3:
+            return 'en'                                   # 영문이 충분히 많으면 영어
+        
+        # ===== 2단계: 문자가 거의 없는 모호한 짧은 텍스트만 언어 판별기로 판별 (결과 캐시) =====
+        return _detect_with_langdetect(text)
 
     # GPT를 이용해 질문의 본질적 의도와 핵심 목적을 정확히 분석하는 메서드
     # Args:
@@ -61,10 +141,37 @@ class QuestionAnalyzer:
     #     dict: 의도 분석 결과 (core_intent, 카테고리, 키워드 등)
     def analyze_question_intent(self, query: str) -> dict:
         try:
-            # ===== 메모리 최적화 컨텍스트 시작 =====
-            with memory_cleanup():
-                # ===== 1단계: GPT 의도 분석을 위한 시스템 프롬프트 구성 =====
-                system_prompt = """당신은 바이블 앱 문의 분석 전문가입니다. 
+            # 캐시된 결과는 여러 요청이 공유하므로 호출자에게는 복사본 반환
+            return dict(self._intent_analysis_cached(query))
+            
+        except json.JSONDecodeError as e:
+            # ===== JSON 파싱 실패시 기본값 반환 =====
+            logging.warning(f"JSON 파싱 실패, 기본값 반환: {e.doc}")
+            return {
+                "core_intent": "general_inquiry",
+                "intent_category": "일반문의",
+                "primary_action": "기타",
+                "semantic_keywords": [query[:20]],
+            }
+                
+        except Exception as e:
+            # ===== 전체 의도 분석 프로세스 실패시 기본값 반환 =====
+            logging.error(f"강화된 의도 분석 실패: {e}")
+            return {
+                "core_intent": "general_inquiry",
+                "intent_category": "일반문의", 
+                "primary_action": "기타",
+                "semantic_keywords": [query[:20]],
+            }
+
+    # GPT로 질문 의도 분석을 요청하는 메서드 (API 오류/JSON 파싱 실패는 호출자에게 전달)
+    # Args:
+    #     query: 분석할 사용자 질문
+    # Returns:
+    #     dict: 의도 분석 결과 (core_intent, 카테고리, 키워드 등)
+    def _request_intent_analysis(self, query: str) -> dict:
+        # ===== 1단계: GPT 의도 분석을 위한 시스템 프롬프트 구성 =====
+        system_prompt = """당신은 바이블 앱 문의 분석 전문가입니다. 
 고객 질문의 본질적 의도를 파악하여 의미론적으로 동등한 질문들이 같은 결과를 얻도록 분석하세요.
 
 ⚠️ 반드시 유효한 JSON만 반환하세요. 설명 없이 순수 JSON만!:
@@ -101,8 +208,8 @@ class QuestionAnalyzer:
 → 모두 core_intent: "multiple_translations_simultaneous_view"
 """
 
-                # ===== 2단계: 사용자 질문 분석을 위한 프롬프트 생성 =====
-                user_prompt = f"""다음 질문을 의미론적으로 분석하여 본질적 의도를 파악해주세요:
+        # ===== 2단계: 사용자 질문 분석을 위한 프롬프트 생성 =====
+        user_prompt = f"""다음 질문을 의미론적으로 분석하여 본질적 의도를 파악해주세요:
 
 질문: {query}
 
@@ -111,58 +218,32 @@ class QuestionAnalyzer:
 2. 구체적 예시(성경 구절, 번역본명 등)를 제거하고 일반화하면?
 3. 비슷한 의도의 다른 질문들과 어떻게 통합할 수 있는가?"""
 
-                # ===== 3단계: GPT API 호출로 의도 분석 실행 =====
-                response = self.openai_client.chat.completions.create(
-                    model='gpt-5-mini',
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    max_completion_tokens=120000,                               # 충분한 분석 결과 길이
-                    response_format={"type": "json_object"}                  # JSON 형식으로 응답
-                    # temperature=0.2                               # 일관성 있는 분석을 위해 낮은 값
-                )
-                
-                # ===== 4단계: GPT 응답 텍스트 추출 =====
-                raw_response = response.choices[0].message.content.strip()
-                logging.info(f"🔍 GPT-5-mini 원본 응답 (길이={len(raw_response)}): {raw_response}")
-                if isinstance(raw_response, list):
-                    # content가 리스트인 경우 (새 SDK 포맷)
-                    result_text = "".join([c.get("text", "") for c in raw_response if c.get("type") == "text"]).strip()
-                else:
-                    result_text = (raw_response or "").strip()
-                
-                # ===== 5단계: JSON 파싱 및 결과 구조화 =====
-                try:
-                    # JSON 형태로 응답 파싱
-                    result = json.loads(raw_response)
-                    logging.info(f"✅ JSON 파싱 성공: {result.get('core_intent', 'N/A')}")
-                    
-                    # ===== 6단계: 기존 시스템과의 호환성을 위한 필드 추가 =====
-                    result['intent_type'] = result.get('intent_category', '일반문의')
-                    result['keywords'] = result.get('semantic_keywords', [query[:20]])
-                    result['action_type'] = result.get('primary_action', '기타')
-                    
-                    return result
-                except json.JSONDecodeError:
-                    # ===== JSON 파싱 실패시 기본값 반환 =====
-                    logging.warning(f"JSON 파싱 실패, 기본값 반환: {result_text}")
-                    return {
-                        "core_intent": "general_inquiry",
-                        "intent_category": "일반문의",
-                        "primary_action": "기타",
-                        "semantic_keywords": [query[:20]],
-                    }
-                
-        except Exception as e:
-            # ===== 전체 의도 분석 프로세스 실패시 기본값 반환 =====
-            logging.error(f"강화된 의도 분석 실패: {e}")
-            return {
-                "core_intent": "general_inquiry",
-                "intent_category": "일반문의", 
-                "primary_action": "기타",
-                "semantic_keywords": [query[:20]],
-            }
+        # ===== 3단계: GPT API 호출로 의도 분석 실행 =====
+        response = self.openai_client.chat.completions.create(
+            model='gpt-5-mini',
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            max_completion_tokens=120000,                               # 충분한 분석 결과 길이
+            response_format={"type": "json_object"}                  # JSON 형식으로 응답
+            # temperature=0.2                               # 일관성 있는 분석을 위해 낮은 값
+        )
+        
+        # ===== 4단계: GPT 응답 텍스트 추출 =====
+        raw_response = response.choices[0].message.content.strip()
+        logging.info(f"🔍 GPT-5-mini 원본 응답 (길이={len(raw_response)}): {raw_response}")
+        
+        # ===== 5단계: JSON 파싱 및 결과 구조화 (파싱 실패시 json.JSONDecodeError 전달) =====
+        result = _json_loads(raw_response)
+        logging.info(f"✅ JSON 파싱 성공: {result.get('core_intent', 'N/A')}")
+        
+        # ===== 6단계: 기존 시스템과의 호환성을 위한 필드 추가 =====
+        result['intent_type'] = result.get('intent_category', '일반문의')
+        result['keywords'] = result.get('semantic_keywords', [query[:20]])
+        result['action_type'] = result.get('primary_action', '기타')
+        
+        return result
 
     # 질문의 의도와 참조 답변 간의 의미론적 유사성을 계산하는 메서드
     # Args:
@@ -8,9 +8,74 @@
 
 import logging
 import re
-from typing import Dict, List
-from src.utils.memory_manager import memory_cleanup
+from typing import Dict, Iterator, List, Optional, Tuple
 
+# 참고답변 인사말/끝맺음말 패턴 - 하나의 대안 정규식으로 결합하여 한 번의 스캔으로 제거
+_REFERENCE_GREETING_CLOSING_RE = re.compile('|'.join('(?:%s)' % pattern for pattern in (
+    # 인사말
+    r'^안녕하세요[^.]*\.\s*',
+    r'^GOODTV\s+바이블\s*애플[^.]*\.\s*',
+    r'^바이블\s*애플[^.]*\.\s*',
+    r'바이블\s*애플을\s*이용해주셔서\s*감사드립니다\.\s*',
+    # 끝맺음말
+    r'\s*감사합니다[^.]*\.?\s*$',
+    r'\s*평안하세요[^.]*\.?\s*$',
+    r'\s*주님\s*안에서[^.]*\.?\s*$',
+    r'\s*항상\s*성도님[^.]*\.?\s*$',
+)), re.IGNORECASE)
+
+# 연달아 붙은 인사말/끝맺음말 처리를 위한 최대 반복 제거 횟수
+_MAX_STRIP_PASSES = 3
+
+# 번호 목록 항목 (예: "1. 내용")
+_RE_NUMBERED_ITEM = re.compile(r'^(\d+)\.\s+')
+
+# 최종 답변 HTML 고정 부분 (모듈 로드시 한 번만 생성, 요청마다 본문과 한 번에 join)
+_PARAGRAPH_BREAK_HTML = "<p><br></p>"     # 단락 사이 빈 줄
+_AI_NOTICE_HTML = "<p>(AI가 작성한 답변입니다. 답변완료 시, 이 문구를 꼭 삭제해주세요.)</p><p><br></p>"
+_GREETING_HTML = (
+    "<p>안녕하세요, 바이블 애플입니다. "
+    "바이블 애플을 이용해 주셔서 감사합니다.</p>"
+    "<p><br></p>"
+)
+_CLOSING_HTML = (
+    "<p><br></p>"
+    "<p>항상 성도님께 좋은 성경앱을 제공하기 위해 노력하는 "
+    "바이블 애플이 되겠습니다.</p>"
+    "<p><br></p>"
+    "<p>감사합니다. 주님 안에서 평안하세요.</p>"
+)
+# 오류시 기본 답변 (내용이 고정이므로 전체를 미리 조립)
+_FALLBACK_ANSWER_HTML = ''.join((
+    _GREETING_HTML,
+    "<p>남겨주신 문의는 현재 담당자가 직접 확인하고 있습니다.</p>"
+    "<p><br></p>"
+    "<p>성도님께 도움이 될 수 있도록 내용을 꼼꼼히 살펴보고 "
+    "정확하고 구체적인 답변을 준비하겠습니다.</p>"
+    "<p><br></p>"
+    "<p>답변은 최대 하루 이내에 드릴 예정이오니 "
+    "조금만 기다려 주시면 감사하겠습니다.</p>",
+    _CLOSING_HTML,
+    _AI_NOTICE_HTML
+))
+
+
+# GPT 시스템 프롬프트 (모듈 로드시 한 번만 생성)
+# 주의: 요청마다 바이트 단위로 동일해야 OpenAI 프롬프트 접두어 캐싱이 적용되므로
+#       질문, 의도, 참고답변 등 요청별 내용은 사용자 프롬프트에만 넣을 것
+#       규칙은 짧은 체크리스트로 유지 (입력 토큰 수가 곧 프리필 지연과 비용)
+_SYSTEM_PROMPT = """You are a customer service agent for GOODTV Bible Apple (바이블 애플), a Korean Christian Bible app.
+Rules:
+- Base the answer on the reference answers' content, solutions and tone; adapt only where the customer's situation differs
+- Mention only features that exist in the reference answers; never promise missing features
+- Natural, concise paragraphs with the core message first; numbered steps only for technical troubleshooting
+- No repetition, no excessive procedure breakdowns, no requests for screenshots or version numbers
+- Body only: no greetings (안녕하세요) or closings (감사합니다, 평안하세요) - the system adds them
+- Answer in Korean (한국어)"""
+
+# GPT 호출 설정
+GPT_MAX_COMPLETION_TOKENS = 1500    # 추론 토큰 포함 최대 생성 토큰 (고객 답변 본문 길이 기준)
+GPT_REASONING_EFFORT = 'low'        # gpt-5-mini 추론 강도 (참고답변 재구성 작업이라 낮은 강도로 충분)
 
 class AIAnswerGenerator:
     """AI 답변 생성 클래스"""
@@ -24,155 +89,151 @@ class AIAnswerGenerator:
                        corrected_text: str, 
                        intent_analysis: Dict, 
                        similar_answers: List[Dict], 
-                       lang: str = 'ko') -> str:
-        """AI 답변 생성 메인 메서드"""
+                       lang: str = 'ko') -> Optional[str]:
+        """AI 답변 생성 메인 메서드 - GPT 호출 실패/빈 응답이면 None 반환 (폴백 답변은 호출자가 선택)"""
         try:
-            with memory_cleanup():
-                logging.info("=" * 80)
-                logging.info("AI 답변 생성 프로세스 시작")
-                logging.info("=" * 80)
-                
-                # 1단계: 입력 데이터 로깅
-                logging.info(f"[1단계] 입력 데이터 확인")
-                logging.info(f"  - 수정된 질문: '{corrected_text}'")
-                logging.info(f"  - 핵심 의도: {intent_analysis.get('core_intent', 'N/A')}")
-                logging.info(f"  - 의도 카테고리: {intent_analysis.get('intent_category', 'N/A')}")
-                logging.info(f"  - 검색된 참고답변 수: {len(similar_answers)}개")
-                logging.info(f"  - 언어: {lang}")
-                
-                # 2단계: 참고답변 컨텍스트 구성
-                logging.info(f"\n[2단계] 참고답변 컨텍스트 구성 시작")
-                context = self._build_context(similar_answers)
-                logging.info(f"  - 컨텍스트 길이: {len(context)}자")
-                logging.info(f"  - 컨텍스트 미리보기:\n{context[:300]}...")
-                
-                # 3단계: 프롬프트 생성
-                logging.info(f"\n[3단계] GPT 프롬프트 생성")
-                system_prompt, user_prompt = self._create_prompts(
-                    corrected_text, 
-                    intent_analysis, 
-                    context
-                )
-                logging.info(f"  - System 프롬프트 길이: {len(system_prompt)}자")
-                logging.info(f"  - User 프롬프트 길이: {len(user_prompt)}자")
-                
-                # 4단계: GPT API 호출
-                # logging.info(f"\n[4단계] GPT-5-mini API 호출 시작")
-                # logging.info(f"  - 모델: {self.model}")
-                # logging.info(f"  - Max tokens: 2000")
-                
-                response = self.openai_client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    max_completion_tokens=2000
-                )
-                
-                logging.info(f"  - GPT API 호출 완료")
-                logging.info(f"  - 사용된 토큰: {response.usage.total_tokens if hasattr(response, 'usage') else 'N/A'}")
-                
-                # 5단계: GPT 원본 답변 추출
-                ai_answer_raw = response.choices[0].message.content.strip()
-                # logging.info(f"\n[5단계] GPT 원본 답변 추출")
-                # logging.info(f"  - 원본 답변 길이: {len(ai_answer_raw)}자")
-                # logging.info(f"  - 원본 답변 미리보기:\n{ai_answer_raw[:200]}...")
-                
-                if not ai_answer_raw:
-                    logging.warning("  ⚠️ GPT 응답이 비어있음 - 폴백 답변 사용")
-                    return self._get_fallback_answer()
-                
-                # 6단계: 인사말/끝맺음말 추가 및 HTML 포맷팅
-                logging.info(f"\n[6단계] 최종 답변 포맷팅")
-                final_answer = self._format_final_answer(ai_answer_raw, lang)
-                
-                logging.info(f"  - 최종 답변 길이: {len(final_answer)}자")
-                logging.info(f"  - 인사말 포함 여부: {'안녕하세요' in final_answer}")
-                logging.info(f"  - 끝맺음말 포함 여부: {'주님 안에서 평안하세요' in final_answer}")
-                
-                # 7단계: 완료
-                logging.info("=" * 80)
-                logging.info("✅ AI 답변 생성 완료")
-                logging.info("=" * 80)
-                
-                return final_answer
+            logging.debug("=" * 80)
+            logging.info("AI 답변 생성 프로세스 시작")
+            logging.debug("=" * 80)
+            
+            # 1단계: 입력 데이터 로깅
+            logging.debug(f"[1단계] 입력 데이터 확인")
+            logging.debug(f"  - 수정된 질문: '{corrected_text}'")
+            logging.debug(f"  - 핵심 의도: {intent_analysis.get('core_intent', 'N/A')}")
+            logging.debug(f"  - 의도 카테고리: {intent_analysis.get('intent_category', 'N/A')}")
+            logging.debug(f"  - 검색된 참고답변 수: {len(similar_answers)}개")
+            logging.debug(f"  - 언어: {lang}")
+            
+            # 2단계: 참고답변 컨텍스트 구성
+            logging.debug(f"\n[2단계] 참고답변 컨텍스트 구성 시작")
+            context = self._build_context(similar_answers)
+            logging.debug(f"  - 컨텍스트 길이: {len(context)}자")
+            logging.debug(f"  - 컨텍스트 미리보기:\n{context[:300]}...")
+            
+            # 3단계: 프롬프트 생성
+            logging.debug(f"\n[3단계] GPT 프롬프트 생성")
+            system_prompt, user_prompt = self._create_prompts(
+                corrected_text, 
+                intent_analysis, 
+                context
+            )
+            logging.debug(f"  - System 프롬프트 길이: {len(system_prompt)}자")
+            logging.debug(f"  - User 프롬프트 길이: {len(user_prompt)}자")
+            
+            # 4단계: GPT API 호출
+            # logging.info(f"\n[4단계] GPT-5-mini API 호출 시작")
+            # logging.info(f"  - 모델: {self.model}")
+            # logging.info(f"  - Max tokens: {GPT_MAX_COMPLETION_TOKENS}")
+            
+            response = self.openai_client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_completion_tokens=GPT_MAX_COMPLETION_TOKENS,
+                reasoning_effort=GPT_REASONING_EFFORT
+            )
+            
+            logging.info(f"  - GPT API 호출 완료")
+            logging.info(f"  - 사용된 토큰: {response.usage.total_tokens if hasattr(response, 'usage') else 'N/A'}")
+            
+            # 5단계: GPT 원본 답변 추출
+            ai_answer_raw = response.choices[0].message.content.strip()
+            # logging.info(f"\n[5단계] GPT 원본 답변 추출")
+            # logging.info(f"  - 원본 답변 길이: {len(ai_answer_raw)}자")
+            # logging.info(f"  - 원본 답변 미리보기:\n{ai_answer_raw[:200]}...")
+            
+            if not ai_answer_raw:
+                logging.warning("  ⚠️ GPT 응답이 비어있음 - 폴백 답변 사용")
+                return None
+            
+            # 6단계: 인사말/끝맺음말 추가 및 HTML 포맷팅
+            logging.debug(f"\n[6단계] 최종 답변 포맷팅")
+            final_answer = self._format_final_answer(ai_answer_raw, lang)
+            
+            logging.debug(f"  - 최종 답변 길이: {len(final_answer)}자")
+            logging.debug(f"  - 인사말 포함 여부: {'안녕하세요' in final_answer}")
+            logging.debug(f"  - 끝맺음말 포함 여부: {'주님 안에서 평안하세요' in final_answer}")
+            
+            # 7단계: 완료
+            logging.debug("=" * 80)
+            logging.info(f"✅ AI 답변 생성 완료: 최종 답변 길이={len(final_answer)}자")
+            logging.debug("=" * 80)
+            
+            return final_answer
                 
         except Exception as e:
             logging.error("=" * 80)
             logging.error(f"❌ AI 답변 생성 실패: {str(e)}")
             logging.error(f"  - 에러 타입: {type(e).__name__}")
             logging.error("=" * 80)
-            return self._get_fallback_answer()
+            return None
+    
+    def generate_answer_stream(self,
+                               corrected_text: str,
+                               intent_analysis: Dict,
+                               similar_answers: List[Dict],
+                               lang: str = 'ko') -> Iterator[Tuple[str, Optional[str]]]:
+        """AI 답변 스트리밍 생성 - ('delta', 생성 조각)을 도착하는 대로 반환하고 마지막에 ('answer', 최종 HTML) 반환
+        (GPT 호출 실패/빈 응답이면 ('answer', None) 반환 - 폴백 답변은 호출자가 선택)"""
+        try:
+            logging.info("AI 답변 스트리밍 생성 시작")
+            
+            # 1단계: 참고답변 컨텍스트 및 프롬프트 구성 (generate_answer와 동일)
+            context = self._build_context(similar_answers)
+            system_prompt, user_prompt = self._create_prompts(
+                corrected_text, 
+                intent_analysis, 
+                context
+            )
+            
+            # 2단계: GPT API 스트리밍 호출 - 생성된 조각을 즉시 전달하면서 누적
+            stream = self.openai_client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_completion_tokens=GPT_MAX_COMPLETION_TOKENS,
+                reasoning_effort=GPT_REASONING_EFFORT,
+                stream=True
+            )
+            
+            parts = []
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield 'delta', delta
+            
+            # 3단계: 전체 답변에 인사말/끝맺음말 추가 및 HTML 포맷팅
+            ai_answer_raw = ''.join(parts).strip()
+            if not ai_answer_raw:
+                logging.warning("  ⚠️ GPT 스트리밍 응답이 비어있음 - 폴백 답변 사용")
+                yield 'answer', None
+                return
+            
+            final_answer = self._format_final_answer(ai_answer_raw, lang)
+            logging.info(f"✅ AI 답변 스트리밍 생성 완료: 최종 답변 길이={len(final_answer)}자")
+            yield 'answer', final_answer
+                
+        except Exception as e:
+            logging.error(f"❌ AI 답변 스트리밍 생성 실패: {str(e)}")
+            yield 'answer', None
     
     def _create_prompts(self, corrected_text: str, intent_analysis: Dict, context: str) -> tuple:
         """프롬프트 생성 (한국어 전용)"""
         
-        system_prompt = """You are an AI customer service agent for GOODTV Bible Apple (바이블 애플), a Korean Christian Bible app.
-
-    YOUR ROLE:
-    1. Provide accurate, helpful answers to customer inquiries
-    2. Use the provided reference answers as your PRIMARY guidance
-    3. Only discuss features and functions that actually exist in the Bible Apple app
-
-    ANSWER CONSTRUCTION RULES:
-    1. PRIMARY PRINCIPLE: Stay faithful to the reference answers' content and solutions
-    2. ANALYZE CAREFULLY: Understand the customer's corrected question and core intent deeply
-    3. ADAPTATION: If the customer's specific situation differs from the reference answers:
-    - Adapt the solution appropriately while maintaining the same tone and style
-    - Keep the fundamental approach and problem-solving structure from references
-    4. TONE CONSISTENCY: Match the tone, formality level, and speaking style of the reference answers
-
-    CRITICAL WRITING STYLE:
-    ✓ Write in NATURAL, FLOWING PARAGRAPHS - avoid numbered lists and bullet points
-    ✓ Present information in a LOGICAL, EASY-TO-FOLLOW order
-    ✓ Be CONCISE - eliminate redundancy and unnecessary details
-    ✓ Lead with the CORE MESSAGE, then add supporting details only if essential
-    ✓ Use numbered steps ONLY for technical troubleshooting guides
-    ✓ Maintain NATURAL CONTEXT FLOW throughout the response
+        system_prompt = _SYSTEM_PROMPT  # 고정 상수 (프롬프트 접두어 캐싱 유지)
 
-    WHAT TO AVOID:
-    ❌ Excessive procedural breakdowns (e.g., "1단계:", "2단계:", "3단계:")
-    ❌ Repetitive explanations of the same information
-    ❌ Overly detailed step-by-step instructions for simple matters
-    ❌ Asking users to prepare excessive information (screenshots, version numbers, etc.)
-    ❌ Making answers longer than necessary
+        user_prompt = f"""Question: {corrected_text}
+Intent: {intent_analysis.get('core_intent', '일반 문의')} ({intent_analysis.get('intent_category', '일반')})
 
-    CRITICAL OUTPUT REQUIREMENTS:
-    ⚠️ Write ONLY the main content body
-    ⚠️ NO greetings (안녕하세요, etc.)
-    ⚠️ NO closings (감사합니다, 평안하세요, etc.)
-    ⚠️ The system will automatically add standard greetings and closings
-    ⚠️ Your response MUST be in KOREAN (한국어)"""
-
-        user_prompt = f"""CUSTOMER INQUIRY ANALYSIS:
-    - Corrected Question: {corrected_text}
-    - Core Intent: {intent_analysis.get('core_intent', '일반 문의')}
-    - Intent Category: {intent_analysis.get('intent_category', '일반')}
-
-    REFERENCE ANSWERS (use these as your primary guidance):
-    {context}
-
-    TASK:
-    Create a response that addresses the customer's inquiry based on the reference answers.
-
-    RESPONSE GUIDELINES:
-    1. Understand what the customer actually needs
-    2. Use reference answers' solutions as your foundation
-    3. Adapt if needed while maintaining the same tone and approach
-    4. Write in natural paragraphs with logical flow
-
-    WRITING REQUIREMENTS:
-    ✓ Korean language (한국어)
-    ✓ Body content only - NO greetings or closings
-    ✓ Concise and specific
-    ✓ Natural paragraph format (avoid lists unless technical troubleshooting)
-    ✓ No redundancy
-
-    ❌ DO NOT include: 안녕하세요, 감사합니다, 평안하세요, etc.
-    ❌ DO NOT create excessive numbered lists or procedural breakdowns
-    ❌ DO NOT repeat information unnecessarily
-    ❌ DO NOT promise features that don't exist"""
+Reference answers:
+{context}"""
 
         return system_prompt, user_prompt
 
@@ -264,7 +325,7 @@ class AIAnswerGenerator:
                     f"{answer_text[:500]}..."
                 )
                 
-                logging.info(f"  - 참고답변 {i}: 유사도={score:.3f}, 길이={len(answer_text)}자, 카테고리={category}")
+                logging.debug(f"  - 참고답변 {i}: 유사도={score:.3f}, 길이={len(answer_text)}자, 카테고리={category}")
         
         if not context_parts:
             logging.warning("  ⚠️ 유효한 참고답변 없음")
@@ -274,29 +335,18 @@ class AIAnswerGenerator:
     
     def _remove_greetings_from_reference(self, text: str) -> str:
         """참고답변에서만 인사말과 끝맺음말 제거 (컨텍스트 구성용)"""
-        greeting_patterns = [
-            r'^안녕하세요[^.]*\.\s*',
-            r'^GOODTV\s+바이블\s*애플[^.]*\.\s*',
-            r'^바이블\s*애플[^.]*\.\s*',
-            r'바이블\s*애플을\s*이용해주셔서\s*감사드립니다\.\s*',
-        ]
-        
-        closing_patterns = [
-            r'\s*감사합니다[^.]*\.?\s*$',
-            r'\s*평안하세요[^.]*\.?\s*$',
-            r'\s*주님\s*안에서[^.]*\.?\s*$',
-            r'\s*항상\s*성도님[^.]*\.?\s*$',
-        ]
-        
-        for pattern in greeting_patterns + closing_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        for _ in range(_MAX_STRIP_PASSES):
+            stripped = _REFERENCE_GREETING_CLOSING_RE.sub('', text)
+            if stripped == text:
+                break
+            text = stripped
         
         return text.strip()
     
     def _format_final_answer(self, ai_content: str, lang: str) -> str:
         """Quill 에디터에 최적화된 HTML 포맷팅"""
         
-        logging.info("  [포맷팅] Quill 최적화 HTML 생성 시작")
+        logging.debug("  [포맷팅] Quill 최적화 HTML 생성 시작")
         
         # 1. 참고답변에서 혹시 모를 인사말/끝맺음말 제거
         ai_content = self._remove_greetings_from_reference(ai_content)
@@ -321,63 +371,19 @@ class AIAnswerGenerator:
                     continue
                 
                 # 번호 목록 강조
-                line = re.sub(r'^(\d+)\.\s+', r'<strong>\1.</strong> ', line)
+                line = _RE_NUMBERED_ITEM.sub(r'<strong>\1.</strong> ', line)
                 
                 paragraphs.append(f"<p>{line}</p>")
         
-        # 3. 단락들을 빈 줄로 구분
-        body = ""
-        for i, para in enumerate(paragraphs):
-            body += para
-            # 단락 사이에 빈 줄 추가 (마지막 제외)
-            if i < len(paragraphs) - 1:
-                body += "<p><br></p>"
-        
-        # 4. AI 답변 안내 및 인사말
-        ai_notice = "<p>(AI가 작성한 답변입니다. 답변완료 시, 이 문구를 꼭 삭제해주세요.)</p><p><br></p>"
-        greeting = (
-            "<p>안녕하세요, 바이블 애플입니다. "
-            "바이블 애플을 이용해 주셔서 감사합니다.</p>"
-            "<p><br></p>"
-        )
-        
-        # 5. 끝맺음말
-        closing = (
-            "<p><br></p>"
-            "<p>항상 성도님께 좋은 성경앱을 제공하기 위해 노력하는 "
-            "바이블 애플이 되겠습니다.</p>"
-            "<p><br></p>"
-            "<p>감사합니다. 주님 안에서 평안하세요.</p>"
-        )
-        
-        return  greeting + body + closing + ai_notice
+        # 3. 단락들을 빈 줄로 구분하고 인사말, 끝맺음말, AI 답변 안내와 한 번에 결합
+        return ''.join((
+            _GREETING_HTML,
+            _PARAGRAPH_BREAK_HTML.join(paragraphs),
+            _CLOSING_HTML,
+            _AI_NOTICE_HTML
+        ))
     
     def _get_fallback_answer(self) -> str:
         """오류 시 기본 답변 (인사말/끝맺음말 포함)"""
         logging.warning("폴백 답변 생성")
-        
-        ai_notice = "<p>(AI가 작성한 답변입니다. 답변완료 시, 이 문구를 꼭 삭제해주세요.)</p><p><br></p>"
-        greeting = (
-            "<p>안녕하세요, 바이블 애플입니다. "
-            "바이블 애플을 이용해 주셔서 감사합니다.</p>"
-            "<p><br></p>"
-        )
-        
-        body = (
-            "<p>남겨주신 문의는 현재 담당자가 직접 확인하고 있습니다.</p>"
-            "<p><br></p>"
-            "<p>성도님께 도움이 될 수 있도록 내용을 꼼꼼히 살펴보고 "
-            "정확하고 구체적인 답변을 준비하겠습니다.</p>"
-            "<p><br></p>"
-            "<p>답변은 최대 하루 이내에 드릴 예정이오니 "
-            "조금만 기다려 주시면 감사하겠습니다.</p>"
-        )
-        
-        closing = (
-            "<p><br></p>"
-            "<p>항상 성도님께 좋은 성경앱을 제공하기 위해 노력하는 바이블 애플이 되겠습니다.</p>"
-            "<p><br></p>"
-            "<p>감사합니다. 주님 안에서 평안하세요.</p>"
-        )
-        
-        return  greeting + body + closing + ai_notice
\ No newline at end of file
+        return _FALLBACK_ANSWER_HTML
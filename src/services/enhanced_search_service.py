@@ -9,10 +9,12 @@
 
 import logging
 import time
+from operator import itemgetter
 from typing import List, Dict, Optional
 from openai import OpenAI
-import pinecone
-from src.utils.memory_manager import memory_cleanup
+
+# 검색 결과 정렬 키 (호출마다 lambda를 만들지 않도록 모듈 상수로 유지)
+_score_key = itemgetter('score')
 
 
 class EnhancedPineconeSearchService:
@@ -35,7 +37,8 @@ class EnhancedPineconeSearchService:
                                    intent_analysis: Dict, 
                                    original_query: str,
                                    lang: str = 'ko',
-                                   top_k: int = 3) -> List[Dict]:
+                                   top_k: int = 3,
+                                   query_vector: Optional[List[float]] = None) -> List[Dict]:
         """
         Original Query만 사용한 단순화된 검색
         
@@ -44,37 +47,38 @@ class EnhancedPineconeSearchService:
             original_query: 오타 수정된 원본 쿼리 (이것만 사용)
             lang: 언어 코드
             top_k: 반환할 상위 결과 수
+            query_vector: original_query의 임베딩 (이미 계산된 경우 임베딩 API 호출 생략)
             
         Returns:
             List[Dict]: 유사도 순으로 정렬된 검색 결과
         """
         try:
-            with memory_cleanup():
-                logging.info(f"==================== Original Query Only Search 시작 ====================")
-                logging.info(f"검색 쿼리: '{original_query}'")
-                logging.info(f"언어: {lang}, 상위 결과 수: {top_k}")
-                
-                # 빈 쿼리 체크
-                if not original_query or not original_query.strip():
-                    logging.warning("검색 쿼리가 비어있음")
-                    return []
-                
-                # 단일 검색 수행 (Original Query만 사용)
-                search_results = self._perform_simple_search(
-                    query=original_query,
-                    top_k=top_k
-                )
-                
-                # 결과에 메타데이터 추가
-                final_results = self._add_metadata_to_results(
-                    search_results, 
-                    original_query,
-                    intent_analysis  # 로깅 목적으로만 사용
-                )
-                
-                logging.info(f"Original Query Only Search 완료: {len(final_results)}개 결과 반환")
-                return final_results
-                
+            logging.info(f"==================== Original Query Only Search 시작 ====================")
+            logging.info(f"검색 쿼리: '{original_query}'")
+            logging.info(f"언어: {lang}, 상위 결과 수: {top_k}")
+            
+            # 빈 쿼리 체크
+            if not original_query or not original_query.strip():
+                logging.warning("검색 쿼리가 비어있음")
+                return []
+            
+            # 단일 검색 수행 (Original Query만 사용)
+            search_results = self._perform_simple_search(
+                query=original_query,
+                top_k=top_k,
+                query_vector=query_vector
+            )
+            
+            # 결과에 메타데이터 추가
+            final_results = self._add_metadata_to_results(
+                search_results, 
+                original_query,
+                intent_analysis  # 로깅 목적으로만 사용
+            )
+            
+            logging.info(f"Original Query Only Search 완료: {len(final_results)}개 결과 반환")
+            return final_results
+            
         except Exception as e:
             logging.error(f"검색 실패: {str(e)}")
             logging.error(f"실패 상세 - 쿼리: '{original_query}', 오류 타입: {type(e).__name__}")
@@ -82,27 +86,34 @@ class EnhancedPineconeSearchService:
     
     def _perform_simple_search(self, 
                                query: str,
-                               top_k: int) -> List[Dict]:
+                               top_k: int,
+                               query_vector: Optional[List[float]] = None) -> List[Dict]:
         """
         단순 검색 수행 (1번 임베딩 + 1번 Pinecone 검색)
         
         Args:
             query: 검색할 텍스트
             top_k: 반환할 결과 수
+            query_vector: query의 임베딩 (있으면 임베딩 생성 생략)
             
         Returns:
             List[Dict]: 검색 결과
         """
         try:
-            # 1단계: 임베딩 생성
-            embedding_start = time.time()
-            embedding_response = self.openai_client.embeddings.create(
-                model=self.embedding_model,
-                input=query
-            )
-            query_embedding = embedding_response.data[0].embedding
-            embedding_time = time.time() - embedding_start
-            logging.info(f"임베딩 생성 완료: {embedding_time:.3f}초")
+            # 1단계: 임베딩 생성 (호출자가 이미 계산한 벡터가 있으면 재사용)
+            if query_vector is not None:
+                query_embedding = query_vector
+                embedding_time = 0.0
+                logging.info("임베딩 재사용: 호출자가 전달한 질문 벡터 사용")
+            else:
+                embedding_start = time.time()
+                embedding_response = self.openai_client.embeddings.create(
+                    model=self.embedding_model,
+                    input=query
+                )
+                query_embedding = embedding_response.data[0].embedding
+                embedding_time = time.time() - embedding_start
+                logging.info(f"임베딩 생성 완료: {embedding_time:.3f}초")
             
             # 2단계: Pinecone 검색
             search_start = time.time()
@@ -133,9 +144,9 @@ class EnhancedPineconeSearchService:
                     }
                     results.append(result)
                     
-                    # 상위 3개 결과 로깅
+                    # 상위 3개 결과 로깅 (답변 전문 포함이므로 DEBUG)
                     if i <= 3:
-                        logging.info(f"검색결과 #{i}: id={result['id']}, "
+                        logging.debug(f"검색결과 #{i}: id={result['id']}, "
                                 f"score={result['score']:.4f}, "
                                 f"category='{result['category']}', "
                                 f"answer='{result['answer']}'") 
@@ -190,7 +201,7 @@ class EnhancedPineconeSearchService:
                 enhanced_results.append(result)
             
             # 유사도 점수 기준 정렬 (확실히 하기 위해)
-            enhanced_results.sort(key=lambda x: x['score'], reverse=True)
+            enhanced_results.sort(key=_score_key, reverse=True)
             
             return enhanced_results
             
@@ -10,9 +10,226 @@
 import re
 import logging
 from typing import Dict, List, Any
-from src.utils.memory_manager import memory_cleanup
 from src.utils.text_preprocessor import TextPreprocessor
 
+# ===== 텍스트 유효성 검증용 정규식 패턴 (모듈 로드시 한 번만 컴파일) =====
+_RE_REPEATED_CHAR = re.compile(r'(.)\1{5,}')       # 같은 문자 6회 이상 연속
+_RE_LONG_LATIN_WORD = re.compile(r'[a-zA-Z]{8,}')   # 8자 이상 영어 단어
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+
+# GPT 할루시네이션 방지 - 무의미한 패턴 (첫 줄에 러시아어/그리스어 문자 포함)
+# 순수 영어/기호/숫자 패턴(^[...]+$)은 한글이 한 글자라도 있으면 일치할 수 없으므로
+# 한국어 비율 검사(한글 1자 이상 보장)를 통과한 텍스트에는 이 패턴만 검사하면 됨
+_RE_FOREIGN_SCRIPT = re.compile(r'.*[а-яα-ω]', re.IGNORECASE)
+
+# ===== 문자 종류 분류 테이블 (str.translate 한 번으로 한글/영문/전체 글자 수 집계) =====
+# 한글 음절 → '\x01', 영문 → '\x02', 공백(\s와 동일한 유니코드 공백) → 삭제, 나머지 → 그대로
+_CLASS_HANGUL = '\x01'
+_CLASS_LATIN = '\x02'
+_CHAR_CLASS_TABLE = {i: _CLASS_HANGUL for i in range(ord('가'), ord('힣') + 1)}
+_CHAR_CLASS_TABLE.update((ord(c), _CLASS_LATIN) for c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_CHAR_CLASS_TABLE.update({ord(_CLASS_HANGUL): '\x03', ord(_CLASS_LATIN): '\x03'})  # 원문의 표식 문자 충돌 방지
+_CHAR_CLASS_TABLE.update((i, None) for i in range(0x3001) if chr(i).isspace())
+
+
+# 텍스트의 문자 종류별 개수를 한 번의 순회로 집계
+# Args:
+#     text: 분석할 텍스트
+# Returns:
+#     tuple: (한글 글자 수, 영문 글자 수, 공백 제외 전체 글자 수)
+def _count_char_classes(text: str) -> tuple:
+    classes = text.translate(_CHAR_CLASS_TABLE)
+    return classes.count(_CLASS_HANGUL), classes.count(_CLASS_LATIN), len(classes)
+
+# ===== 빈 약속 감지용 정규식 패턴 (모듈 로드시 한 번만 컴파일) =====
+# 위험한 약속 표현들 (이후 실제 내용이 와야 함) - 표현별 등장 횟수를 세므로 개별 컴파일
+_KO_PROMISE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'안내[해]*드리겠습니다',
+    r'도움[을이]?\s*드리겠습니다',
+    r'방법[을이]?\s*안내[해]*드리겠습니다',
+    r'설명[해]*드리겠습니다',
+    r'알려[드리겠드릴]',
+    r'제공[해]*드리겠습니다',
+    r'도와[드리겠드릴]',
+    r'찾아[드리겠드릴]',
+))
+_EN_PROMISE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'will\s+guide\s+you',
+    r'will\s+help\s+you',
+    r'will\s+show\s+you',
+    r'will\s+provide',
+    r'let\s+me\s+help',
+    r'here[\'\"]s\s+how',
+))
+
+# 실제 내용을 나타내는 패턴들 - 하나라도 있으면 되므로 하나의 대안 정규식으로 결합 (한 번의 스캔)
+_KO_CONTENT_RE = re.compile('|'.join('(?:%s)' % pattern for pattern in (
+    r'\d+\.\s*',                    # 번호 매기기 (1., 2., ...)
+    r'먼저',                          # 단계별 설명 시작
+    r'다음과?\s*같[은이]',                # 구체적 방법 제시
+    r'[메뉴설정화면버튼]',                  # 구체적 UI 요소
+    r'클릭|터치|선택|이동',                 # 구체적 행동
+    r'NIV|KJV|ESV',                 # 구체적 번역본
+    r'상단|하단|좌측|우측',                 # 구체적 위치
+    r'설정에서|메뉴에서',                   # 구체적 경로
+    r'다음\s*[순서단계방법절차]',             # 단계별 안내
+    r'[0-9]+[번째단계]',                # 순서 표시
+    r'화면\s*[상하좌우중앙]',               # 위치 설명
+)), re.IGNORECASE)
+_EN_CONTENT_RE = re.compile('|'.join('(?:%s)' % pattern for pattern in (
+    r'\d+\.\s*',
+    r'first|second|third',
+    r'step\s+\d+',
+    r'click|tap|select',
+    r'menu|setting|screen',
+    r'NIV|KJV|ESV',
+    r'top|bottom|left|right',
+)), re.IGNORECASE)
+
+# 끝맺음말 (약속 이후 실제 내용 길이 계산시 제외) - 하나의 대안 정규식으로 한 번에 제거
+_CLOSING_IN_RE = re.compile(r'항상\s*성도님께[^.]*\.|감사합니다[^.]*\.|주님\s*안에서[^.]*\.|평안하세요[^.]*\.', re.IGNORECASE)
+
+# ===== 의미있는 내용 비율 계산용 불용구 패턴 (순서대로 하나씩 제거하므로 개별 컴파일) =====
+_KO_FILLER_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'안녕하세요[^.]*\.',                              # 인사말
+    r'감사[드립]*니다[^.]*\.',                         # 감사 인사
+    r'평안하세요[^.]*\.',                              # 마무리 인사
+    r'주님\s*안에서[^.]*\.',                           # 종교적 인사
+    r'바이블\s*애플[^.]*\.',                           # 앱 이름 언급
+    r'GOODTV[^.]*\.',                                # 회사명 언급
+    r'문의[해주셔서]*\s*감사[^.]*\.',                   # 문의 감사
+    r'안내[해]*드리겠습니다[^.]*\.',                    # 안내 약속
+    r'도움이\s*[되]*[시]*[길]*[바라]*[며]*[^.]*\.',      # 도움 희망
+    r'항상[^.]*바이블\s*애플[^.]*\.',                  # 마무리 멘트
+))
+_EN_FILLER_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Hello[^.]*\.',                                  # 인사말
+    r'Thank you[^.]*\.',                              # 감사 인사
+    r'Best regards[^.]*\.',                           # 마무리 인사
+    r'God bless[^.]*\.',                              # 종교적 인사
+    r'Bible App[^.]*\.',                              # 앱 이름 언급
+    r'GOODTV[^.]*\.',                                # 회사명 언급
+    r'We will[^.]*\.',                                # 약속 표현
+    r'Please contact[^.]*\.',                         # 연락 요청
+))
+_RE_WHITESPACE = re.compile(r'\s+')
+
+# ===== 문장 완성도 검사용 문장 끝 표시 =====
+_KO_SENTENCE_ENDING_RE = re.compile(r'[.!?니다요음됩다음까다하세요습니다니까]')
+_KO_FINAL_ENDING_RE = re.compile(r'[.!?니다요음됩다음까다하세요습니다니까]\s*$')
+_EN_SENTENCE_ENDING_RE = re.compile(r'[.!?]')
+_EN_FINAL_ENDING_RE = re.compile(r'[.!?]\s*$')
+
+# ===== 답변 구체성 검사용 패턴 (패턴별 등장 횟수를 세므로 개별 컴파일) =====
+# 구체적 정보 패턴 (한국어)
+_KO_SPECIFIC_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\d+[가지개단계번째차례]',  # 숫자가 포함된 단계
+    r'[메뉴설정화면버튼탭]에서',    # 구체적 위치
+    r'다음과\s*같[은이]',         # 구체적 방법 제시
+    r'[클릭선택터치누르]',         # 구체적 동작
+    r'[방법단계절차과정]',         # 구체적 프로세스
+    r'\w+\s*버튼',               # 버튼명
+    r'\w+\s*메뉴',               # 메뉴명
+    r'NIV|KJV|ESV|번역본',       # 구체적 번역본
+    r'[상하좌우]단[에의]',         # 구체적 위치
+    r'설정[에서으로]',            # 설정 관련
+    r'화면\s*[상하좌우중앙]',      # 화면 위치
+    r'탭하여|클릭하여|터치하여',    # 구체적 행동
+    r'다음\s*순서',              # 순서 안내
+    r'먼저|그다음|마지막으로',      # 단계별 안내
+))
+# 빈 약속/모호한 표현 패턴 (한국어)
+_KO_VAGUE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'안내[해]*드리겠습니다',
+    r'도움[을이]\s*드리겠습니다',
+    r'확인[하고하여해서]',
+    r'검토[하고하여]',
+    r'준비[하고하겠습니다]',
+    r'전달[하고하겠드리겠]',
+    r'제공[하고하겠드리겠]',
+    r'노력[하고하겠]',
+    r'살펴[보고보겠]',
+    r'방법[을이]\s*찾아[드리겠보겠]',
+))
+# 구체적 정보 / 모호한 표현 패턴 (영어)
+_EN_SPECIFIC_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\d+\s*steps?',
+    r'follow\s+these',
+    r'click\s+on',
+    r'go\s+to',
+    r'select\s+\w+',
+    r'settings?\s+menu',
+    r'NIV|KJV|ESV|translation',
+    r'top\s+of\s+screen',
+    r'button\s+\w+',
+))
+_EN_VAGUE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'we\s+will\s+review',
+    r'we\s+are\s+working',
+    r'please\s+contact',
+    r'will\s+be\s+available',
+))
+
+# ===== 할루시네이션 감지용 패턴 (감지된 패턴을 로그/결과에 남기므로 개별 컴파일) =====
+# 외부 앱 추천 (치명적 오류)
+_EXTERNAL_APP_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Parallel\s*Bible',                           # 외부 성경 앱명
+    r'병렬\s*성경\s*앱',                             # 외부 앱 언급
+    r'다른\s*앱을?\s*(다운로드|설치)',                # 다른 앱 설치 유도
+    r'앱\s*스토어에서\s*(검색|다운로드)',             # 앱스토어 유도
+    r'구글\s*플레이\s*스토어',                       # 외부 스토어 언급
+    r'외부\s*(앱|어플리케이션)',                     # 명시적 외부 앱
+    r'별도[의]*\s*(앱|어플)',                       # 별도 앱 언급
+    r'추가로\s*(앱을|어플을)\s*설치',                # 추가 앱 설치 유도
+))
+# 존재하지 않는 기능 안내 (알림 세부 설정 → 설정 메뉴 경로 → 고급 기능 순서로 검사)
+_INVALID_FEATURE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # 1. 존재하지 않는 알림 세부 설정 기능들
+    r'주일에만\s*(알림|예배\s*알림).*설정',
+    r'요일별.*알림.*설정',
+    r'특정\s*요일.*알림.*받기',
+    r'월요일|화요일|수요일|목요일|금요일|토요일|일요일.*만.*알림',
+    r'주중|주말.*만.*알림.*설정',
+    r'시간대별.*알림.*커스터마이징',
+    r'개별.*요일.*선택.*알림',
+    # 2. 존재하지 않는 설정 메뉴 경로들
+    r'설정.*메뉴에서.*"?주일"?.*선택',
+    r'알림.*설정.*"?요일"?.*선택',
+    r'주일.*옵션.*선택하고.*저장',
+    r'요일.*설정.*메뉴.*들어가서',
+    r'"?주일\s*알림"?.*항목.*찾아서',
+    r'주일.*체크박스.*선택',
+    r'요일별.*체크.*해제',
+    # 3. 존재하지 않는 고급 기능들
+    r'맞춤형.*알림.*스케줄.*설정',
+    r'개인화된.*알림.*시간.*조정',
+    r'세밀한.*알림.*옵션.*설정',
+    r'고급.*알림.*설정.*메뉴',
+    r'상세.*알림.*커스터마이징',
+    r'알림.*빈도.*세부.*조정',
+))
+# 주일 알림 관련 질문 감지 및 해당 질문에 대한 잘못된 답변 패턴
+_SUNDAY_NOTIFICATION_QUERY_RE = re.compile(r'주일.*만.*알림|주일.*예배.*알림', re.IGNORECASE)
+_SUNDAY_NOTIFICATION_ANSWER_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'주일.*선택하고.*저장.*버튼',
+    r'주일.*체크.*표시.*하세요',
+    r'주일.*옵션.*활성화.*하면',
+    r'주일.*설정.*완료.*하세요',
+))
+# 실제 앱에 없는 UI 요소 언급
+_INVALID_UI_ELEMENT_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'"?주일"?.*버튼.*눌러',
+    r'"?요일.*선택"?.*메뉴',
+    r'"?주일.*알림"?.*체크박스',
+    r'"?요일별.*설정"?.*옵션',
+    r'주일.*드롭다운.*메뉴',
+))
+# 위 패턴 묶음을 하나의 대안 정규식으로 합친 것 - 매칭 여부는 한 번의 검색으로 확인하고,
+# 어떤 패턴인지는 매칭되었을 때만 개별 패턴으로 다시 찾음 (로그용)
+_INVALID_FEATURE_RE = re.compile('|'.join(f'(?:{rx.pattern})' for rx in _INVALID_FEATURE_RES), re.IGNORECASE)
+_SUNDAY_NOTIFICATION_ANSWER_RE = re.compile('|'.join(f'(?:{rx.pattern})' for rx in _SUNDAY_NOTIFICATION_ANSWER_RES), re.IGNORECASE)
+_INVALID_UI_ELEMENT_RE = re.compile('|'.join(f'(?:{rx.pattern})' for rx in _INVALID_UI_ELEMENT_RES), re.IGNORECASE)
+
 # ===== AI 답변 품질 검증을 담당하는 메인 클래스 =====
 class QualityValidator:
     
@@ -52,8 +269,8 @@ class QualityValidator:
             return False
         
         # ===== 2단계: 한국어 문자 비율 계산 =====
-        korean_chars = len(re.findall(r'[가-힣]', text))       # 한글 문자 개수
-        total_chars = len(re.sub(r'\s', '', text))             # 공백 제외 전체 문자
+        # 한글 문자 개수, 공백 제외 전체 문자 (한 번의 순회로 집계)
+        korean_chars, _, total_chars = _count_char_classes(text)
         
         if total_chars == 0:
             logging.info("한국어 검증 실패: 총 글자 수가 0")
@@ -68,30 +285,20 @@ class QualityValidator:
             return False
         
         # ===== 4단계: GPT 할루시네이션 방지 - 무의미한 패턴 감지 =====
-        meaningless_patterns = [
-            r'^[a-z\s\.,;:\(\)\[\]\-_&\/\'"]+$',             # 순수 영어 소문자
-            r'^[A-Z\s\.,;:\(\)\[\]\-_&\/\'"]+$',             # 순수 영어 대문자
-            r'^[\s\.,;:\(\)\[\]\-_&\/\'"]+$',                # 공백/기호만
-            r'^[0-9\s\.,;:\(\)\[\]\-_&\/\'"]+$',             # 숫자/기호만
-            r'.*[а-я].*',                                    # 러시아어 문자
-            r'.*[α-ω].*',                                    # 그리스어 문자
-        ]
-        
-        for pattern in meaningless_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                logging.info(f"한국어 검증 실패: 무의미한 패턴 감지")
-                return False
+        # 한글이 포함되어 있으므로 순수 영어/기호/숫자 패턴은 검사할 필요 없음
+        if _RE_FOREIGN_SCRIPT.match(text):
+            logging.info(f"한국어 검증 실패: 무의미한 패턴 감지")
+            return False
         
         # ===== 5단계: 반복 문자 오류 감지 =====
         # 같은 문자가 5번 이상 연속으로 나타나면 비정상 텍스트로 간주
-        if re.search(r'(.)\1{5,}', text):
+        if _RE_REPEATED_CHAR.search(text):
             logging.info("한국어 검증 실패: 반복 문자 감지")
             return False
         
         # ===== 6단계: 영어 단어 길이 검사 (GPT 오류 방지) =====
         # 긴 영어 단어가 있으면서 한국어 비율이 낮으면 오류로 판단
-        random_pattern = r'[a-zA-Z]{8,}'                     # 8자 이상 영어 단어
-        if re.search(random_pattern, text) and korean_ratio < 0.3:
+        if _RE_LONG_LATIN_WORD.search(text) and korean_ratio < 0.3:
             logging.info(f"한국어 검증 실패: 긴 영어 단어와 낮은 한국어 비율")
             return False
         
@@ -110,8 +317,8 @@ class QualityValidator:
             return False
         
         # ===== 2단계: 영어 문자 비율 계산 =====
-        english_chars = len(re.findall(r'[a-zA-Z]', text))    # 영문 문자 개수
-        total_chars = len(re.sub(r'\s', '', text))            # 공백 제외 전체 문자
+        # 영문 문자 개수, 공백 제외 전체 문자 (한 번의 순회로 집계)
+        _, english_chars, total_chars = _count_char_classes(text)
         
         if total_chars == 0:
             return False
@@ -123,7 +330,7 @@ class QualityValidator:
             return False
         
         # ===== 4단계: 반복 문자 오류 감지 =====
-        if re.search(r'(.)\1{5,}', text):
+        if _RE_REPEATED_CHAR.search(text):
             return False
         
         # ===== 5단계: 검증 완료 =====
@@ -193,45 +400,20 @@ class QualityValidator:
             return 0.0
             
         # ===== 2단계: HTML 태그 제거 =====
-        clean_text = re.sub(r'<[^>]+>', '', text)
+        clean_text = _RE_HTML_TAG.sub('', text)
         
-        # ===== 3단계: 언어별 불용구 패턴 정의 =====
-        if lang == 'ko':
-            # 한국어 인사말/끝맺음말 패턴
-            filler_patterns = [
-                r'안녕하세요[^.]*\.',                              # 인사말
-                r'감사[드립]*니다[^.]*\.',                         # 감사 인사
-                r'평안하세요[^.]*\.',                              # 마무리 인사
-                r'주님\s*안에서[^.]*\.',                           # 종교적 인사
-                r'바이블\s*애플[^.]*\.',                           # 앱 이름 언급
-                r'GOODTV[^.]*\.',                                # 회사명 언급
-                r'문의[해주셔서]*\s*감사[^.]*\.',                   # 문의 감사
-                r'안내[해]*드리겠습니다[^.]*\.',                    # 안내 약속
-                r'도움이\s*[되]*[시]*[길]*[바라]*[며]*[^.]*\.',      # 도움 희망
-                r'항상[^.]*바이블\s*애플[^.]*\.'                   # 마무리 멘트
-            ]
-        else:
-            # 영어 인사말/끝맺음말 패턴
-            filler_patterns = [
-                r'Hello[^.]*\.',                                  # 인사말
-                r'Thank you[^.]*\.',                              # 감사 인사
-                r'Best regards[^.]*\.',                           # 마무리 인사
-                r'God bless[^.]*\.',                              # 종교적 인사
-                r'Bible App[^.]*\.',                              # 앱 이름 언급
-                r'GOODTV[^.]*\.',                                # 회사명 언급
-                r'We will[^.]*\.',                                # 약속 표현
-                r'Please contact[^.]*\.'                          # 연락 요청
-            ]
+        # ===== 3단계: 언어별 불용구 패턴 선택 =====
+        filler_patterns = _KO_FILLER_RES if lang == 'ko' else _EN_FILLER_RES
         
         # ===== 4단계: 불용구 제거 =====
         for pattern in filler_patterns:
-            clean_text = re.sub(pattern, '', clean_text, flags=re.IGNORECASE)
+            clean_text = pattern.sub('', clean_text)
         
         # ===== 5단계: 공백 정리 =====
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+        clean_text = _RE_WHITESPACE.sub(' ', clean_text).strip()
         
         # ===== 6단계: 의미있는 내용 비율 계산 =====
-        original_length = len(re.sub(r'<[^>]+>', '', text).strip())    # 원본 길이
+        original_length = len(_RE_HTML_TAG.sub('', text).strip())    # 원본 길이
         meaningful_length = len(clean_text)                             # 정제 후 길이
         
         if original_length == 0:
@@ -247,24 +429,23 @@ class QualityValidator:
             return 0.0
             
         # HTML 태그 제거
-        clean_text = re.sub(r'<[^>]+>', '', text).strip()
+        clean_text = _RE_HTML_TAG.sub('', text).strip()
         
         if len(clean_text) < 5:
             return 0.0
         
         # 문장 끝 표시 확인
         if lang == 'ko':
-            sentence_endings = r'[.!?니다요음됩다음까다하세요습니다니까]'
+            final_ending_re, ending_re = _KO_FINAL_ENDING_RE, _KO_SENTENCE_ENDING_RE
         else:
-            sentence_endings = r'[.!?]'
+            final_ending_re, ending_re = _EN_FINAL_ENDING_RE, _EN_SENTENCE_ENDING_RE
         
         # 마지막 문장이 완성되어 있는지 확인
-        if re.search(sentence_endings + r'\s*$', clean_text):
+        if final_ending_re.search(clean_text):
             return 1.0
         
-        # 중간에 완성된 문장이 있는지 확인
-        sentences = re.split(sentence_endings, clean_text)
-        if len(sentences) > 1:
+        # 중간에 완성된 문장이 있는지 확인 (문장 끝 표시로 나뉘는지 = 하나라도 있는지)
+        if ending_re.search(clean_text):
             return 0.7  # 부분적으로 완성됨
         
         # 문장이 불완전한 경우
@@ -285,66 +466,13 @@ class QualityValidator:
         specificity_score = 0.0
         
         if lang == 'ko':
-            # 구체적 정보 패턴 (한국어) - 더 엄격하게 강화
-            specific_patterns = [
-                r'\d+[가지개단계번째차례]',  # 숫자가 포함된 단계
-                r'[메뉴설정화면버튼탭]에서',    # 구체적 위치
-                r'다음과\s*같[은이]',         # 구체적 방법 제시
-                r'[클릭선택터치누르]',         # 구체적 동작
-                r'[방법단계절차과정]',         # 구체적 프로세스
-                r'\w+\s*버튼',               # 버튼명
-                r'\w+\s*메뉴',               # 메뉴명
-                r'NIV|KJV|ESV|번역본',       # 구체적 번역본
-                r'[상하좌우]단[에의]',         # 구체적 위치
-                r'설정[에서으로]',            # 설정 관련
-                r'화면\s*[상하좌우중앙]',      # 화면 위치
-                r'탭하여|클릭하여|터치하여',    # 구체적 행동
-                r'다음\s*순서',              # 순서 안내
-                r'먼저|그다음|마지막으로'       # 단계별 안내
-            ]
-            
-            # 빈 약속/모호한 표현 패턴 (더 엄격하게)
-            vague_patterns = [
-                r'안내[해]*드리겠습니다',
-                r'도움[을이]\s*드리겠습니다',
-                r'확인[하고하여해서]',
-                r'검토[하고하여]',
-                r'준비[하고하겠습니다]',
-                r'전달[하고하겠드리겠]',
-                r'제공[하고하겠드리겠]',
-                r'노력[하고하겠]',
-                r'살펴[보고보겠]',
-                r'방법[을이]\s*찾아[드리겠보겠]'
-            ]
+            specific_patterns, vague_patterns = _KO_SPECIFIC_RES, _KO_VAGUE_RES
         else:
-            # 구체적 정보 패턴 (영어)
-            specific_patterns = [
-                r'\d+\s*steps?',
-                r'follow\s+these',
-                r'click\s+on',
-                r'go\s+to',
-                r'select\s+\w+',
-                r'settings?\s+menu',
-                r'NIV|KJV|ESV|translation',
-                r'top\s+of\s+screen',
-                r'button\s+\w+'
-            ]
-            
-            vague_patterns = [
-                r'we\s+will\s+review',
-                r'we\s+are\s+working',
-                r'please\s+contact',
-                r'will\s+be\s+available'
-            ]
+            specific_patterns, vague_patterns = _EN_SPECIFIC_RES, _EN_VAGUE_RES
         
         # 구체성 점수 계산
-        specific_count = 0
-        for pattern in specific_patterns:
-            specific_count += len(re.findall(pattern, answer, re.IGNORECASE))
-        
-        vague_count = 0
-        for pattern in vague_patterns:
-            vague_count += len(re.findall(pattern, answer, re.IGNORECASE))
+        specific_count = sum(len(pattern.findall(answer)) for pattern in specific_patterns)
+        vague_count = sum(len(pattern.findall(answer)) for pattern in vague_patterns)
         
         # 구체적 정보가 많고 모호한 표현이 적을수록 높은 점수
         if specific_count > 0:
@@ -361,61 +489,20 @@ class QualityValidator:
             return 0.0
         
         # HTML 태그 제거하여 순수 텍스트로 분석
-        clean_text = re.sub(r'<[^>]+>', '', answer)
+        clean_text = _RE_HTML_TAG.sub('', answer)
         
+        # 언어별 약속 표현 / 실제 내용 패턴 선택
         if lang == 'ko':
-            # 위험한 약속 표현들 (이후 실제 내용이 와야 함)
-            promise_patterns = [
-                r'안내[해]*드리겠습니다',
-                r'도움[을이]?\s*드리겠습니다',
-                r'방법[을이]?\s*안내[해]*드리겠습니다',
-                r'설명[해]*드리겠습니다',
-                r'알려[드리겠드릴]',
-                r'제공[해]*드리겠습니다',
-                r'도와[드리겠드릴]',
-                r'찾아[드리겠드릴]'
-            ]
-            
-            # 실제 내용을 나타내는 패턴들
-            content_patterns = [
-                r'\d+\.\s*',                    # 번호 매기기 (1., 2., ...)
-                r'먼저',                       # 단계별 설명 시작
-                r'다음과?\s*같[은이]',           # 구체적 방법 제시
-                r'[메뉴설정화면버튼]',           # 구체적 UI 요소
-                r'클릭|터치|선택|이동',          # 구체적 행동
-                r'NIV|KJV|ESV',               # 구체적 번역본
-                r'상단|하단|좌측|우측',         # 구체적 위치
-                r'설정에서|메뉴에서',           # 구체적 경로
-                r'다음\s*[순서단계방법절차]',    # 단계별 안내
-                r'[0-9]+[번째단계]',           # 순서 표시
-                r'화면\s*[상하좌우중앙]'        # 위치 설명
-            ]
+            promise_res, content_re = _KO_PROMISE_RES, _KO_CONTENT_RE
         else:  # 영어
-            promise_patterns = [
-                r'will\s+guide\s+you',
-                r'will\s+help\s+you',
-                r'will\s+show\s+you',
-                r'will\s+provide',
-                r'let\s+me\s+help',
-                r'here[\'\"]s\s+how'
-            ]
-            
-            content_patterns = [
-                r'\d+\.\s*',
-                r'first|second|third',
-                r'step\s+\d+',
-                r'click|tap|select',
-                r'menu|setting|screen',
-                r'NIV|KJV|ESV',
-                r'top|bottom|left|right'
-            ]
+            promise_res, content_re = _EN_PROMISE_RES, _EN_CONTENT_RE
         
         # 약속 표현 찾기
         promise_count = 0
         promise_positions = []
         
-        for pattern in promise_patterns:
-            matches = list(re.finditer(pattern, clean_text, re.IGNORECASE))
+        for rx in promise_res:
+            matches = list(rx.finditer(clean_text))
             promise_count += len(matches)
             promise_positions.extend([match.start() for match in matches])
         
@@ -431,18 +518,13 @@ class QualityValidator:
             text_after = clean_text[pos:]
             
             # 끝맺음말 제거하여 실제 내용만 검사
-            text_after = re.sub(r'항상\s*성도님께[^.]*\.', '', text_after, flags=re.IGNORECASE)
-            text_after = re.sub(r'감사합니다[^.]*\.', '', text_after, flags=re.IGNORECASE)
-            text_after = re.sub(r'주님\s*안에서[^.]*\.', '', text_after, flags=re.IGNORECASE)
-            text_after = re.sub(r'평안하세요[^.]*\.', '', text_after, flags=re.IGNORECASE)
+            text_after = _CLOSING_IN_RE.sub('', text_after)
             
             total_text_after_promises += len(text_after.strip())
             
             # 실제 내용 패턴이 있는지 확인
-            for content_pattern in content_patterns:
-                if re.search(content_pattern, text_after, re.IGNORECASE):
-                    content_after_promise += 1
-                    break
+            if content_re.search(text_after):
+                content_after_promise += 1
         
         # 점수 계산
         if promise_count > 0:
@@ -487,26 +569,15 @@ class QualityValidator:
             return issues
         
         # ===== 3단계: 텍스트 정제 (HTML 태그 제거) =====
-        clean_answer = re.sub(r'<[^>]+>', '', answer)
-        clean_query = re.sub(r'<[^>]+>', '', query)
+        clean_answer = _RE_HTML_TAG.sub('', answer)
+        clean_query = _RE_HTML_TAG.sub('', query)
         
         if lang == 'ko':
             # ===== 4단계: 외부 앱 추천 감지 (치명적 오류) =====
-            external_app_patterns = [
-                r'Parallel\s*Bible',                           # 외부 성경 앱명
-                r'병렬\s*성경\s*앱',                             # 외부 앱 언급
-                r'다른\s*앱을?\s*(다운로드|설치)',                # 다른 앱 설치 유도
-                r'앱\s*스토어에서\s*(검색|다운로드)',             # 앱스토어 유도
-                r'구글\s*플레이\s*스토어',                       # 외부 스토어 언급
-                r'외부\s*(앱|어플리케이션)',                     # 명시적 외부 앱
-                r'별도[의]*\s*(앱|어플)',                       # 별도 앱 언급
-                r'추가로\s*(앱을|어플을)\s*설치'                 # 추가 앱 설치 유도
-            ]
-            
-            for pattern in external_app_patterns:
-                if re.search(pattern, clean_answer, re.IGNORECASE):
+            for pattern in _EXTERNAL_APP_RES:
+                if pattern.search(clean_answer):
                     issues['external_app_recommendation'] = True
-                    issues['detected_issues'].append(f"외부 앱 추천 감지: {pattern}")
+                    issues['detected_issues'].append(f"외부 앱 추천 감지: {pattern.pattern}")
                     issues['overall_score'] -= 0.8  # 매우 심각한 감점 (80% 감점)
             
             # ===== 5단계: 번역본 변경/교체 감지 (일관성 위반) =====
@@ -575,74 +646,25 @@ class QualityValidator:
         """존재하지 않는 기능에 대한 잘못된 안내 감지"""
         
         if lang == 'ko':
-            # 1. 존재하지 않는 알림 세부 설정 기능들
-            invalid_notification_patterns = [
-                r'주일에만\s*(알림|예배\s*알림).*설정',
-                r'요일별.*알림.*설정',
-                r'특정\s*요일.*알림.*받기',
-                r'월요일|화요일|수요일|목요일|금요일|토요일|일요일.*만.*알림',
-                r'주중|주말.*만.*알림.*설정',
-                r'시간대별.*알림.*커스터마이징',
-                r'개별.*요일.*선택.*알림'
-            ]
-            
-            # 2. 존재하지 않는 설정 메뉴 경로들
-            invalid_menu_patterns = [
-                r'설정.*메뉴에서.*"?주일"?.*선택',
-                r'알림.*설정.*"?요일"?.*선택',
-                r'주일.*옵션.*선택하고.*저장',
-                r'요일.*설정.*메뉴.*들어가서',
-                r'"?주일\s*알림"?.*항목.*찾아서',
-                r'주일.*체크박스.*선택',
-                r'요일별.*체크.*해제'
-            ]
-            
-            # 3. 존재하지 않는 고급 기능들
-            invalid_advanced_patterns = [
-                r'맞춤형.*알림.*스케줄.*설정',
-                r'개인화된.*알림.*시간.*조정',
-                r'세밀한.*알림.*옵션.*설정',
-                r'고급.*알림.*설정.*메뉴',
-                r'상세.*알림.*커스터마이징',
-                r'알림.*빈도.*세부.*조정'
-            ]
-            
-            # 4. 특정 질문 유형별 존재하지 않는 기능들
-            query_specific_patterns = []
-            
-            # 주일 알림 관련 질문에 대한 잘못된 답변 패턴
-            if re.search(r'주일.*만.*알림|주일.*예배.*알림', query, re.IGNORECASE):
-                query_specific_patterns.extend([
-                    r'주일.*선택하고.*저장.*버튼',
-                    r'주일.*체크.*표시.*하세요',
-                    r'주일.*옵션.*활성화.*하면',
-                    r'주일.*설정.*완료.*하세요'
-                ])
-            
-            # 모든 패턴 검사
-            all_patterns = (invalid_notification_patterns + 
-                          invalid_menu_patterns + 
-                          invalid_advanced_patterns + 
-                          query_specific_patterns)
-            
-            for pattern in all_patterns:
-                if re.search(pattern, answer, re.IGNORECASE):
-                    logging.error(f"존재하지 않는 기능 안내 감지: '{pattern}' 패턴 매칭")
-                    return True
+            # 1~3. 존재하지 않는 알림 세부 설정 / 설정 메뉴 경로 / 고급 기능 (공통 패턴)
+            all_patterns = _INVALID_FEATURE_RES
+            matched = _INVALID_FEATURE_RE.search(answer) is not None
+            
+            # 4. 주일 알림 관련 질문에 대한 잘못된 답변 패턴
+            if _SUNDAY_NOTIFICATION_QUERY_RE.search(query):
+                all_patterns = all_patterns + _SUNDAY_NOTIFICATION_ANSWER_RES
+                matched = matched or _SUNDAY_NOTIFICATION_ANSWER_RE.search(answer) is not None
+            
+            if matched:
+                pattern = next(rx for rx in all_patterns if rx.search(answer))
+                logging.error(f"존재하지 않는 기능 안내 감지: '{pattern.pattern}' 패턴 매칭")
+                return True
             
             # 5. 실제 앱에 없는 UI 요소 언급 감지
-            ui_element_patterns = [
-                r'"?주일"?.*버튼.*눌러',
-                r'"?요일.*선택"?.*메뉴',
-                r'"?주일.*알림"?.*체크박스',
-                r'"?요일별.*설정"?.*옵션',
-                r'주일.*드롭다운.*메뉴'
-            ]
-            
-            for pattern in ui_element_patterns:
-                if re.search(pattern, answer, re.IGNORECASE):
-                    logging.error(f"존재하지 않는 UI 요소 언급 감지: '{pattern}' 패턴 매칭")
-                    return True
+            if _INVALID_UI_ELEMENT_RE.search(answer):
+                pattern = next(rx for rx in _INVALID_UI_ELEMENT_RES if rx.search(answer))
+                logging.error(f"존재하지 않는 UI 요소 언급 감지: '{pattern.pattern}' 패턴 매칭")
+                return True
         
         return False
 
@@ -655,11 +677,9 @@ class QualityValidator:
     #     bool: 답변이 질문과 관련성이 있는지 여부
     def validate_answer_relevance_ai(self, answer: str, query: str, question_analysis: dict) -> bool:
         try:
-            # ===== 메모리 최적화 컨텍스트 시작 =====
-            with memory_cleanup():
-                # ===== 1단계: GPT 시스템 프롬프트 구성 =====
-                # 답변-질문 일치도를 엄격하게 평가하는 전문가 역할 부여
-                system_prompt = """당신은 답변 품질 검증 전문가입니다.
+            # ===== 1단계: GPT 시스템 프롬프트 구성 =====
+            # 답변-질문 일치도를 엄격하게 평가하는 전문가 역할 부여
+            system_prompt = """당신은 답변 품질 검증 전문가입니다.
 생성된 답변이 고객의 질문에 적절히 대응하는지 엄격하게 평가하세요.
 
 ⚠️ 엄격한 평가 기준:
@@ -676,8 +696,8 @@ class QualityValidator:
 
 결과: "relevant" 또는 "irrelevant" 중 하나만 반환하세요."""
 
-                # ===== 2단계: 사용자 프롬프트 구성 (상세 분석 정보 포함) =====
-                user_prompt = f"""질문 분석:
+            # ===== 2단계: 사용자 프롬프트 구성 (상세 분석 정보 포함) =====
+            user_prompt = f"""질문 분석:
 의도: {question_analysis.get('intent_type', 'N/A')}
 주제: {question_analysis.get('main_topic', 'N/A')}
 행동유형: {question_analysis.get('action_type', 'N/A')}
@@ -690,26 +710,26 @@ class QualityValidator:
 ⚠️ 특히 주의: 질문의 행동유형과 답변에서 다루는 행동이 다르면 "irrelevant"입니다.
 이 답변이 질문에 적절한지 엄격하게 평가해주세요."""
 
-                # ===== 3단계: GPT API 호출 (관련성 검증) =====
-                response = self.openai_client.chat.completions.create(
-                    model='gpt-5-mini',
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    max_completion_tokens=30000,                              # 짧은 답변 (relevant/irrelevant)
-                    # temperature=0.1                             # 일관성 중시 (낮은 창의성)
-                )
-                
-                # ===== 4단계: GPT 응답 분석 및 결과 판정 =====
-                result = response.choices[0].message.content.strip().lower()
-                
-                # "relevant"가 포함되고 "irrelevant"가 없으면 관련성 있음
-                is_relevant = 'relevant' in result and 'irrelevant' not in result
-                
-                logging.info(f"AI 답변 관련성 검증: {result} -> {is_relevant}")
-                
-                return is_relevant
+            # ===== 3단계: GPT API 호출 (관련성 검증) =====
+            response = self.openai_client.chat.completions.create(
+                model='gpt-5-mini',
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_completion_tokens=30000,                              # 짧은 답변 (relevant/irrelevant)
+                # temperature=0.1                             # 일관성 중시 (낮은 창의성)
+            )
+            
+            # ===== 4단계: GPT 응답 분석 및 결과 판정 =====
+            result = response.choices[0].message.content.strip().lower()
+            
+            # "relevant"가 포함되고 "irrelevant"가 없으면 관련성 있음
+            is_relevant = 'relevant' in result and 'irrelevant' not in result
+            
+            logging.info(f"AI 답변 관련성 검증: {result} -> {is_relevant}")
+            
+            return is_relevant
                 
         except Exception as e:
             # ===== 예외 처리: GPT 실패시 폴백 로직 =====
@@ -730,7 +750,7 @@ def check_semantic_consistency(self, query: str, answer: str) -> Dict[str, Any]:
     """의미적 일관성 실시간 검증"""
     try:
         # HTML 태그 제거
-        clean_answer = re.sub(r'<[^>]+>', '', answer)
+        clean_answer = _RE_HTML_TAG.sub('', answer)
         
         # 질문과 답변에서 핵심 개념 추출
         query_concepts = self.text_processor.extract_key_concepts(query)
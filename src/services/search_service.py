@@ -7,13 +7,94 @@
 - 의도 기반 검색으로 사용자 질문의 진정한 의미 파악
 """
 
+import heapq
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import List, Dict
-from src.utils.memory_manager import memory_cleanup
+import numpy as np
 from src.utils.text_preprocessor import TextPreprocessor
+from src.utils.semantic_query_cache import SemanticQueryCache
 from src.models.embedding_generator import EmbeddingGenerator
 from src.models.question_analyzer import QuestionAnalyzer
 
+# 모듈 로거 (매칭별 상세 로그는 레벨 확인 후 지연 포맷팅으로 출력)
+logger = logging.getLogger(__name__)
+
+# ===== 검색 결과 시맨틱 캐시 설정 =====
+# 유사도 0.86 이상인 질문은 같은 의미로 보고 Pinecone 검색 없이 이전 결과 재사용
+SEARCH_CACHE_THRESHOLD = 0.86    # 같은 의미로 판단할 코사인 유사도 임계값
+SEARCH_CACHE_SIZE = 512          # 최대 캐시 질문 수 (초과시 LRU 제거)
+SEARCH_CACHE_TTL = 3600          # 검색 결과 유효 시간(초) - 동기화된 신규 답변 반영
+
+# 프로세스 공용 검색 결과 캐시 (질문 임베딩 → 필터링된 검색 결과)
+_search_cache = SemanticQueryCache(
+    max_size=SEARCH_CACHE_SIZE,
+    threshold=SEARCH_CACHE_THRESHOLD,
+    result_ttl=SEARCH_CACHE_TTL
+)
+_search_cache_lock = threading.Lock()
+
+# 레이어 검색 동시 실행용 스레드 풀 (OpenAI/Pinecone 요청 한도보다 충분히 낮게 유지)
+SEARCH_MAX_WORKERS = 8
+_search_executor = ThreadPoolExecutor(max_workers=SEARCH_MAX_WORKERS)
+
+# ===== 유사 답변 검색 결과 레코드 =====
+# __slots__로 인스턴스별 __dict__ 생성을 없애 결과당 메모리와 속성 접근 비용 절감
+# 기존 소비 코드 호환을 위해 ans['score'], ans.get('lang', 'ko'), dict(ans) 형태의 읽기 접근 지원
+class SimilarAnswer:
+    __slots__ = ('score', 'vector_score', 'intent_relevance', 'concept_relevance', 'question',
+                 'answer', 'category', 'rank', 'search_type', 'layer_weight', 'lang')
+
+    # SimilarAnswer 초기화
+    # Args:
+    #     score: 최종 종합 점수
+    #     vector_score: 원본 벡터 유사도
+    #     intent_relevance: 의도 관련성 점수
+    #     concept_relevance: 개념 관련성 점수
+    #     question: 참조 질문
+    #     answer: 참조 답변
+    #     category: 카테고리
+    #     rank: 순위
+    #     search_type: 검색 유형
+    #     layer_weight: 레이어 가중치
+    #     lang: 언어
+    def __init__(self, score: float, vector_score: float, intent_relevance: float, concept_relevance: float,
+                 question: str, answer: str, category: str, rank: int, search_type: str,
+                 layer_weight: float = 1.0, lang: str = 'ko'):
+        self.score = score
+        self.vector_score = vector_score
+        self.intent_relevance = intent_relevance
+        self.concept_relevance = concept_relevance
+        self.question = question
+        self.answer = answer
+        self.category = category
+        self.rank = rank
+        self.search_type = search_type
+        self.layer_weight = layer_weight
+        self.lang = lang
+
+    # 딕셔너리 방식 필드 조회 (ans['score'])
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    # 딕셔너리 방식 기본값 조회 (ans.get('relevance_score', 0.5))
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    # 필드 이름 목록 (dict(ans) 변환 지원)
+    def keys(self) -> tuple:
+        return self.__slots__
+
+    # 로깅용 요약 문자열
+    def __repr__(self) -> str:
+        return f"SimilarAnswer(score={self.score:.3f}, rank={self.rank}, search_type={self.search_type!r})"
+
+
 # ===== Pinecone 벡터 검색을 담당하는 메인 클래스 =====
 class SearchService:
     
@@ -36,200 +117,229 @@ class SearchService:
     #     list: 검색된 유사 답변 리스트
     def search_similar_answers_enhanced(self, query: str, top_k: int = 8, lang: str = 'ko') -> list:
         try:
-            # ===== 메모리 최적화 컨텍스트 시작 =====
-            with memory_cleanup():
-                logging.info(f"=== 의미론적 다층 검색 시작 ===")
-                logging.info(f"원본 질문: {query}")
-                
-                # ===== 1단계: 기본 전처리 =====
-                if lang == 'ko':
-                    # 한국어인 경우 AI 기반 오타 수정 적용
-                    corrected_query = self.fix_korean_typos_with_ai(query)
-                    query_to_embed = corrected_query
-                else:
-                    # 영어인 경우 원본 그대로 사용
-                    query_to_embed = query
+            logging.info(f"=== 의미론적 다층 검색 시작 ===")
+            logging.info(f"원본 질문: {query}")
+            
+            # ===== 1단계: 기본 전처리 =====
+            if lang == 'ko':
+                # 한국어인 경우 AI 기반 오타 수정 적용
+                corrected_query = self.fix_korean_typos_with_ai(query)
+                query_to_embed = corrected_query
+            else:
+                # 영어인 경우 원본 그대로 사용
+                query_to_embed = query
+            
+            # ===== 1-1단계: 시맨틱 캐시 조회 (히트시 의도 분석/Pinecone 검색 생략) =====
+            # 원본 질문 임베딩은 레이어 1 검색에서 임베딩 캐시로 재사용됨
+            cache_params = f"{top_k}:{lang}"
+            
+            # 정규화 텍스트가 같은 질문은 임베딩 생성 없이 정확 일치로 먼저 조회
+            with _search_cache_lock:
+                exact = _search_cache.get_exact(query_to_embed, cache_params)
+            if exact is not None and exact[1] is not None:
+                logging.info(f"검색 캐시 히트(정확 일치): {len(exact[1])}개 답변 재사용")
+                return list(exact[1])
+            
+            cache_vector = self.embedding_generator.create_embedding(query_to_embed)
+            if cache_vector is not None:
+                with _search_cache_lock:
+                    cached_results = _search_cache.get_similar(cache_vector, cache_params)
+                if cached_results is not None:
+                    logging.info(f"검색 캐시 히트: {len(cached_results)}개 답변 재사용")
+                    return list(cached_results)  # 소비 코드는 결과 레코드를 읽기만 하므로 그대로 공유
+            
+            # ===== 1-2단계: 의도 분석 결과가 필요 없는 검색을 먼저 시작 (2단계 GPT 호출과 동시 진행) =====
+            # 원본 질문 레이어는 이미 만든 질문 벡터로 바로 검색
+            # (영어 질문의 한국어 번역 검색은 번역 기능이 없어 원본 레이어와 같은 검색이 되므로 실행하지 않음)
+            original_future = None
+            if cache_vector is not None and len(query_to_embed.strip()) >= 2:
+                original_future = _search_executor.submit(self._query_vector, cache_vector, top_k * 2)
+            
+            # ===== 2단계: 핵심 의도 분석 =====
+            # GPT를 활용해 사용자 질문의 진정한 의도와 목적 파악
+            intent_analysis = self.question_analyzer.analyze_question_intent(query_to_embed)
+            core_intent = intent_analysis.get('core_intent', '')                    # 핵심 의도
+            standardized_query = intent_analysis.get('standardized_query', query_to_embed)  # 표준화된 질문
+            semantic_keywords = intent_analysis.get('semantic_keywords', [])        # 의미론적 키워드
+            
+            logging.info(f"핵심 의도: {core_intent}")
+            logging.info(f"표준화된 질문: {standardized_query}")
+            logging.info(f"의미론적 키워드: {semantic_keywords}")
+            
+            # ===== 3단계: 기존 핵심 개념 추출 (보완용) =====
+            # 규칙 기반으로 추출한 키워드로 의도 분석 결과 보완
+            key_concepts = self.text_processor.extract_key_concepts(query_to_embed)
+            
+            # ===== 4단계: 검색 결과 수집 준비 =====
+            all_results = {}                                              # 전체 검색 결과 (ID → (조정 점수, 검색 유형, 레이어 가중치, 매칭), 먼저 들어온 결과 우선)
+            
+            # ===== 5단계: 다층 검색 쿼리 구성 (의도 기반 강화) =====
+            search_layers = [
+                # Layer 1: 원본 질문 (가중치 1.0 - 최고 우선순위)
+                {'query': query_to_embed, 'weight': 1.0, 'type': 'original'},
                 
-                # ===== 2단계: 핵심 의도 분석 =====
-                # GPT를 활용해 사용자 질문의 진정한 의도와 목적 파악
-                intent_analysis = self.question_analyzer.analyze_question_intent(query_to_embed)
-                core_intent = intent_analysis.get('core_intent', '')                    # 핵심 의도
-                standardized_query = intent_analysis.get('standardized_query', query_to_embed)  # 표준화된 질문
-                semantic_keywords = intent_analysis.get('semantic_keywords', [])        # 의미론적 키워드
+                # Layer 2: 표준화된 의도 기반 질문 (가중치 0.95 - GPT 분석 결과)
+                {'query': standardized_query, 'weight': 0.95, 'type': 'intent_based'},
                 
-                logging.info(f"핵심 의도: {core_intent}")
-                logging.info(f"표준화된 질문: {standardized_query}")
-                logging.info(f"의미론적 키워드: {semantic_keywords}")
+                # Layer 3: 핵심 의도만 (가중치 0.9 - 추상화된 검색)
+                {'query': core_intent.replace('_', ' '), 'weight': 0.9, 'type': 'core_intent'},
+            ]
+            
+            # Layer 4: 의미론적 키워드 조합 (가중치 0.8 - GPT 추출 키워드)
+            if semantic_keywords and len(semantic_keywords) >= 2:
+                semantic_query = ' '.join(semantic_keywords[:3])          # 상위 3개 키워드 조합
+                search_layers.append({
+                    'query': semantic_query, 'weight': 0.8, 'type': 'semantic_keywords'
+                })
+            
+            # Layer 5: 기존 개념 기반 검색 (가중치 0.7 - 규칙 기반 보완)
+            if key_concepts:
+                if len(key_concepts) >= 2:
+                    concept_query = ' '.join(key_concepts[:3])            # 상위 3개 개념 조합
+                    search_layers.append({
+                        'query': concept_query, 'weight': 0.7, 'type': 'concept_based'
+                    })
+            
+            logging.info(f"검색 레이어 수: {len(search_layers)}")
+            
+            # ===== 6단계: 레이어 검색어 임베딩을 한 번의 API 호출로 생성 후 Pinecone 검색을 동시 실행 =====
+            # 레이어별 Pinecone 검색은 서로 독립적이므로 스레드 풀에서 네트워크 대기를 겹침
+            valid_layers = []
+            for i, layer in enumerate(search_layers):
+                search_query = layer['query']
                 
-                # ===== 3단계: 기존 핵심 개념 추출 (보완용) =====
-                # 규칙 기반으로 추출한 키워드로 의도 분석 결과 보완
-                key_concepts = self.text_processor.extract_key_concepts(query_to_embed)
+                # 유효하지 않은 검색어는 건너뛰기
+                if not search_query or len(search_query.strip()) < 2:
+                    continue
                 
-                # ===== 4단계: 검색 결과 수집 준비 =====
-                all_results = []                                              # 전체 검색 결과
-                seen_ids = set()                                              # 중복 제거용 ID 집합
+                logger.info("레이어 %d (%s): %.50s...", i + 1, layer['type'], search_query)
                 
-                # ===== 5단계: 다층 검색 쿼리 구성 (의도 기반 강화) =====
-                search_layers = [
-                    # Layer 1: 원본 질문 (가중치 1.0 - 최고 우선순위)
-                    {'query': query_to_embed, 'weight': 1.0, 'type': 'original'},
-                    
-                    # Layer 2: 표준화된 의도 기반 질문 (가중치 0.95 - GPT 분석 결과)
-                    {'query': standardized_query, 'weight': 0.95, 'type': 'intent_based'},
-                    
-                    # Layer 3: 핵심 의도만 (가중치 0.9 - 추상화된 검색)
-                    {'query': core_intent.replace('_', ' '), 'weight': 0.9, 'type': 'core_intent'},
-                ]
+                # 원본 질문 레이어는 1-2단계에서 이미 검색 시작
+                if i == 0 and original_future is not None:
+                    continue
                 
-                # Layer 4: 의미론적 키워드 조합 (가중치 0.8 - GPT 추출 키워드)
-                if semantic_keywords and len(semantic_keywords) >= 2:
-                    semantic_query = ' '.join(semantic_keywords[:3])          # 상위 3개 키워드 조합
-                    search_layers.append({
-                        'query': semantic_query, 'weight': 0.8, 'type': 'semantic_keywords'
-                    })
+                # 첫 번째 레이어는 더 많이 검색하여 후보 확보
+                search_top_k = top_k * 2 if i == 0 else top_k
+                valid_layers.append((layer, search_top_k))
+            
+            # 캐시된 검색어는 API 요청에서 제외되고, 결과는 입력 순서와 같음
+            layer_vectors = self.embedding_generator.create_embeddings_batch(
+                [layer['query'] for layer, _ in valid_layers]
+            )
+            layer_futures = []
+            if original_future is not None:
+                layer_futures.append((search_layers[0], original_future))
+            for (layer, search_top_k), query_vector in zip(valid_layers, layer_vectors):
+                if query_vector is None:
+                    continue
+                layer_futures.append(
+                    (layer, _search_executor.submit(self._query_vector, query_vector, search_top_k))
+                )
+            
+            # ===== 6-2: 레이어 순서대로 결과 수집 및 가중치 적용 (앞 레이어 우선 중복 제거) =====
+            # 검색 결과는 CachedIndex가 다른 요청과 공유하므로 match는 수정하지 않고
+            # (조정 점수, 검색 유형, 레이어 가중치, match) 튜플로 따로 보관
+            for layer, future in layer_futures:
+                matches = future.result()
+                if matches is None:
+                    continue
                 
-                # Layer 5: 기존 개념 기반 검색 (가중치 0.7 - 규칙 기반 보완)
-                if key_concepts:
-                    if len(key_concepts) >= 2:
-                        concept_query = ' '.join(key_concepts[:3])            # 상위 3개 개념 조합
-                        search_layers.append({
-                            'query': concept_query, 'weight': 0.7, 'type': 'concept_based'
-                        })
+                weight = layer['weight']
+                for match in matches:
+                    match_id = match['id']
+                    if match_id not in all_results:                      # 중복 제거
+                        # 가중치 적용한 조정 점수 계산
+                        all_results[match_id] = (match['score'] * weight, layer['type'], weight, match)
+            
+            # ===== 8단계: 결과 정렬 및 의미론적 관련성 검증 =====
+            # 조정된 점수 기준 상위 후보(top_k의 2배)만 선택 - 전체 정렬 대신 부분 힙 선택
+            candidates = heapq.nlargest(top_k * 2, all_results.values(), key=itemgetter(0))
+            
+            # ===== 9단계: 최종 결과 필터링 및 점수 재계산 =====
+            filtered_results = []
+            for i, (score, search_type, layer_weight, match) in enumerate(candidates):   # 후보의 2배까지 검토
+                question = match['metadata'].get('question', '')
+                answer = match['metadata'].get('answer', '')
+                category = match['metadata'].get('category', '일반')
                 
-                logging.info(f"검색 레이어 수: {len(search_layers)}")
+                # ===== 9-1: 기본 임계값 검사 =====
+                if score < 0.3 and i >= 5:  # 상위 5개는 점수가 낮아도 포함
+                    continue
                 
-                # ===== 6단계: 각 레이어별 검색 수행 =====
-                for i, layer in enumerate(search_layers):
-                    search_query = layer['query']
-                    weight = layer['weight']
-                    layer_type = layer['type']
-                    
-                    # 유효하지 않은 검색어는 건너뛰기
-                    if not search_query or len(search_query.strip()) < 2:
-                        continue
-                    
-                    logging.info(f"레이어 {i+1} ({layer_type}): {search_query[:50]}...")
-                    
-                    # ===== 6-1: 임베딩 벡터 생성 =====
-                    query_vector = self.embedding_generator.create_embedding(search_query)
-                    if query_vector is None:
-                        continue
-                    
-                    # ===== 6-2: 검색 범위 설정 =====
-                    # 첫 번째 레이어는 더 많이 검색하여 후보 확보
-                    search_top_k = top_k * 2 if i == 0 else top_k
-                    
-                    # ===== 6-3: Pinecone 벡터 검색 실행 =====
-                    results = self.index.query(
-                        vector=query_vector,
-                        top_k=search_top_k,
-                        include_metadata=True
-                    )
-                    
-                    # ===== 6-4: 검색 결과 처리 및 가중치 적용 =====
-                    for match in results['matches']:
-                        match_id = match['id']
-                        if match_id not in seen_ids:                         # 중복 제거
-                            seen_ids.add(match_id)
-                            # 가중치 적용한 조정 점수 계산
-                            adjusted_score = match['score'] * weight
-                            match['adjusted_score'] = adjusted_score
-                            match['search_type'] = layer_type
-                            match['layer_weight'] = weight
-                            all_results.append(match)
-                    
-                    # ===== 6-5: 메모리 정리 =====
-                    del query_vector, results
+                # ===== 9-2: 의도 기반 관련성 검증 =====
+                # GPT 분석 결과와 참조 답변 간의 의미적 유사성 계산
+                intent_relevance = self.question_analyzer.calculate_intent_similarity(
+                    intent_analysis, question, answer
+                )
                 
-                # ===== 7단계: 영어 질문인 경우 번역 검색 (다국어 지원) =====
-                if lang == 'en':
-                    # 영어 질문을 한국어로 번역하여 추가 검색
-                    korean_query = self.translate_text(query_to_embed, 'en', 'ko')
-                    korean_vector = self.embedding_generator.create_embedding(korean_query)
-                    if korean_vector:
-                        korean_results = self.index.query(
-                            vector=korean_vector,
-                            top_k=top_k,
-                            include_metadata=True
-                        )
-                        # 번역 검색 결과 추가 (가중치 0.85 적용)
-                        for match in korean_results['matches']:
-                            if match['id'] not in seen_ids:
-                                match['adjusted_score'] = match['score'] * 0.85  # 번역 페널티
-                                match['search_type'] = 'translated'
-                                match['layer_weight'] = 0.85
-                                all_results.append(match)
-                        del korean_vector, korean_results
+                # ===== 9-3: 개념 일치도 계산 =====
+                # 규칙 기반 키워드와 참조 답변 간의 개념적 연관성
+                concept_relevance = self.calculate_concept_relevance(
+                    query_to_embed, key_concepts, question, answer
+                )
                 
-                # ===== 8단계: 결과 정렬 및 의미론적 관련성 검증 =====
-                # 조정된 점수 기준으로 정렬
-                all_results.sort(key=lambda x: x['adjusted_score'], reverse=True)
+                # ===== 9-4: 최종 점수 계산 (가중 평균) =====
+                # 벡터 유사도(60%) + 의도 관련성(25%) + 개념 관련성(15%)
+                final_score = (score * 0.6 + 
+                             intent_relevance * 0.25 + 
+                             concept_relevance * 0.15)
                 
-                # ===== 9단계: 최종 결과 필터링 및 점수 재계산 =====
-                filtered_results = []
-                for i, match in enumerate(all_results[:top_k*2]):           # 후보의 2배까지 검토
-                    score = match['adjusted_score']
-                    question = match['metadata'].get('question', '')
-                    answer = match['metadata'].get('answer', '')
-                    category = match['metadata'].get('category', '일반')
-                    
-                    # ===== 9-1: 기본 임계값 검사 =====
-                    if score < 0.3 and i >= 5:  # 상위 5개는 점수가 낮아도 포함
-                        continue
-                    
-                    # ===== 9-2: 의도 기반 관련성 검증 =====
-                    # GPT 분석 결과와 참조 답변 간의 의미적 유사성 계산
-                    intent_relevance = self.question_analyzer.calculate_intent_similarity(
-                        intent_analysis, question, answer
-                    )
-                    
-                    # ===== 9-3: 개념 일치도 계산 =====
-                    # 규칙 기반 키워드와 참조 답변 간의 개념적 연관성
-                    concept_relevance = self.calculate_concept_relevance(
-                        query_to_embed, key_concepts, question, answer
-                    )
+                # ===== 9-5: 결과 선택 기준 =====
+                if final_score >= 0.4 or i < 3:  # 최소 점수 또는 상위 3개 무조건 포함
+                    filtered_results.append(SimilarAnswer(
+                        score=final_score,                            # 최종 종합 점수
+                        vector_score=match['score'],                  # 원본 벡터 유사도
+                        intent_relevance=intent_relevance,            # 의도 관련성 점수
+                        concept_relevance=concept_relevance,          # 개념 관련성 점수
+                        question=question,                            # 참조 질문
+                        answer=answer,                                # 참조 답변
+                        category=category,                            # 카테고리
+                        rank=i + 1,                                   # 순위
+                        search_type=search_type,                      # 검색 유형
+                        layer_weight=layer_weight,                    # 레이어 가중치
+                        lang='ko'                                     # 언어
+                    ))
                     
-                    # ===== 9-4: 최종 점수 계산 (가중 평균) =====
-                    # 벡터 유사도(60%) + 의도 관련성(25%) + 개념 관련성(15%)
-                    final_score = (score * 0.6 + 
-                                 intent_relevance * 0.25 + 
-                                 concept_relevance * 0.15)
-                    
-                    # ===== 9-5: 결과 선택 기준 =====
-                    if final_score >= 0.4 or i < 3:  # 최소 점수 또는 상위 3개 무조건 포함
-                        filtered_results.append({
-                            'score': final_score,                          # 최종 종합 점수
-                            'vector_score': match['score'],               # 원본 벡터 유사도
-                            'intent_relevance': intent_relevance,         # 의도 관련성 점수
-                            'concept_relevance': concept_relevance,       # 개념 관련성 점수
-                            'question': question,                         # 참조 질문
-                            'answer': answer,                             # 참조 답변
-                            'category': category,                         # 카테고리
-                            'rank': i + 1,                               # 순위
-                            'search_type': match['search_type'],          # 검색 유형
-                            'layer_weight': match.get('layer_weight', 1.0), # 레이어 가중치
-                            'lang': 'ko'                                  # 언어
-                        })
-                        
-                        # ===== 9-6: 상세 로깅 =====
-                        logging.info(f"선택: #{i+1} 최종점수={final_score:.3f} "
-                                   f"(벡터={match['score']:.3f}, 의도={intent_relevance:.3f}, "
-                                   f"개념={concept_relevance:.3f}) 타입={match['search_type']}")
-                        logging.info(f"질문: {question[:50]}...")
-                    
-                    # ===== 9-7: 목표 개수 달성시 종료 =====
-                    if len(filtered_results) >= top_k:
-                        break
-                
-                # ===== 10단계: 검색 완료 =====
-                logging.info(f"의미론적 다층 검색 완료: {len(filtered_results)}개 답변")
-                return filtered_results
+                    # ===== 9-6: 상세 로깅 (INFO 비활성시 문자열 생성 생략) =====
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("선택: #%d 최종점수=%.3f (벡터=%.3f, 의도=%.3f, 개념=%.3f) 타입=%s",
+                                    i + 1, final_score, match['score'], intent_relevance,
+                                    concept_relevance, search_type)
+                        logger.info("질문: %s...", question[:50])
                 
+                # ===== 9-7: 목표 개수 달성시 종료 =====
+                if len(filtered_results) >= top_k:
+                    break
+            
+            # ===== 10단계: 검색 결과 캐시 저장 =====
+            if cache_vector is not None and filtered_results:
+                with _search_cache_lock:
+                    _search_cache.put(query_to_embed, cache_vector,
+                                      list(filtered_results), cache_params)
+            
+            # ===== 11단계: 검색 완료 =====
+            logging.info(f"의미론적 다층 검색 완료: {len(filtered_results)}개 답변")
+            return filtered_results
+            
         except Exception as e:
             # ===== 예외 처리: 검색 실패시 빈 리스트 반환 =====
             logging.error(f"의미론적 다층 검색 실패: {str(e)}")
             return []
 
+    # 임베딩 벡터로 Pinecone 검색하는 메서드 (스레드 풀에서 실행)
+    # Args:
+    #     query_vector: 검색어 임베딩 벡터
+    #     search_top_k: 검색할 결과 수
+    # Returns:
+    #     list: Pinecone 검색 결과
+    def _query_vector(self, query_vector: np.ndarray, search_top_k: int):
+        results = self.index.query(
+            vector=query_vector.tolist(),   # Pinecone 호출 경계에서만 리스트로 변환
+            top_k=search_top_k,
+            include_metadata=True
+        )
+        return results['matches']
+
     # 질문과 참조 답변 간의 핵심 개념 일치도를 계산하는 메서드
     # Args:
     #     query: 원본 사용자 질문
@@ -345,8 +455,14 @@ class SearchService:
         relevance_score = best_answer.get('relevance_score', 0.5)
         
         # ===== 3단계: 고품질 답변 개수 계산 =====
-        high_quality_count = len([ans for ans in similar_answers if ans['score'] >= 0.7])          # 유사도 70% 이상
-        good_relevance_count = len([ans for ans in similar_answers if ans.get('relevance_score', 0) >= 0.6])  # 관련성 60% 이상
+        # 점수를 NumPy 배열로 모아 벡터 비교로 개수 계산 (임시 리스트 생성 없음)
+        count = len(similar_answers)
+        scores = np.fromiter((ans['score'] for ans in similar_answers), dtype=np.float64, count=count)
+        relevance_scores = np.fromiter(
+            (ans.get('relevance_score', 0) for ans in similar_answers), dtype=np.float64, count=count
+        )
+        high_quality_count = int((scores >= 0.7).sum())                 # 유사도 70% 이상
+        good_relevance_count = int((relevance_scores >= 0.6).sum())     # 관련성 60% 이상
         
         # ===== 4단계: 접근 방식 결정 (개념 일치도 고려) =====
         if best_score >= 0.9 and relevance_score >= 0.7:
@@ -8,12 +8,60 @@
 """
 
 import logging
+import re
 import pyodbc
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, List
 from datetime import datetime
+from functools import lru_cache
 from src.utils.memory_manager import memory_cleanup
 from src.utils.text_preprocessor import TextPreprocessor
 from src.models.embedding_generator import EmbeddingGenerator
+from src.utils.mssql_pool import get_conn
+
+# ===== 일괄 동기화 설정 =====
+SYNC_BATCH_MAX_SEQS = 500           # 한 번의 일괄 동기화 요청에서 처리할 최대 문의 수
+SYNC_TYPO_FIX_WORKERS = 8           # AI 오타 수정 동시 실행 스레드 수
+
+# ===== AI 오타 수정 사전 필터 =====
+# 자주 나오는 오타/붙여쓰기 패턴이 하나도 없는 텍스트는 GPT 호출 없이 원문 그대로 사용
+_TYPO_PROBES = re.compile('|'.join([
+    r'됀',                                  # 안됀다, 됀다
+    r'[안않]\s*되요',                        # 안되요 → 안 돼요
+    r'않\s*되',                             # 않되 → 안 되
+    r'받기가\s*안\s*되',                     # 다운받기가 안되
+    r'삭재', r'업데이드', r'업뎃', r'어플',     # 자주 틀리는 단어 / 비표준 용어
+    r'몇일', r'웬지', r'어떻해', r'되서',
+    r'[ㄱ-ㅎㅏ-ㅣ]',                          # 자모 단독 사용 (ㅠㅠ, ㅇㅇ, 입력 실수)
+    r'(\w)\1{3,}',                          # 같은 글자 4번 이상 반복 (말줄임표/느낌표 반복은 오타가 아니므로 제외)
+    r'하고싶', r'할수', r'수없', r'수있', r'안됩', # 붙여쓰기
+]))
+_RE_KOREAN_CHAR = re.compile(r'[ㄱ-ㅎㅏ-ㅣ가-힣]')   # 한글이 하나도 없는 텍스트는 한국어 맞춤법 교정 대상이 아님
+TYPO_FIX_CACHE_SIZE = 4096          # 오타 수정 결과 캐시 크기 (반복되는 문의 문구 재사용)
+
+# ===== 동기화 완료 알림 (Pinecone 데이터 변경시 캐시 무효화 등) =====
+# 등록된 콜백은 sync_to_pinecone 성공시 (seq, mode) 인자로 호출됨
+_sync_listeners: List[Callable[[int, str], None]] = []
+
+
+# 동기화 완료 콜백 등록 함수
+# Args:
+#     callback: (seq, mode)를 받는 콜백 함수
+def register_sync_listener(callback: Callable[[int, str], None]):
+    if callback not in _sync_listeners:
+        _sync_listeners.append(callback)
+
+
+# 등록된 동기화 완료 콜백 호출 함수 (콜백 오류는 동기화 결과에 영향 없음)
+# Args:
+#     seq: 동기화된 문의의 시퀀스 번호
+#     mode: 동기화 모드 ('upsert' 또는 'delete')
+def _notify_sync_listeners(seq: int, mode: str):
+    for callback in _sync_listeners:
+        try:
+            callback(seq, mode)
+        except Exception as e:
+            logging.error(f"동기화 완료 콜백 실패: {e}")
 
 # ===== MSSQL과 Pinecone 간의 동기화를 담당하는 메인 클래스 =====
 class SyncService:
@@ -28,9 +76,16 @@ class SyncService:
         self.index = pinecone_index                               # Pinecone 벡터 인덱스
         self.connection_string = connection_string                # MSSQL 연결 문자열
         self.category_mapping = category_mapping                  # 카테고리 ID → 이름 매핑
+        # 정수 카테고리 ID(0부터 연속) → 이름 튜플 (DB에서 읽은 정수 ID는 문자열 변환/해시 없이 인덱스로 조회)
+        self._category_names = tuple(
+            category_mapping.get(str(i), '사용 문의(기타)')
+            for i in range(max((int(k) for k in category_mapping if k.isdigit()), default=-1) + 1)
+        )
         self.text_processor = TextPreprocessor()                  # 텍스트 전처리 도구
         self.embedding_generator = EmbeddingGenerator(openai_client)  # 임베딩 생성기
         self.openai_client = openai_client                        # GPT 기반 텍스트 처리용
+        # 원문 → 오타 수정 결과 캐시 (API 오류는 캐시되지 않음)
+        self._typo_fix_cached = lru_cache(maxsize=TYPO_FIX_CACHE_SIZE)(self._request_typo_fix)
     
     # AI를 이용한 한국어 오타 수정 메서드
     # Args:
@@ -47,12 +102,28 @@ class SyncService:
             logging.warning(f"텍스트가 너무 길어 오타 수정 건너뜀: {len(text)}자")
             return text
         
+        # ===== 3단계: 사전 필터 (한글이 없거나 오타 패턴이 없으면 GPT 호출 생략) =====
+        if not _RE_KOREAN_CHAR.search(text) or not _TYPO_PROBES.search(text):
+            return text
+        
         try:
-            # ===== 3단계: 메모리 최적화 컨텍스트 시작 =====
-            with memory_cleanup():
-                # ===== 4단계: GPT 시스템 프롬프트 구성 =====
-                # 한국어 맞춤법 및 오타 교정 전문가 역할 부여
-                system_prompt = """당신은 한국어 맞춤법 및 오타 교정 전문가입니다.
+            # ===== 4단계: 캐시 조회 또는 GPT 오타 수정 =====
+            return self._typo_fix_cached(text)
+            
+        except Exception as e:
+            # ===== 예외 처리: AI 실패시 원문 반환 =====
+            logging.error(f"AI 오타 수정 실패: {e}")
+            return text
+    
+    # GPT로 오타 수정을 요청하는 메서드 (API 오류는 호출자에게 전달)
+    # Args:
+    #     text: 오타 수정할 한국어 텍스트
+    # Returns:
+    #     str: 오타가 수정된 텍스트 (결과 검증 실패시 원본 반환)
+    def _request_typo_fix(self, text: str) -> str:
+        # ===== 1단계: GPT 시스템 프롬프트 구성 =====
+        # 한국어 맞춤법 및 오타 교정 전문가 역할 부여
+        system_prompt = """당신은 한국어 맞춤법 및 오타 교정 전문가입니다.
 
 지침:
 1. 입력된 한국어 텍스트의 맞춤법과 오타만 수정하세요
@@ -69,49 +140,44 @@ class SyncService:
 - "업데이드해주세요" → "업데이트해주세요"
 """
 
-                # ===== 5단계: 사용자 프롬프트 구성 =====
-                user_prompt = f"다음 텍스트의 맞춤법과 오타를 수정해주세요:\n\n{text}"
+        # ===== 2단계: 사용자 프롬프트 구성 =====
+        user_prompt = f"다음 텍스트의 맞춤법과 오타를 수정해주세요:\n\n{text}"
 
-                # ===== 6단계: GPT API 호출 (오타 수정) =====
-                response = self.openai_client.chat.completions.create(
-                    model='gpt-5-mini',
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    max_completion_tokens=60000,                                 # 충분한 텍스트 길이 허용
-                    # temperature=0.1,                                # 매우 보수적 설정 (일관성 중시)
-                    top_p=0.8,                                      # 상위 80% 토큰만 사용
-                    frequency_penalty=0.0,                          # 반복 페널티 없음
-                    presence_penalty=0.0                            # 새로운 주제 페널티 없음
-                )
-                
-                # ===== 7단계: 응답 결과 추출 및 메모리 정리 =====
-                corrected_text = response.choices[0].message.content.strip()
-                del response # 메모리 해제
-                
-                # ===== 8단계: 결과 품질 검증 =====
-                # 8-1: 빈 결과 검증
-                if not corrected_text or len(corrected_text) == 0:
-                    logging.warning("AI 오타 수정 결과가 비어있음, 원문 반환")
-                    return text
-                
-                # 8-2: 과도한 변경 검증 (길이가 2배 이상 늘어나면 의심)
-                if len(corrected_text) > len(text) * 2:
-                    logging.warning("AI 오타 수정 결과가 원문보다 너무 길어짐, 원문 반환")
-                    return text
-                
-                # ===== 9단계: 수정 내용 로깅 =====
-                if corrected_text != text:
-                    logging.info(f"AI 오타 수정: '{text[:50]}...' → '{corrected_text[:50]}...'")
-                
-                # ===== 10단계: 수정된 텍스트 반환 =====
-                return corrected_text
-                
-        except Exception as e:
-            # ===== 예외 처리: AI 실패시 원문 반환 =====
-            logging.error(f"AI 오타 수정 실패: {e}")
+        # ===== 3단계: GPT API 호출 (오타 수정) =====
+        response = self.openai_client.chat.completions.create(
+            model='gpt-5-mini',
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            max_completion_tokens=60000,                                 # 충분한 텍스트 길이 허용
+            # temperature=0.1,                                # 매우 보수적 설정 (일관성 중시)
+            top_p=0.8,                                      # 상위 80% 토큰만 사용
+            frequency_penalty=0.0,                          # 반복 페널티 없음
+            presence_penalty=0.0                            # 새로운 주제 페널티 없음
+        )
+        
+        # ===== 4단계: 응답 결과 추출 및 메모리 정리 =====
+        corrected_text = response.choices[0].message.content.strip()
+        del response # 메모리 해제
+        
+        # ===== 5단계: 결과 품질 검증 =====
+        # 5-1: 빈 결과 검증
+        if not corrected_text or len(corrected_text) == 0:
+            logging.warning("AI 오타 수정 결과가 비어있음, 원문 반환")
             return text
+        
+        # 5-2: 과도한 변경 검증 (길이가 2배 이상 늘어나면 의심)
+        if len(corrected_text) > len(text) * 2:
+            logging.warning("AI 오타 수정 결과가 원문보다 너무 길어짐, 원문 반환")
+            return text
+        
+        # ===== 6단계: 수정 내용 로깅 =====
+        if corrected_text != text:
+            logging.info(f"AI 오타 수정: '{text[:50]}...' → '{corrected_text[:50]}...'")
+        
+        # ===== 7단계: 수정된 텍스트 반환 =====
+        return corrected_text
     
     # 카테고리 인덱스를 이름으로 변환하는 메서드
     # Args:
@@ -119,9 +185,35 @@ class SyncService:
     # Returns:
     #     str: 카테고리 이름 (매핑되지 않으면 기본값 반환)
     def get_category_name(self, cate_idx: str) -> str:
-        # 카테고리 매핑 딕셔너리에서 이름 조회 (기본값: '사용 문의(기타)')
+        # 정수 ID는 미리 만든 튜플에서 바로 조회
+        if type(cate_idx) is int and 0 <= cate_idx < len(self._category_names):
+            return self._category_names[cate_idx]
+        # 그 외(문자열 등)는 카테고리 매핑 딕셔너리에서 이름 조회 (기본값: '사용 문의(기타)')
         return self.category_mapping.get(str(cate_idx), '사용 문의(기타)')
     
+    # 풀 연결로 조회 쿼리를 실행하는 메서드
+    # - 커서는 항상 닫고, 정상 연결은 풀에 반환 (오류가 난 연결은 풀에서 폐기)
+    # - 풀에 있던 연결이 서버 측에서 끊긴 경우 새 연결로 한 번 재시도
+    # Args:
+    #     query: 실행할 SQL 쿼리
+    #     params: 쿼리 파라미터
+    # Returns:
+    #     list: 조회된 행 리스트
+    def _fetch_rows(self, query: str, params) -> list:
+        for attempt in range(2):
+            try:
+                with get_conn(self.connection_string) as conn:
+                    cursor = conn.cursor()
+                    try:
+                        cursor.execute(query, *params)
+                        return cursor.fetchall()
+                    finally:
+                        cursor.close()
+            except pyodbc.Error as e:
+                if attempt:
+                    raise
+                logging.warning(f"MSSQL 연결 오류, 새 연결로 재시도: {e}")
+    
     # MSSQL에서 특정 seq의 문의 데이터를 조회하는 메서드
     # Args:
     #     seq: 조회할 문의의 시퀀스 번호
@@ -129,53 +221,95 @@ class SyncService:
     #     Optional[Dict]: 조회된 문의 데이터 (실패시 None)
     def get_mssql_data(self, seq: int) -> Optional[Dict]:
         try:
-            # ===== 메모리 최적화 컨텍스트 시작 =====
-            with memory_cleanup():
-                # ===== 1단계: MSSQL 데이터베이스 연결 =====
-                conn = pyodbc.connect(self.connection_string)
-                cursor = conn.cursor()
-                
-                # ===== 2단계: SQL 쿼리 정의 =====
-                # 답변이 완료된(answer_YN = 'Y') 문의만 조회
-                query = """
+            # ===== 1단계: SQL 쿼리 정의 =====
+            # 답변이 완료된(answer_YN = 'Y') 문의만 조회
+            query = """
                 SELECT seq, contents, reply_contents, cate_idx, name, 
                        CONVERT(varchar, regdate, 120) as regdate
                 FROM mobile.dbo.bible_inquiry
                 WHERE seq = ? AND answer_YN = 'Y'
                 """
-                
-                # ===== 3단계: 쿼리 실행 =====
-                cursor.execute(query, seq)
-                row = cursor.fetchone()
-                
-                # ===== 4단계: 조회 결과 처리 =====
-                if row:
-                    # 조회된 데이터를 딕셔너리로 구성
-                    data = {
-                        'seq': row[0],                              # 시퀀스 번호
-                        'contents': row[1],                         # 질문 내용
-                        'reply_contents': row[2],                   # 답변 내용
-                        'cate_idx': row[3],                         # 카테고리 인덱스
-                        'name': row[4],                             # 질문자 이름
-                        'regdate': row[5]                           # 등록일자
-                    }
-                    
-                    # ===== 5단계: 데이터베이스 연결 정리 =====
-                    cursor.close()
-                    conn.close()
-                    
-                    return data
-                else:
-                    # ===== 데이터 없음: 연결 정리 후 None 반환 =====
-                    cursor.close()
-                    conn.close()
-                    return None
+            
+            # ===== 2단계: 쿼리 실행 (풀 연결 사용) =====
+            rows = self._fetch_rows(query, (seq,))
+            
+            # ===== 3단계: 조회 결과 처리 =====
+            if not rows:
+                return None
+            
+            row = rows[0]
+            # 조회된 데이터를 딕셔너리로 구성
+            return {
+                'seq': row[0],                              # 시퀀스 번호
+                'contents': row[1],                         # 질문 내용
+                'reply_contents': row[2],                   # 답변 내용
+                'cate_idx': row[3],                         # 카테고리 인덱스
+                'name': row[4],                             # 질문자 이름
+                'regdate': row[5]                           # 등록일자
+            }
             
         except Exception as e:
             # ===== 예외 처리: MSSQL 조회 실패 =====
             logging.error(f"MSSQL 조회 실패: {e}")
             return None
     
+    # MSSQL에서 여러 seq의 문의 데이터를 한 번의 쿼리로 조회하는 메서드
+    # Args:
+    #     seqs: 조회할 문의의 시퀀스 번호 리스트
+    # Returns:
+    #     Dict[int, Dict]: seq → 문의 데이터 (답변 완료된 문의만 포함, 실패시 빈 딕셔너리)
+    def get_mssql_data_batch(self, seqs: List[int]) -> Dict[int, Dict]:
+        if not seqs:
+            return {}
+        
+        try:
+            # ===== 1단계: IN 절 쿼리 구성 (seq 수만큼 파라미터 자리 생성) =====
+            placeholders = ', '.join('?' * len(seqs))
+            query = f"""
+            SELECT seq, contents, reply_contents, cate_idx, name, 
+                   CONVERT(varchar, regdate, 120) as regdate
+            FROM mobile.dbo.bible_inquiry
+            WHERE seq IN ({placeholders}) AND answer_YN = 'Y'
+            """
+            
+            # ===== 2단계: 쿼리 실행 (풀 연결 사용) 및 결과 구성 =====
+            return {
+                int(row[0]): {
+                    'seq': row[0],                                  # 시퀀스 번호
+                    'contents': row[1],                             # 질문 내용
+                    'reply_contents': row[2],                       # 답변 내용
+                    'cate_idx': row[3],                             # 카테고리 인덱스
+                    'name': row[4],                                 # 질문자 이름
+                    'regdate': row[5]                               # 등록일자
+                }
+                for row in self._fetch_rows(query, seqs)
+            }
+            
+        except Exception as e:
+            # ===== 예외 처리: MSSQL 조회 실패 =====
+            logging.error(f"MSSQL 일괄 조회 실패: {e}")
+            return {}
+    
+    # Pinecone 메타데이터 구성 메서드
+    # Args:
+    #     data: MSSQL에서 조회한 문의 데이터
+    #     question: 전처리 및 오타 수정된 질문
+    # Returns:
+    #     Dict[str, Any]: Pinecone 벡터 메타데이터
+    def _build_metadata(self, data: Dict, question: str) -> Dict[str, Any]:
+        return {
+            "seq": int(data['seq']),                        # 문의 시퀀스 번호
+            "question": question,                           # 오타 수정된 질문
+            "answer": self.text_processor.preprocess_text_for_metadata(
+                data['reply_contents'], for_metadata=True   # 메타데이터용 답변 처리
+            ),
+            "category": self.get_category_name(data['cate_idx']),  # 카테고리 이름
+            "name": data['name'] if data['name'] else "익명", # 질문자 이름
+            "regdate": data['regdate'],                     # 등록일자
+            "source": "bible_inquiry_mssql",               # 데이터 출처
+            "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # 동기화 시간
+        }
+    
     # MSSQL 데이터를 Pinecone에 동기화하는 메인 메서드
     # Args:
     #     seq: 동기화할 문의의 시퀀스 번호
@@ -191,6 +325,7 @@ class SyncService:
                     vector_id = f"qa_bible_{seq}"
                     self.index.delete(ids=[vector_id])
                     logging.info(f"Pinecone에서 삭제 완료: {vector_id}")
+                    _notify_sync_listeners(seq, mode)
                     return {"success": True, "message": "삭제 완료", "seq": seq}
                 
                 # ===== 2단계: MSSQL에서 원본 데이터 조회 =====
@@ -209,25 +344,11 @@ class SyncService:
                 # ===== 4단계: 임베딩 벡터 생성 =====
                 # 오타 수정된 질문을 기반으로 임베딩 생성
                 embedding = self.embedding_generator.create_embedding(question)
-                if not embedding:
+                if embedding is None:
                     return {"success": False, "error": "임베딩 생성 실패"}
                 
-                # ===== 5단계: 카테고리 이름 변환 =====
-                category = self.get_category_name(data['cate_idx'])
-                
-                # ===== 6단계: Pinecone 메타데이터 구성 =====
-                metadata = {
-                    "seq": int(data['seq']),                        # 문의 시퀀스 번호
-                    "question": question,                           # 오타 수정된 질문
-                    "answer": self.text_processor.preprocess_text_for_metadata(
-                        data['reply_contents'], for_metadata=True   # 메타데이터용 답변 처리
-                    ),
-                    "category": category,                           # 카테고리 이름
-                    "name": data['name'] if data['name'] else "익명", # 질문자 이름
-                    "regdate": data['regdate'],                     # 등록일자
-                    "source": "bible_inquiry_mssql",               # 데이터 출처
-                    "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # 동기화 시간
-                }
+                # ===== 5-6단계: 카테고리 이름 변환 및 Pinecone 메타데이터 구성 =====
+                metadata = self._build_metadata(data, question)
                 
                 # ===== 7단계: 벡터 ID 생성 및 기존 벡터 확인 =====
                 vector_id = f"qa_bible_{seq}"
@@ -239,7 +360,7 @@ class SyncService:
                 # ===== 8단계: 벡터 데이터 구성 =====
                 vector_data = {
                     "id": vector_id,                                # 고유 벡터 ID
-                    "values": embedding,                            # 임베딩 벡터 값
+                    "values": embedding.tolist(),                   # 임베딩 벡터 값 (Pinecone은 리스트 입력)
                     "metadata": metadata                            # 메타데이터
                 }
                 
@@ -249,6 +370,7 @@ class SyncService:
                 # ===== 10단계: 동기화 완료 처리 =====
                 action = "수정" if is_update else "생성"
                 logging.info(f"Pinecone {action} 완료: {vector_id}")
+                _notify_sync_listeners(seq, mode)
                 
                 # ===== 11단계: 성공 결과 반환 =====
                 return {
@@ -263,3 +385,72 @@ class SyncService:
             # ===== 예외 처리: 동기화 실패 =====
             logging.error(f"Pinecone 동기화 실패: {str(e)}")
             return {"success": False, "error": str(e)}
+    
+    # 여러 문의를 한 번에 Pinecone에 동기화하는 메서드
+    # (MSSQL 1회 조회 → AI 오타 수정 동시 실행 → 임베딩 1회 일괄 생성 → Pinecone 1회 upsert)
+    # Args:
+    #     seqs: 동기화할 문의의 시퀀스 번호 리스트
+    # Returns:
+    #     Dict[str, Any]: 일괄 동기화 결과 정보
+    def sync_batch_to_pinecone(self, seqs: List[int]) -> Dict[str, Any]:
+        try:
+            # ===== 1단계: 중복 제거 및 요청 수 제한 =====
+            seqs = list(dict.fromkeys(int(seq) for seq in seqs))
+            if not seqs:
+                return {"success": False, "error": "seqs가 비어있습니다"}
+            if len(seqs) > SYNC_BATCH_MAX_SEQS:
+                return {"success": False, "error": f"한 번에 최대 {SYNC_BATCH_MAX_SEQS}개까지 동기화할 수 있습니다"}
+            
+            # ===== 2단계: MSSQL에서 원본 데이터 일괄 조회 =====
+            rows = self.get_mssql_data_batch(seqs)
+            found = [seq for seq in seqs if seq in rows]
+            missing = [seq for seq in seqs if seq not in rows]
+            if not found:
+                return {"success": False, "error": "데이터를 찾을 수 없습니다", "missing": missing}
+            
+            # ===== 3단계: 텍스트 전처리 및 AI 오타 수정 (네트워크 대기를 겹치도록 동시 실행) =====
+            raw_questions = [self.text_processor.preprocess_text(rows[seq]['contents']) for seq in found]
+            with ThreadPoolExecutor(max_workers=SYNC_TYPO_FIX_WORKERS) as executor:
+                questions = list(executor.map(self.fix_korean_typos_with_ai, raw_questions))
+            
+            # ===== 4단계: 임베딩 벡터 일괄 생성 (한 번의 API 호출) =====
+            embeddings = self.embedding_generator.create_embeddings_batch(questions)
+            
+            # ===== 5단계: 벡터 데이터 구성 (임베딩 실패 항목 제외) =====
+            vectors = []
+            failed = []
+            for seq, question, embedding in zip(found, questions, embeddings):
+                if embedding is None:
+                    failed.append(seq)
+                    continue
+                vectors.append({
+                    "id": f"qa_bible_{seq}",                    # 고유 벡터 ID
+                    "values": embedding.tolist(),               # 임베딩 벡터 값 (Pinecone은 리스트 입력)
+                    "metadata": self._build_metadata(rows[seq], question)
+                })
+            
+            if not vectors:
+                return {"success": False, "error": "임베딩 생성 실패", "failed": failed, "missing": missing}
+            
+            # ===== 6단계: Pinecone에 벡터 일괄 저장 (upsert) =====
+            self.index.upsert(vectors=vectors)
+            synced = [int(vector['metadata']['seq']) for vector in vectors]
+            logging.info(f"Pinecone 일괄 동기화 완료: {len(synced)}개 (누락 {len(missing)}개, 실패 {len(failed)}개)")
+            
+            # ===== 7단계: 동기화 완료 알림 =====
+            for seq in synced:
+                _notify_sync_listeners(seq, 'upsert')
+            
+            # ===== 8단계: 결과 반환 =====
+            return {
+                "success": True,
+                "message": f"Pinecone 일괄 동기화 완료: {len(synced)}개",
+                "synced": synced,
+                "missing": missing,
+                "failed": failed
+            }
+            
+        except Exception as e:
+            # ===== 예외 처리: 일괄 동기화 실패 =====
+            logging.error(f"Pinecone 일괄 동기화 실패: {str(e)}")
+            return {"success": False, "error": str(e)}
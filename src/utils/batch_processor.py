@@ -19,6 +19,8 @@ from typing import List, Dict, Any, Callable, Optional
 from dataclasses import dataclass
 from queue import Queue, Empty
 
+# 일괄 오타 수정 응답 파싱 패턴 ("T1: 수정문 T2: 수정문 ..." 형식, 모듈 로드시 한 번만 컴파일)
+_TYPO_RESULT_RE = re.compile(r'T(\d+):\s*(.+?)(?=T\d+:|$)', re.DOTALL)
 
 # ===== 배치 요청 데이터 구조 =====
 @dataclass
@@ -653,8 +655,7 @@ T2: [수정된 텍스트2]
                 
                 # ===== 3단계: 결과 파싱 및 매핑 =====
                 # 3-1: 정규식으로 각 텍스트의 수정 결과 추출
-                pattern = r'T(\d+):\s*(.+?)(?=T\d+:|$)'
-                matches = re.findall(pattern, result_text, re.DOTALL)
+                matches = _TYPO_RESULT_RE.findall(result_text)
                 
                 # 3-2: 각 요청에 대한 결과 매핑
                 for i, request in enumerate(batch_requests):
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+로컬 캐시 유사도 계산 커널 모듈
+- numba 설치시 JIT 컴파일된 병렬 커널 사용 (prange로 행 단위 병렬화)
+- numba 미설치시 동일한 시그니처의 NumPy 구현으로 대체
+- 차원별로 함수를 분리 (numba는 동적 차원 분기를 컴파일하지 못함)
+- 사전 컴파일은 백그라운드 스레드에서 실행하여 모듈 import(앱 시작)를 막지 않음
+"""
+
+import logging
+import threading
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # 1차원 임베딩 L2 정규화 커널
+    # Args:
+    #     vec: float32 임베딩 벡터 [d]
+    # Returns:
+    #     np.ndarray: 단위 벡터로 정규화된 새 벡터 [d]
+    @njit(fastmath=True, cache=True)
+    def normalize_embedding_1D(vec):
+        norm = 0.0
+        for i in range(vec.shape[0]):
+            norm += vec[i] * vec[i]
+        norm = max(np.sqrt(norm), 1e-12)
+        out = np.empty(vec.shape[0], dtype=np.float32)
+        for i in range(vec.shape[0]):
+            out[i] = vec[i] / norm
+        return out
+
+    # 2차원 행렬 대상 배치 코사인 유사도 커널
+    # Args:
+    #     query: float32 질문 벡터 [d]
+    #     matrix: 캐시 행렬 [N, d] (float32 또는 int8)
+    #     norms: 캐시 행렬 행별 노름 [N]
+    #     out: 결과를 기록할 float32 배열 [N]
+    @njit(fastmath=True, parallel=True, cache=True)
+    def batched_cosine_2D(query, matrix, norms, out):
+        query_norm = 0.0
+        for j in range(query.shape[0]):
+            query_norm += query[j] * query[j]
+        query_norm = np.sqrt(query_norm)
+
+        for i in prange(matrix.shape[0]):
+            dot = 0.0
+            for j in range(matrix.shape[1]):
+                dot += matrix[i, j] * query[j]
+            out[i] = dot / (norms[i] * query_norm + 1e-12)
+
+    # 2차원 행렬 대상 배치 내적 커널 (정규화된 벡터끼리는 내적 = 코사인 유사도)
+    # Args:
+    #     query: 정규화된 float32 질문 벡터 [d]
+    #     matrix: 캐시 행렬 [N, d] (float32 또는 int8)
+    #     scales: 행별 스케일 (행 * 스케일 = 단위 벡터) [N]
+    #     out: 결과를 기록할 float32 배열 [N]
+    @njit(fastmath=True, parallel=True, cache=True)
+    def batched_dot_2D(query, matrix, scales, out):
+        for i in prange(matrix.shape[0]):
+            dot = 0.0
+            for j in range(matrix.shape[1]):
+                dot += matrix[i, j] * query[j]
+            out[i] = dot * scales[i]
+
+else:
+
+    # 1차원 임베딩 L2 정규화 (NumPy 대체 구현)
+    def normalize_embedding_1D(vec):
+        vec = np.asarray(vec, dtype=np.float32)
+        return vec / max(float(np.linalg.norm(vec)), 1e-12)
+
+    # 2차원 행렬 대상 배치 코사인 유사도 (NumPy 대체 구현)
+    def batched_cosine_2D(query, matrix, norms, out):
+        query = np.asarray(query, dtype=np.float32)
+        out[:] = matrix @ query / (norms * float(np.linalg.norm(query)) + 1e-12)
+
+    # 2차원 행렬 대상 배치 내적 (NumPy 대체 구현)
+    def batched_dot_2D(query, matrix, scales, out):
+        out[:] = (matrix @ np.asarray(query, dtype=np.float32)) * scales
+
+
+# 커널 사전 컴파일 (첫 검색 요청에서 JIT 컴파일 지연이 발생하지 않도록)
+# - 질문 벡터 정규화 커널은 항상 요청 경로에서 쓰이므로 항상 컴파일
+# Args:
+#     dimension: 임베딩 벡터 차원 수
+#     matrix_dtype: 캐시 행렬 자료형 (None이면 행렬 커널은 컴파일하지 않음 - simsimd 등 다른 커널 사용시)
+def warmup_kernels(dimension: int, matrix_dtype=np.int8):
+    if not NUMBA_AVAILABLE:
+        return
+
+    try:
+        dummy_query = np.ones(dimension, dtype=np.float32)
+        normalize_embedding_1D(dummy_query)
+        if matrix_dtype is None:
+            return
+        dummy_matrix = np.ones((1, dimension), dtype=matrix_dtype)
+        dummy_norms = np.ones(1, dtype=np.float32)
+        dummy_out = np.zeros(1, dtype=np.float32)
+        batched_cosine_2D(dummy_query, dummy_matrix, dummy_norms, dummy_out)
+        batched_dot_2D(dummy_query, dummy_matrix, dummy_norms, dummy_out)
+    except Exception as e:
+        logging.error(f"캐시 커널 사전 컴파일 실패: {e}")
+
+
+_warmup_started = set()             # 사전 컴파일을 시작한 (차원, 자료형) 조합
+_warmup_lock = threading.Lock()
+
+
+# 커널 사전 컴파일을 백그라운드 스레드에서 시작 (같은 조합은 프로세스당 한 번만)
+# - 컴파일이 끝나기 전에 검색 요청이 오면 numba가 컴파일 완료까지 기다린 뒤 실행
+# Args:
+#     dimension: 임베딩 벡터 차원 수
+#     matrix_dtype: 캐시 행렬 자료형 (None이면 정규화 커널만 컴파일)
+def start_kernel_warmup(dimension: int, matrix_dtype=np.int8):
+    if not NUMBA_AVAILABLE:
+        return
+
+    key = (dimension, np.dtype(matrix_dtype).str if matrix_dtype is not None else None)
+    with _warmup_lock:
+        if key in _warmup_started:
+            return
+        _warmup_started.add(key)
+
+    threading.Thread(
+        target=warmup_kernels,
+        args=(dimension, matrix_dtype),
+        daemon=True,
+        name='cache-kernel-warmup'
+    ).start()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Pinecone 인덱스 조회 캐시 모듈
+- 같은 질문 벡터로 반복되는 index.query 결과를 클라이언트 측 LRU + TTL 캐시로 재사용
+- 벡터는 float16으로 반올림 후 해시하여 키 생성 (미세한 부동소수점 차이는 같은 키로 취급)
+- 여러 벡터 검색은 스레드 풀로 동시에 요청하여 네트워크 왕복 시간을 겹침
+- upsert/delete/update 호출시 캐시를 비워 동기화된 신규 답변이 바로 반영되도록 함 (무효화 중 진행된 검색 결과는 저장하지 않음)
+- 그 외 메서드(fetch, describe_index_stats 등)는 원본 인덱스로 그대로 위임
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+import numpy as np
+
+# ===== 조회 캐시 설정 =====
+QUERY_CACHE_SIZE = 1024            # 최대 캐시 항목 수 (초과시 LRU 제거)
+QUERY_CACHE_TTL = 600              # 검색 결과 유효 시간(초)
+QUERY_BATCH_WORKERS = 5            # query_batch 동시 요청 수 (Pinecone 요청 한도보다 충분히 낮게 유지)
+
+
+# ===== 캐시를 적용한 Pinecone 인덱스 래퍼 =====
+class CachedIndex:
+
+    # CachedIndex 초기화
+    # Args:
+    #     index: 원본 Pinecone 인덱스 객체
+    #     max_size: 최대 캐시 항목 수
+    #     ttl: 검색 결과 유효 시간(초)
+    #     max_workers: query_batch 동시 요청 수
+    def __init__(self, index, max_size: int = QUERY_CACHE_SIZE, ttl: float = QUERY_CACHE_TTL,
+                 max_workers: int = QUERY_BATCH_WORKERS):
+        self._index = index                                   # 원본 Pinecone 인덱스
+        self.max_size = max_size                              # 최대 캐시 항목 수
+        self.ttl = ttl                                        # 결과 유효 시간(초)
+        self._cache = OrderedDict()                           # 캐시 키 → (검색 결과, 저장 시각)
+        self._lock = threading.Lock()                         # 멀티스레드 요청 간 캐시 보호
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.stats = {'hits': 0, 'misses': 0}                 # 캐시 적중/실패 횟수
+        self._generation = 0                                  # 캐시 무효화 세대 (clear_cache마다 증가)
+
+    # 원본 인덱스 속성 위임 (fetch, describe_index_stats 등)
+    def __getattr__(self, name):
+        return getattr(self._index, name)
+
+    # 검색 캐시 키 생성 (float16 반올림 벡터 해시 + 나머지 검색 조건)
+    # Args:
+    #     vector: 질문 임베딩 벡터
+    #     kwargs: top_k, include_metadata 등 검색 조건
+    # Returns:
+    #     str: 캐시 키
+    @staticmethod
+    def _make_key(vector, kwargs: dict) -> str:
+        digest = hashlib.blake2b(np.asarray(vector, dtype=np.float16).tobytes(), digest_size=16)
+        digest.update(repr(sorted(kwargs.items())).encode('utf-8'))
+        return digest.hexdigest()
+
+    # 벡터 검색 메서드 (캐시 적중시 Pinecone 호출 생략)
+    # Args:
+    #     kwargs: 원본 index.query 인자 (vector가 없으면 캐시 없이 원본 호출)
+    # Returns:
+    #     Any: 원본 index.query 결과 (캐시된 결과는 여러 호출자가 공유하므로 읽기 전용으로 사용)
+    def query(self, *args, **kwargs):
+        vector = kwargs.get('vector')
+        if args or vector is None:
+            return self._index.query(*args, **kwargs)
+
+        # ===== 1단계: 캐시 조회 (유효 시간 내 결과만 사용) =====
+        key = self._make_key(vector, {k: v for k, v in kwargs.items() if k != 'vector'})
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[1] < self.ttl:
+                self._cache.move_to_end(key)
+                self.stats['hits'] += 1
+                return entry[0]
+            self.stats['misses'] += 1
+            generation = self._generation
+
+        # ===== 2단계: Pinecone 검색 후 캐시 저장 =====
+        # 검색 중에 upsert/delete/update로 캐시가 무효화되었으면 동기화 이전 결과이므로 저장하지 않음
+        result = self._index.query(**kwargs)
+        with self._lock:
+            if generation != self._generation:
+                return result
+            self._cache[key] = (result, now)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return result
+
+    # 여러 벡터 검색을 동시에 실행하는 메서드
+    # Args:
+    #     vectors: 질문 임베딩 벡터 리스트
+    #     kwargs: 모든 검색에 공통으로 적용할 검색 조건
+    # Returns:
+    #     List[Any]: 입력 순서대로의 검색 결과
+    def query_batch(self, vectors: List[Any], **kwargs) -> List[Any]:
+        return list(self._executor.map(lambda vector: self.query(vector=vector, **kwargs), vectors))
+
+    # 캐시 전체 삭제
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+            self._generation += 1
+
+    # 벡터 추가/수정 (완료 후 캐시 무효화)
+    def upsert(self, *args, **kwargs):
+        try:
+            return self._index.upsert(*args, **kwargs)
+        finally:
+            self.clear_cache()
+
+    # 벡터 삭제 (완료 후 캐시 무효화)
+    def delete(self, *args, **kwargs):
+        try:
+            return self._index.delete(*args, **kwargs)
+        finally:
+            self.clear_cache()
+
+    # 벡터 메타데이터 수정 (완료 후 캐시 무효화)
+    def update(self, *args, **kwargs):
+        try:
+            return self._index.update(*args, **kwargs)
+        finally:
+            self.clear_cache()
+
+    # 캐시 통계 조회
+    # Returns:
+    #     dict: 적중/실패 횟수, 적중률, 현재 항목 수
+    def get_stats(self) -> dict:
+        with self._lock:
+            total = self.stats['hits'] + self.stats['misses']
+            return {
+                'hits': self.stats['hits'],
+                'misses': self.stats['misses'],
+                'hit_rate': self.stats['hits'] / total if total else 0.0,
+                'size': len(self._cache)
+            }
@@ -4,12 +4,20 @@
 메모리 관리 유틸리티 모듈
 - AI API 호출 및 대용량 데이터 처리시 메모리 최적화
 - 컨텍스트 매니저를 통한 자동 메모리 정리
-- 가비지 컬렉션 강제 실행으로 메모리 누수 방지
+- 젊은 세대 가비지 컬렉션으로 순환 참조 임시 객체 정리 (전체 힙 순회 없음)
 """
 
 import gc
+import threading
 from contextlib import contextmanager
 
+# 스레드별 memory_cleanup 중첩 깊이 (가장 바깥 블록 종료시에만 가비지 컬렉션 실행)
+_cleanup_state = threading.local()
+
+# 블록 종료시 정리할 최대 세대 (0, 1세대만 순회하여 살아있는 전체 객체 수와 무관한 짧은 정지)
+# 오래 살아남은 객체의 전체 컬렉션은 인터프리터 자동 GC와 요청 경계의 RSS 임계값 검사에 맡김
+MEMORY_CLEANUP_GENERATION = 1
+
 
 # ===== 메모리 정리를 위한 컨텍스트 매니저 =====
 @contextmanager
@@ -17,12 +25,16 @@ def memory_cleanup():
     # 메모리 정리를 위한 컨텍스트 매니저
     # - with 블록 실행 전후로 메모리 정리 수행
     # - AI API 호출, 대용량 데이터 처리시 메모리 누수 방지
-    # - 자동 가비지 컬렉션으로 메모리 효율성 향상
+    # - 중첩 사용시 가장 바깥 블록이 끝날 때 한 번만 가비지 컬렉션 실행
+    depth = getattr(_cleanup_state, 'depth', 0)
+    _cleanup_state.depth = depth + 1
     try:
         # ===== 1단계: with 블록 내부 코드 실행 =====
         # 사용자가 with memory_cleanup(): 블록에서 실행하는 코드
         yield
     finally:
-        # ===== 2단계: 메모리 정리 (항상 실행) =====
+        # ===== 2단계: 메모리 정리 (가장 바깥 블록에서만 실행) =====
         # with 블록이 정상 종료되거나 예외 발생시에도 반드시 실행
-        gc.collect()  # 가비지 컬렉션 강제 실행으로 메모리 정리
+        _cleanup_state.depth = depth
+        if depth == 0:
+            gc.collect(MEMORY_CLEANUP_GENERATION)  # 블록에서 생긴 젊은 세대 객체만 정리
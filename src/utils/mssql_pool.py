@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+MSSQL 연결 풀 모듈
+- 요청마다 TCP + 로그인 핸드셰이크를 반복하지 않도록 pyodbc 연결을 재사용
+- 연결 문자열별 풀을 프로세스 공용으로 관리 (동기화 서비스, DB 업데이트 공용)
+- 동시에 빌려줄 수 있는 연결 수를 제한하여 SQL Server 연결 한도 보호
+- 오래 쉬고 있던 연결은 빌려주기 전에 SELECT 1로 확인, 오류가 난 연결은 풀에 돌려놓지 않고 폐기
+- 각 연결은 한 번에 한 스레드만 사용 (get_conn 블록 안에서만 사용)
+- 연결 문자열은 build_connection_string으로 한 곳에서 구성 (ODBC Driver 18, 큰 TDS 패킷)
+- fork된 워커 프로세스는 부모의 연결을 물려받지 않고 자기 풀을 새로 생성
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+import pyodbc
+
+# 연결 재사용은 이 모듈의 풀이 담당하므로 ODBC 드라이버 관리자의 풀링은 끔 (첫 연결 전에 설정해야 적용됨)
+pyodbc.pooling = False
+
+# ===== 연결 문자열 설정 =====
+MSSQL_ODBC_DRIVER = os.getenv('MSSQL_ODBC_DRIVER', 'ODBC Driver 18 for SQL Server')  # TLS 1.3 지원 드라이버
+MSSQL_PACKET_SIZE = 32767           # TDS 패킷 크기(바이트) - 큰 결과셋을 더 적은 패킷으로 수신
+MSSQL_CONNECT_TIMEOUT = 30          # 연결 타임아웃(초)
+MSSQL_QUERY_TIMEOUT = 30            # 쿼리 실행 타임아웃(초) - 응답 없는 쿼리가 풀 연결을 계속 점유하지 않도록
+
+# ===== 연결 풀 설정 =====
+MSSQL_POOL_MIN_SIZE = 2             # 시작시 미리 열어둘 연결 수
+MSSQL_POOL_MAX_SIZE = 20            # 동시에 사용할 수 있는 최대 연결 수
+MSSQL_POOL_TIMEOUT = 30             # 연결을 빌리기 위해 기다릴 최대 시간(초)
+MSSQL_POOL_VALIDATE_AFTER = 60      # 이 시간(초) 이상 쉬었던 연결은 SELECT 1로 확인 후 사용
+
+
+# MSSQL 연결 문자열 구성
+# - Driver 18은 암호화가 기본값이므로 Encrypt=yes를 명시하고, 자체 서명 인증서 서버를 위해 인증서 신뢰 유지
+# Args:
+#     server: 데이터베이스 서버 주소
+#     database: 데이터베이스명
+#     username: 접속 사용자명
+#     password: 접속 비밀번호
+# Returns:
+#     str: pyodbc 연결 문자열
+def build_connection_string(server: str, database: str, username: str, password: str) -> str:
+    return (
+        f"DRIVER={{{MSSQL_ODBC_DRIVER}}};"            # SQL Server 드라이버
+        f"SERVER={server},1433;"                      # 서버:포트
+        f"DATABASE={database};"                       # 데이터베이스명
+        f"UID={username};"                            # 사용자명
+        f"PWD={password};"                            # 비밀번호
+        f"Encrypt=yes;"                               # 전송 구간 암호화 (Driver 18 기본값)
+        f"TrustServerCertificate=yes;"                # SSL 인증서 신뢰 (Azure SQL용)
+        f"Packet Size={MSSQL_PACKET_SIZE};"           # TDS 패킷 크기
+        f"Connection Timeout={MSSQL_CONNECT_TIMEOUT};"  # 연결 타임아웃
+    )
+
+
+# ===== 연결 문자열 하나에 대한 연결 풀 =====
+class MSSQLConnectionPool:
+
+    # MSSQLConnectionPool 초기화
+    # Args:
+    #     connection_string: MSSQL 데이터베이스 연결 문자열
+    #     min_size: warmup시 미리 열어둘 연결 수
+    #     max_size: 동시에 사용할 수 있는 최대 연결 수
+    #     timeout: 연결을 빌리기 위해 기다릴 최대 시간(초)
+    def __init__(self, connection_string: str, min_size: int = MSSQL_POOL_MIN_SIZE,
+                 max_size: int = MSSQL_POOL_MAX_SIZE, timeout: float = MSSQL_POOL_TIMEOUT):
+        self.connection_string = connection_string
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()                        # (연결, 반환 시각) - 최근 반환된 연결부터 재사용
+        self._slots = threading.BoundedSemaphore(max_size)    # 사용 중인 연결 수 제한
+
+    # 새 연결 생성
+    # autocommit: 실행 후 열린 트랜잭션이 남지 않아 연결을 그대로 재사용 가능
+    def _connect(self):
+        conn = pyodbc.connect(self.connection_string, autocommit=True)
+        conn.timeout = MSSQL_QUERY_TIMEOUT
+        return conn
+
+    # 유휴 연결이 아직 사용 가능한지 확인
+    # Args:
+    #     conn: 확인할 연결
+    #     idle_time: 풀에서 쉬었던 시간(초)
+    # Returns:
+    #     bool: 사용 가능 여부
+    @staticmethod
+    def _is_alive(conn, idle_time: float) -> bool:
+        if getattr(conn, 'closed', False):
+            return False
+        if idle_time < MSSQL_POOL_VALIDATE_AFTER:
+            return True
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            finally:
+                cursor.close()
+            return True
+        except pyodbc.Error:
+            return False
+
+    # 풀에서 연결 빌리기 (유휴 연결이 없으면 새로 연결)
+    # Returns:
+    #     pyodbc.Connection: 사용 가능한 연결
+    # Raises:
+    #     TimeoutError: timeout 동안 빈 자리가 나지 않은 경우
+    def acquire(self):
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError(f"MSSQL 연결 풀 대기 시간 초과 ({self.timeout}초, 최대 {self.max_size}개)")
+        try:
+            while True:
+                try:
+                    conn, released_at = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect()
+                if self._is_alive(conn, time.monotonic() - released_at):
+                    return conn
+                _close_conn(conn)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    # 사용이 끝난 연결을 풀에 반환
+    # Args:
+    #     conn: 반환할 연결
+    def release(self, conn):
+        self._idle.put((conn, time.monotonic()))
+        self._slots.release()
+
+    # 오류가 난 연결을 풀에 넣지 않고 종료
+    # Args:
+    #     conn: 폐기할 연결
+    def discard(self, conn):
+        _close_conn(conn)
+        self._slots.release()
+
+    # 시작시 min_size개의 연결을 미리 열어 첫 요청의 연결 지연 제거
+    # Returns:
+    #     int: 새로 열린 연결 수
+    def warmup(self) -> int:
+        opened = 0
+        try:
+            while self._idle.qsize() < self.min_size:
+                self._idle.put((self._connect(), time.monotonic()))
+                opened += 1
+        except pyodbc.Error as e:
+            logging.error(f"MSSQL 연결 풀 예열 실패 ({opened}개 연결 후): {e}")
+        return opened
+
+    # 유휴 연결 전부 종료 (프로세스 종료시)
+    def close_all(self):
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            _close_conn(conn)
+
+
+# 연결 종료 (이미 끊긴 연결의 종료 오류는 무시)
+# Args:
+#     conn: 종료할 연결
+def _close_conn(conn):
+    try:
+        conn.close()
+    except pyodbc.Error:
+        pass
+
+
+# ===== 프로세스 공용 풀 (연결 문자열 → 풀, 처음 사용시 생성) =====
+_pools: Dict[str, MSSQLConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+# fork된 자식 프로세스에서 공용 풀 초기화 (부모가 연 연결의 소켓을 자식이 함께 쓰지 않도록)
+# - 부모의 연결은 닫지 않고 보관만 함 (자식에서 닫으면 부모가 쓰는 세션에 로그아웃 패킷이 전송됨)
+# - 자식은 처음 get_pool 호출시 자기 연결을 새로 엶
+def _reset_pools_after_fork():
+    global _pools, _pools_lock
+    _inherited_pools.extend(_pools.values())
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+
+_inherited_pools = []   # fork 이전 부모 프로세스의 풀 (자식에서는 사용하지 않음)
+os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+# 연결 문자열에 해당하는 연결 풀 조회 (없으면 생성)
+# Args:
+#     connection_string: MSSQL 데이터베이스 연결 문자열
+# Returns:
+#     MSSQLConnectionPool: 연결 풀
+def get_pool(connection_string: str) -> MSSQLConnectionPool:
+    pool = _pools.get(connection_string)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(connection_string)
+            if pool is None:
+                pool = _pools[connection_string] = MSSQLConnectionPool(connection_string)
+    return pool
+
+
+# 풀 연결을 블록 안에서만 빌려 쓰는 컨텍스트 매니저
+# - 정상 종료시 풀에 반환, 블록에서 예외가 나면 연결을 폐기
+# Args:
+#     connection_string: MSSQL 데이터베이스 연결 문자열
+# Yields:
+#     pyodbc.Connection: 이 블록에서만 사용하는 연결
+@contextmanager
+def get_conn(connection_string: str):
+    pool = get_pool(connection_string)
+    conn = pool.acquire()
+    ok = False
+    try:
+        yield conn
+        ok = True
+    finally:
+        if ok:
+            pool.release(conn)
+        else:
+            pool.discard(conn)
+
+
+# 모든 풀의 유휴 연결 종료 (프로세스 종료시 호출)
+def close_all_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_all()
@@ -9,6 +9,7 @@ import logging
 import pyodbc
 import os
 from typing import Optional
+from src.utils.mssql_pool import get_conn, build_connection_string
 
 class MSSQLUpdater:
     """MSSQL 데이터베이스 업데이트 클래스"""
@@ -38,15 +39,8 @@ class MSSQLUpdater:
         if not all([server, database, username, password]):
             raise ValueError("MSSQL 환경변수가 설정되지 않았습니다")
         
-        return (
-            f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-            f"SERVER={server},1433;"
-            f"DATABASE={database};"
-            f"UID={username};"
-            f"PWD={password};"
-            f"TrustServerCertificate=yes;"
-            f"Connection Timeout=30;"
-        )
+        # free_4와 같은 연결 문자열이어야 같은 연결 풀을 공유함
+        return build_connection_string(server, database, username, password)
     
     def update_inquiry_answer(self, seq: int, answer: str, answer_yn: str = 'N') -> bool:
         """
@@ -60,28 +54,29 @@ class MSSQLUpdater:
         Returns:
             bool: 업데이트 성공 여부
         """
-        conn = None
-        cursor = None
-        
         try:
-            # MSSQL 연결
-            conn = pyodbc.connect(self.connection_string)
-            cursor = conn.cursor()
-            
-            # SQL 쿼리 작성 (SQL Injection 방지를 위해 파라미터 사용)
-            sql = """
-                UPDATE mobile.dbo.bible_inquiry 
-                SET reply_contents = ?, 
-                    answer_YN = ?
-                WHERE seq = ?
-            """
-            
-            # 쿼리 실행
-            cursor.execute(sql, (answer, answer_yn, seq))
-            conn.commit()
+            # MSSQL 연결 (풀 연결은 autocommit이므로 단일 UPDATE는 실행 즉시 반영,
+            # 오류가 난 연결은 풀에 반환하지 않고 폐기됨)
+            with get_conn(self.connection_string) as conn:
+                cursor = conn.cursor()
+                try:
+                    # SQL 쿼리 작성 (SQL Injection 방지를 위해 파라미터 사용)
+                    sql = """
+                        UPDATE mobile.dbo.bible_inquiry 
+                        SET reply_contents = ?, 
+                            answer_YN = ?
+                        WHERE seq = ?
+                    """
+                    
+                    # 쿼리 실행
+                    cursor.execute(sql, (answer, answer_yn, seq))
+                    rowcount = cursor.rowcount
+                finally:
+                    # 리소스 정리
+                    cursor.close()
             
             # 영향받은 행 수 확인
-            if cursor.rowcount > 0:
+            if rowcount > 0:
                 logging.info(f"✅ DB 업데이트 성공: SEQ={seq}, answer_YN={answer_yn}, 답변 길이={len(answer)}자")
                 return True
             else:
@@ -91,23 +86,12 @@ class MSSQLUpdater:
         except pyodbc.Error as e:
             # MSSQL 관련 오류
             logging.error(f"❌ MSSQL 오류 - SEQ={seq}: {str(e)}")
-            if conn:
-                conn.rollback()
             return False
             
         except Exception as e:
             # 기타 예외
             logging.error(f"❌ 예상치 못한 오류 - SEQ={seq}: {str(e)}")
-            if conn:
-                conn.rollback()
             return False
-            
-        finally:
-            # 리소스 정리
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
     
     def get_inquiry_info(self, seq: int) -> Optional[dict]:
         """
@@ -119,22 +103,21 @@ class MSSQLUpdater:
         Returns:
             dict: 문의 정보 (없으면 None)
         """
-        conn = None
-        cursor = None
-        
         try:
-            conn = pyodbc.connect(self.connection_string)
-            cursor = conn.cursor()
-            
-            sql = """
-                SELECT seq, contents, reply_contents, answer_YN, 
-                       ISNULL(option_lang, 'kr') as option_lang
-                FROM mobile.dbo.bible_inquiry 
-                WHERE seq = ?
-            """
-            
-            cursor.execute(sql, (seq,))
-            row = cursor.fetchone()
+            with get_conn(self.connection_string) as conn:
+                cursor = conn.cursor()
+                try:
+                    sql = """
+                        SELECT seq, contents, reply_contents, answer_YN, 
+                               ISNULL(option_lang, 'kr') as option_lang
+                        FROM mobile.dbo.bible_inquiry 
+                        WHERE seq = ?
+                    """
+                    
+                    cursor.execute(sql, (seq,))
+                    row = cursor.fetchone()
+                finally:
+                    cursor.close()
             
             if row:
                 return {
@@ -150,28 +133,19 @@ class MSSQLUpdater:
         except Exception as e:
             logging.error(f"문의 정보 조회 실패 - SEQ={seq}: {str(e)}")
             return None
-            
-        finally:
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
     
     def test_connection(self) -> bool:
         """
-        DB 연결 테스트
+        DB 연결 테스트 (성공한 연결은 풀에 남아 첫 요청에서 재사용)
         
         Returns:
             bool: 연결 성공 여부
         """
-        conn = None
         try:
-            conn = pyodbc.connect(self.connection_string)
+            with get_conn(self.connection_string):
+                pass
             logging.info("✅ MSSQL 연결 테스트 성공")
             return True
         except Exception as e:
             logging.error(f"❌ MSSQL 연결 테스트 실패: {str(e)}")
-            return False
-        finally:
-            if conn:
-                conn.close()
\ No newline at end of file
+            return False
\ No newline at end of file
@@ -0,0 +1,465 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+인프로세스 시맨틱 질문 캐시 모듈
+- 정규화된 질문 텍스트 기반 정확 일치(LRU) 캐시
+- 임베딩 코사인 유사도 기반 유사 질문 캐시 (임계값 이상이면 재사용)
+- 임베딩 API 호출 및 Pinecone 검색 왕복 시간 절감
+- simsimd 설치시 SIMD 커널로 유사도 계산 (미설치시 numba/NumPy 커널)
+- 임베딩은 int8 + 벡터별 스케일로 양자화 저장 (float32 대비 메모리 1/4)
+- 저장시 단위 벡터로 정규화하여 조회는 내적만으로 코사인 유사도 계산
+- db_path 지정시 SQLite에 영구 저장하여 프로세스 재시작 후에도 재사용
+- 검색 결과는 검색 조건(params)이 같고 result_ttl 이내일 때만 재사용
+- hnswlib 설치시 항목 수가 hnsw_min_size 이상이면 HNSW 근사 검색으로 후보 선택
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.cache_kernels import batched_dot_2D, normalize_embedding_1D, start_kernel_warmup
+
+try:
+    import simsimd  # SIMD 가속 유사도 커널 (AVX2/AVX-512/NEON)
+except ImportError:
+    simsimd = None
+
+try:
+    import hnswlib  # HNSW 근사 최근접 이웃 검색
+except ImportError:
+    hnswlib = None
+
+# int8 스캔 후 float32 재정렬할 상위 후보 수
+RERANK_TOP_K = 32
+# HNSW 인덱스 설정 (항목 수가 HNSW_MIN_SIZE 이상일 때 전수 스캔 대신 사용)
+HNSW_MIN_SIZE = 10000
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+
+
+# ===== 시맨틱 질문 캐시 클래스 =====
+class SemanticQueryCache:
+
+    # SemanticQueryCache 초기화
+    # Args:
+    #     dimension: 임베딩 벡터 차원 수
+    #     max_size: 최대 캐시 항목 수 (초과시 LRU 방식으로 제거)
+    #     threshold: 유사 질문으로 판단할 코사인 유사도 임계값
+    #     db_path: 영구 저장용 SQLite 파일 경로 (None이면 메모리에만 저장)
+    #     result_ttl: 검색 결과 유효 시간(초) (None이면 만료 없음, 임베딩은 만료되지 않음)
+    #     hnsw_min_size: HNSW 인덱스로 전환할 최소 항목 수 (hnswlib 설치시)
+    def __init__(self, dimension: int = 1536, max_size: int = 10000, threshold: float = 0.95,
+                 db_path: Optional[str] = None, result_ttl: Optional[float] = None,
+                 hnsw_min_size: int = HNSW_MIN_SIZE):
+        self.dimension = dimension
+        self.max_size = max_size
+        self.threshold = threshold
+        self.result_ttl = result_ttl
+        self.hnsw_min_size = hnsw_min_size
+
+        # ===== 1단계: LRU 순서 관리 (정규화 질문 → 슬롯 번호) =====
+        self._entries = OrderedDict()
+
+        # ===== 2단계: 슬롯별 저장소 (행렬 행 번호 = 슬롯 번호) =====
+        self._slot_keys: List[Optional[str]] = []                 # 슬롯 → 정규화 질문
+        self._slot_matches: List[Optional[list]] = []             # 슬롯 → 캐시된 검색 결과
+        self._slot_params: List[Optional[str]] = []               # 슬롯 → 검색 결과의 검색 조건
+        self._slot_matches_ts: List[float] = []                   # 슬롯 → 검색 결과 저장 시각
+        self._vectors = np.zeros((0, dimension), dtype=np.int8)   # 양자화된 임베딩 행렬
+        self._scales = np.zeros(0, dtype=np.float32)              # 벡터별 역양자화 스케일 (단위 노름 보정 포함)
+        self._valid = np.zeros(0, dtype=bool)                     # 유효 슬롯 마스크
+        self._free_slots: List[int] = []                          # 재사용 가능한 슬롯
+        self._size = 0                                            # 사용된 슬롯 수 (최고 수위)
+        self._hnsw = None                                         # HNSW 인덱스 (라벨 = 슬롯 번호)
+        self._hnsw_labels = set()                                 # HNSW에 추가된 적 있는 슬롯
+
+        # ===== 3단계: 캐시 통계 =====
+        self.stats = {'exact_hits': 0, 'semantic_hits': 0, 'misses': 0}
+
+        # ===== 4단계: 커널 사전 컴파일 (백그라운드 스레드) =====
+        # 질문 벡터 정규화 커널은 항상 사용, 행렬 스캔 커널은 simsimd가 없을 때만 사용
+        start_kernel_warmup(dimension, np.int8 if simsimd is None else None)
+
+        # ===== 5단계: 영구 저장소 연결 및 이전 세션 캐시 로드 =====
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if db_path:
+            self._open_db(db_path)
+
+    # SQLite 영구 저장소 연결 및 최근 항목 로드 메서드
+    # Args:
+    #     db_path: SQLite 파일 경로
+    def _open_db(self, db_path: str):
+        try:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS query_cache (
+                    query_key TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL,
+                    scale REAL NOT NULL,
+                    matches_json TEXT,
+                    params TEXT,
+                    matches_ts REAL,
+                    ts REAL NOT NULL,
+                    hit_count INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            # 이전 버전 스키마에 검색 조건 컬럼 추가
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(query_cache)")}
+            for column, column_type in (('params', 'TEXT'), ('matches_ts', 'REAL')):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE query_cache ADD COLUMN {column} {column_type}")
+            self._conn.commit()
+
+            # 최근 사용 순으로 max_size개만 로드 (오래된 것부터 넣어 LRU 순서 유지)
+            rows = self._conn.execute(
+                "SELECT query_key, vector, matches_json, params, matches_ts FROM query_cache "
+                "ORDER BY ts DESC LIMIT ?",
+                (self.max_size,)
+            ).fetchall()
+            for key, blob, matches_json, params, matches_ts in reversed(rows):
+                quantized = np.frombuffer(blob, dtype=np.int8)
+                if quantized.shape[0] != self.dimension:
+                    continue
+                matches = json.loads(matches_json) if matches_json else None
+                self._store(key, quantized, matches, params, matches_ts or 0.0)
+
+            logging.info(f"시맨틱 캐시 로드 완료: {len(self._entries)}개 ({db_path})")
+
+        except Exception as e:
+            logging.error(f"시맨틱 캐시 저장소 연결 실패: {e}")
+            self._conn = None
+
+    # 캐시 키용 질문 정규화 메서드
+    # Args:
+    #     query: 원본 질문
+    # Returns:
+    #     str: NFKC 정규화 + 공백 제거 + 소문자 변환된 질문
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return unicodedata.normalize('NFKC', query).strip().lower()
+
+    # 슬롯의 검색 결과 재사용 가능 여부 확인 메서드
+    # Args:
+    #     slot: 슬롯 번호
+    #     params: 요청한 검색 조건 (None이면 조건 비교 생략)
+    # Returns:
+    #     bool: 검색 결과가 있고, 조건이 같고, 만료되지 않았으면 True
+    def _matches_usable(self, slot: int, params: Optional[str]) -> bool:
+        if self._slot_matches[slot] is None:
+            return False
+        if params is not None and self._slot_params[slot] != params:
+            return False
+        if self.result_ttl is not None and time.time() - self._slot_matches_ts[slot] > self.result_ttl:
+            return False
+        return True
+
+    # 정확 일치 캐시 조회 메서드
+    # Args:
+    #     query: 조회할 질문
+    #     params: 검색 조건 (예: top_k, 임계값) - 다르거나 만료된 검색 결과는 None으로 반환
+    # Returns:
+    #     Optional[Tuple[np.ndarray, Optional[list]]]: (임베딩, 검색 결과) 또는 None
+    def get_exact(self, query: str, params: Optional[str] = None) -> Optional[Tuple[np.ndarray, Optional[list]]]:
+        key = self.normalize_query(query)
+        slot = self._entries.get(key)
+        if slot is None:
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats['exact_hits'] += 1
+        self._record_hit(key)
+        matches = self._slot_matches[slot] if self._matches_usable(slot, params) else None
+        return self._dequantize(np.array([slot]))[0], matches
+
+    # 유사 질문 캐시 조회 메서드 (코사인 유사도 기반, 캐시 벡터는 정규화되어 있어 내적 = 코사인)
+    # Args:
+    #     vector: 질문 임베딩 벡터
+    #     params: 검색 조건 (같은 조건으로 저장된 유효한 결과만 재사용)
+    # Returns:
+    #     Optional[list]: 임계값 이상 유사한 질문의 캐시된 검색 결과 (없으면 None)
+    def get_similar(self, vector: Any, params: Optional[str] = None) -> Optional[list]:
+        if not self._entries:
+            self.stats['misses'] += 1
+            return None
+
+        try:
+            # ===== 1단계: 후보 슬롯 선택 (HNSW 근사 검색 또는 int8 행렬 전수 스캔) =====
+            query_vec = normalize_embedding_1D(np.ascontiguousarray(vector, dtype=np.float32))
+            if self._hnsw is not None:
+                k = min(RERANK_TOP_K, len(self._entries))
+                labels, _ = self._hnsw.knn_query(query_vec, k=k)
+                candidates = labels[0].astype(np.int64)
+            else:
+                candidates = self._scan_candidates(query_vec)
+            candidates = candidates[self._valid[candidates]]
+
+            # ===== 2단계: 상위 후보만 float32 질문 벡터로 재정렬 =====
+            if len(candidates) > 0:
+                # 행렬-벡터 곱 한 번 후 행별 스케일 적용 (후보 행렬 전체에 스케일을 곱하는 역양자화 생략)
+                rerank_scores = (self._vectors[candidates].astype(np.float32) @ query_vec) * self._scales[candidates]
+
+                # ===== 3단계: 최고 유사도 슬롯 확인 =====
+                best_pos = int(np.argmax(rerank_scores))
+                best = int(candidates[best_pos])
+                best_score = float(rerank_scores[best_pos])
+                if best_score >= self.threshold and self._matches_usable(best, params):
+                    self._entries.move_to_end(self._slot_keys[best])
+                    self.stats['semantic_hits'] += 1
+                    self._record_hit(self._slot_keys[best])
+                    logging.debug(f"시맨틱 캐시 히트: 유사도={best_score:.4f}")
+                    return self._slot_matches[best]
+
+        except Exception as e:
+            logging.error(f"시맨틱 캐시 조회 실패: {e}")
+
+        self.stats['misses'] += 1
+        return None
+
+    # int8 캐시 행렬 전수 스캔으로 상위 후보 슬롯 선택 메서드
+    # Args:
+    #     query_vec: 정규화된 float32 질문 벡터
+    # Returns:
+    #     np.ndarray: 유사도 상위 RERANK_TOP_K개 슬롯 번호
+    def _scan_candidates(self, query_vec: np.ndarray) -> np.ndarray:
+        n = self._size
+        if simsimd is not None:
+            # SimSIMD int8 코사인 거리(1 - 유사도)를 유사도로 변환
+            distances = simsimd.cdist(self._quantize(query_vec).reshape(1, -1), self._vectors[:n], metric='cosine')
+            scores = 1.0 - np.asarray(distances, dtype=np.float32).reshape(-1)
+        else:
+            # 행별 스케일을 곱한 내적 = 정규화된 벡터 간 코사인 유사도
+            scores = np.empty(n, dtype=np.float32)
+            batched_dot_2D(query_vec, self._vectors[:n], self._scales[:n], scores)
+        scores[~self._valid[:n]] = -1.0
+
+        k = min(RERANK_TOP_K, n)
+        return np.argpartition(-scores, k - 1)[:k]
+
+    # HNSW 인덱스 생성 메서드 (현재 유효한 슬롯 전체를 한 번에 추가)
+    def _build_hnsw(self):
+        try:
+            index = hnswlib.Index(space='ip', dim=self.dimension)
+            index.init_index(max_elements=self.max_size, ef_construction=HNSW_EF_CONSTRUCTION, M=HNSW_M)
+            index.set_ef(max(HNSW_EF_SEARCH, RERANK_TOP_K))
+
+            slots = np.flatnonzero(self._valid[:self._size])
+            index.add_items(self._dequantize(slots), slots)
+            self._hnsw = index
+            self._hnsw_labels = set(slots.tolist())
+            logging.info(f"시맨틱 캐시 HNSW 인덱스 생성: {len(slots)}개")
+
+        except Exception as e:
+            logging.error(f"시맨틱 캐시 HNSW 인덱스 생성 실패: {e}")
+            self._hnsw = None
+
+    # HNSW 인덱스에 슬롯 추가/갱신 메서드
+    # Args:
+    #     slot: 추가할 슬롯 번호
+    def _hnsw_add(self, slot: int):
+        try:
+            # 제거 후 재사용되는 슬롯은 삭제 표시를 풀고 벡터 갱신
+            if slot in self._hnsw_labels:
+                self._hnsw.unmark_deleted(slot)
+            self._hnsw.add_items(self._dequantize(np.array([slot])), np.array([slot]))
+            self._hnsw_labels.add(slot)
+
+        except Exception as e:
+            logging.error(f"시맨틱 캐시 HNSW 추가 실패: {e}")
+
+    # 슬롯 벡터 역양자화 메서드
+    # Args:
+    #     slots: 슬롯 번호 배열
+    # Returns:
+    #     np.ndarray: 단위 노름 float32 벡터 행렬 [len(slots), dimension]
+    def _dequantize(self, slots: np.ndarray) -> np.ndarray:
+        return self._vectors[slots].astype(np.float32) * self._scales[slots, None]
+
+    # 캐시 저장 메서드
+    # Args:
+    #     query: 원본 질문
+    #     vector: 질문 임베딩 벡터
+    #     matches: 검색 결과 (None이면 임베딩만 저장)
+    #     params: 검색 결과의 검색 조건
+    def put(self, query: str, vector: Any, matches: Optional[list] = None, params: Optional[str] = None):
+        key = self.normalize_query(query)
+
+        # ===== 1단계: 기존 항목 갱신 =====
+        slot = self._entries.get(key)
+        if slot is not None:
+            self._entries.move_to_end(key)
+            if matches is not None:
+                self._slot_matches[slot] = matches
+                self._slot_params[slot] = params
+                self._slot_matches_ts[slot] = time.time()
+                self._persist(key, slot)
+            return
+
+        # ===== 2단계: 단위 벡터로 정규화 + 양자화 후 메모리 저장 =====
+        quantized = self._quantize(normalize_embedding_1D(np.ascontiguousarray(vector, dtype=np.float32)))
+        evicted_key = self._store(key, quantized, matches, params, time.time())
+
+        # ===== 3단계: 영구 저장소 반영 =====
+        self._persist(key, self._entries[key], evicted_key)
+
+    # 메모리 저장 메서드 (용량 초과시 가장 오래된 항목 제거)
+    # Args:
+    #     key: 정규화된 질문
+    #     quantized: int8 양자화 벡터
+    #     matches: 검색 결과
+    #     params: 검색 결과의 검색 조건
+    #     matches_ts: 검색 결과 저장 시각
+    # Returns:
+    #     Optional[str]: 제거된 항목의 키 (제거 없으면 None)
+    def _store(self, key: str, quantized: np.ndarray, matches: Optional[list],
+               params: Optional[str] = None, matches_ts: float = 0.0) -> Optional[str]:
+        # ===== 1단계: 용량 초과시 가장 오래된 항목 제거 =====
+        evicted_key = None
+        if len(self._entries) >= self.max_size:
+            evicted_key, old_slot = self._entries.popitem(last=False)
+            self._valid[old_slot] = False
+            self._slot_keys[old_slot] = None
+            self._slot_matches[old_slot] = None
+            self._free_slots.append(old_slot)
+            if self._hnsw is not None:
+                self._hnsw.mark_deleted(old_slot)
+
+        # ===== 2단계: 슬롯 할당 및 저장 =====
+        slot = self._free_slots.pop() if self._free_slots else self._allocate_slot()
+        self._vectors[slot] = quantized
+        # 역양자화 결과가 단위 벡터가 되도록 스케일 설정 (내적 = 코사인)
+        self._scales[slot] = 1.0 / max(float(np.linalg.norm(quantized.astype(np.float32))), 1e-12)
+        self._valid[slot] = True
+        self._slot_keys[slot] = key
+        self._slot_matches[slot] = matches
+        self._slot_params[slot] = params
+        self._slot_matches_ts[slot] = matches_ts
+        self._entries[key] = slot
+
+        # ===== 3단계: HNSW 인덱스 반영 (항목 수가 기준 이상이 되면 생성) =====
+        if self._hnsw is not None:
+            self._hnsw_add(slot)
+        elif hnswlib is not None and len(self._entries) >= self.hnsw_min_size:
+            self._build_hnsw()
+        return evicted_key
+
+    # 영구 저장소 기록 메서드
+    # Args:
+    #     key: 정규화된 질문
+    #     slot: 저장된 슬롯 번호
+    #     evicted_key: 함께 삭제할 제거된 항목의 키
+    def _persist(self, key: str, slot: int, evicted_key: Optional[str] = None):
+        if self._conn is None:
+            return
+
+        try:
+            matches = self._slot_matches[slot]
+            matches_json = None
+            if matches is not None:
+                matches_json = json.dumps(
+                    [m.to_dict() if hasattr(m, 'to_dict') else dict(m) for m in matches],
+                    ensure_ascii=False
+                )
+
+            with self._db_lock:
+                if evicted_key is not None:
+                    self._conn.execute("DELETE FROM query_cache WHERE query_key = ?", (evicted_key,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO query_cache "
+                    "(query_key, vector, scale, matches_json, params, matches_ts, ts, hit_count) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE((SELECT hit_count FROM query_cache WHERE query_key = ?), 0))",
+                    (key, self._vectors[slot].tobytes(), float(self._scales[slot]), matches_json,
+                     self._slot_params[slot], self._slot_matches_ts[slot], time.time(), key)
+                )
+                self._conn.commit()
+
+        except Exception as e:
+            logging.error(f"시맨틱 캐시 저장 실패: {e}")
+
+    # 캐시 히트 기록 메서드 (최근 사용 시각 + 히트 수 갱신)
+    # Args:
+    #     key: 정규화된 질문
+    def _record_hit(self, key: str):
+        if self._conn is None:
+            return
+
+        try:
+            with self._db_lock:
+                self._conn.execute(
+                    "UPDATE query_cache SET ts = ?, hit_count = hit_count + 1 WHERE query_key = ?",
+                    (time.time(), key)
+                )
+                self._conn.commit()
+
+        except Exception as e:
+            logging.error(f"시맨틱 캐시 히트 기록 실패: {e}")
+
+    # 대칭 int8 양자화 메서드 (최대 절댓값을 127로 매핑)
+    # Args:
+    #     vec: float32 임베딩 벡터
+    # Returns:
+    #     np.ndarray: int8 양자화 벡터
+    @staticmethod
+    def _quantize(vec: np.ndarray) -> np.ndarray:
+        max_abs = float(np.max(np.abs(vec))) if vec.size else 0.0
+        scale = max_abs / 127.0 if max_abs > 0 else 1.0
+        return np.clip(np.round(vec / scale), -127, 127).astype(np.int8)
+
+    # 새 슬롯 할당 메서드 (행렬 용량이 부족하면 두 배로 확장)
+    # Returns:
+    #     int: 할당된 슬롯 번호
+    def _allocate_slot(self) -> int:
+        if self._size >= len(self._vectors):
+            new_capacity = min(max(64, len(self._vectors) * 2), self.max_size)
+            grow = new_capacity - len(self._vectors)
+            self._vectors = np.vstack([self._vectors, np.zeros((grow, self.dimension), dtype=np.int8)])
+            self._scales = np.concatenate([self._scales, np.zeros(grow, dtype=np.float32)])
+            self._valid = np.concatenate([self._valid, np.zeros(grow, dtype=bool)])
+            self._slot_keys.extend([None] * grow)
+            self._slot_matches.extend([None] * grow)
+            self._slot_params.extend([None] * grow)
+            self._slot_matches_ts.extend([0.0] * grow)
+
+        slot = self._size
+        self._size += 1
+        return slot
+
+    # 전체 캐시 비우기 메서드 (원본 데이터 변경시 무효화용, 영구 저장소 포함)
+    def clear(self):
+        self._entries.clear()
+        self._slot_keys = []
+        self._slot_matches = []
+        self._slot_params = []
+        self._slot_matches_ts = []
+        self._vectors = np.zeros((0, self.dimension), dtype=np.int8)
+        self._scales = np.zeros(0, dtype=np.float32)
+        self._valid = np.zeros(0, dtype=bool)
+        self._free_slots = []
+        self._size = 0
+        self._hnsw = None
+        self._hnsw_labels = set()
+
+        if self._conn is None:
+            return
+
+        try:
+            with self._db_lock:
+                self._conn.execute("DELETE FROM query_cache")
+                self._conn.commit()
+
+        except Exception as e:
+            logging.error(f"시맨틱 캐시 초기화 실패: {e}")
+
+    # 캐시 항목 수
+    def __len__(self) -> int:
+        return len(self._entries)
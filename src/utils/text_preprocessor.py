@@ -10,11 +10,97 @@
 
 import re
 import html
-import json as json_module
+import json
 import unicodedata
 import logging
 from typing import Optional
 
+try:
+    import orjson  # C 구현 JSON 직렬화 (미설치시 표준 json 사용)
+except ImportError:
+    orjson = None
+
+# ===== 정규식 패턴 (모듈 로드시 한 번만 컴파일) =====
+# HTML 태그 → 텍스트 구조 변환
+# 특정 태그를 먼저 변환한 뒤 나머지 태그를 제거해야 하므로 패스별로 순서대로 적용
+# (하나의 대안 정규식으로 합치면 짝 없는 '<'부터 다음 태그의 '>'까지 사용자 텍스트가 함께 삭제됨)
+_RE_BR = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_RE_P_CLOSE = re.compile(r'</p>', re.IGNORECASE)
+_RE_P_OPEN = re.compile(r'<p[^>]*>', re.IGNORECASE)
+_RE_LI_OPEN = re.compile(r'<li[^>]*>', re.IGNORECASE)
+_RE_LI_CLOSE = re.compile(r'</li>', re.IGNORECASE)
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+
+# 구 앱 이름 → 바이블 애플 (긴 패턴부터 순서대로 적용)
+_OLD_APP_NAME_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'바이블\s*애플\s*\(구\)\s*다번역\s*성경\s*찬송',
+    r'바이블\s*애플\s*\(구\)\s*다번역성경찬송',
+    r'\(구\)\s*다번역\s*성경\s*찬송',
+    r'\(구\)\s*다번역성경찬송',
+    r'다번역\s*성경\s*찬송',
+    r'다번역성경찬송',
+))
+
+# 구 앱 이름 제거용 (remove_old_app_name)
+_OLD_APP_NAME_REMOVE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\s*\(구\)\s*다번역성경찬송',
+    r'\s*\(구\)다번역성경찬송',
+    r'바이블\s*애플\s*\(구\)\s*다번역성경찬송',
+    r'바이블애플\s*\(구\)다번역성경찬송',
+))
+_RE_GOODTV_APP_SPACE = re.compile(r'(GOODTV\s+바이블\s*애플)\s+')
+
+# 공백/줄바꿈 정규화 (3개 이상 줄바꿈 | 연속 공백/탭을 한 번의 스캔으로 처리)
+_WS = re.compile(r'\n{3,}|[ \t]+')
+_RE_WHITESPACE = re.compile(r'\s+')
+
+# 제어 문자 삭제 테이블 (str.translate용 - 정규식 없이 한 번의 C 레벨 스캔으로 삭제)
+# ASCII 제어 문자 + 백스페이스, 캐리지 리턴, 폼 피드, 세로 탭 (탭/줄바꿈은 유지)
+_CTRL_TABLE = dict.fromkeys(
+    list(range(0x00, 0x09)) + [0x0B, 0x0C, 0x0D] + list(range(0x0E, 0x20)) + [0x7F]
+)
+
+# 생성 텍스트 정제 (clean_generated_text)
+_RE_SHORT_LATIN_WORDS = re.compile(r'\b[a-z]{1,2}\b(?:\s+[a-z]{1,2}\b)*', re.IGNORECASE)
+_RE_CYRILLIC = re.compile(r'[а-я]+')
+_RE_GREEK = re.compile(r'[α-ω]+')
+_RE_SPECIAL_RUN = re.compile(r'[^\w\s가-힣.,!?()"\'-]{3,}')
+_RE_PUNCT_RUN = re.compile(r'[.,;:!?]{3,}')
+
+# 답변 텍스트 정리 (clean_answer_text)
+_RE_MD_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+_RE_MD_ITALIC = re.compile(r'\*([^*]+)\*')
+_RE_SPACE_BETWEEN_TAGS = re.compile(r'>\s+<')
+_RE_P_LEADING_SPACE = re.compile(r'<p>\s+')
+_RE_P_TRAILING_SPACE = re.compile(r'\s+</p>')
+
+# 키워드/개념 추출
+_RE_KEYWORD = re.compile(r'[가-힣a-zA-Z0-9]+')
+# 키워드 추출시 제외할 한국어 불용어 (조사, 어미 등 - 호출마다 집합을 새로 만들지 않도록 모듈 상수로 유지)
+_KEYWORD_STOP_WORDS = frozenset({'는', '은', '이', '가', '을', '를', '에', '에서', '로', '으로', '와', '과', '의', '도', '만', '까지', '부터', '께서', '에게', '한테', '로부터', '으로부터'})
+_RE_KOREAN_NOUN = re.compile(r'[가-힣]{2,}')
+_RE_ENGLISH_WORD = re.compile(r'[a-zA-Z]{3,}')
+
+# 성경 번역본명
+_TRANSLATION_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'NIV',                # New International Version
+    r'KJV',                # King James Version
+    r'ESV',                # English Standard Version
+    r'개역개정',            # 개역개정판
+    r'개역한글',            # 개역한글판
+    r'개역\s*개정',        # 개역 개정 (공백 허용)
+    r'개역\s*한글',        # 개역 한글 (공백 허용)
+    r'영어\s*번역본',      # 영어 번역본
+    r'영문\s*성경',        # 영문 성경
+    r'한글\s*번역본',      # 한글 번역본
+    r'한국어\s*성경'       # 한국어 성경
+))
+
+
+# 공백 정규화 콜백 (줄바꿈 묶음 → 2개, 공백/탭 묶음 → 단일 공백)
+def _ws_sub(m) -> str:
+    return '\n\n' if m.group()[0] == '\n' else ' '
+
 
 # ===== 텍스트 전처리를 담당하는 메인 클래스 =====
 class TextPreprocessor:
@@ -27,44 +113,46 @@ class TextPreprocessor:
     # ☆ 실제 전처리 메서드
     # HTML 태그 제거, 앱 이름 통일, 공백 정규화
     def preprocess_text(self, text: str) -> str:
-        # 1단계: 입력 텍스트 유효성 검사 및 로깅
-        logging.info(f"전처리 시작: 입력 길이={len(text) if text else 0}")
+        # 1단계: 입력 텍스트 유효성 검사 및 로깅 (답변 생성시 참고 답변마다 호출되므로 단계별 로그는 DEBUG)
+        logging.debug(f"전처리 시작: 입력 길이={len(text) if text else 0}")
         # logging.info(f"전처리 입력 미리보기: {text[:100] if text else 'None'}...")
 
         # 2단계: null 체크 - 빈 텍스트 처리
         if not text:
-            logging.info("전처리: 빈 텍스트 입력")
+            logging.debug("전처리: 빈 텍스트 입력")
             return ""
         
         # 3단계: 문자열로 변환 및 HTML 엔티티 디코딩
         text = str(text)  # 안전한 문자열 변환
-        text = html.unescape(text)  # &amp; → &, &lt; → < 등 HTML 엔티티 복원
-        logging.info(f"HTML 디코딩 후 길이: {len(text)}")
+        if '&' in text:  # 엔티티가 없는 텍스트는 디코딩 스캔 생략
+            text = html.unescape(text)  # &amp; → &, &lt; → < 등 HTML 엔티티 복원
+            logging.debug(f"HTML 디코딩 후 길이: {len(text)}")
         
         # 4단계: HTML 태그 제거 및 텍스트 형태로 변환 (구조 유지)
-        text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)      # <br> → 줄바꿈
-        text = re.sub(r'</p>', '\n\n', text, flags=re.IGNORECASE)         # </p> → 단락 구분
-        text = re.sub(r'<p[^>]*>', '\n', text, flags=re.IGNORECASE)       # <p> → 줄바꿈
-        text = re.sub(r'<li[^>]*>', '\n• ', text, flags=re.IGNORECASE)    # <li> → 불릿포인트
-        text = re.sub(r'</li>', '', text, flags=re.IGNORECASE)            # </li> 제거
-        text = re.sub(r'<[^>]+>', '', text)                               # 나머지 HTML 태그 모두 제거
-        logging.info(f"HTML 태그 제거 후 길이: {len(text)}")
+        # <br> → 줄바꿈, </p> → 단락 구분, <p> → 줄바꿈, <li> → 불릿포인트, 나머지 태그 제거
+        if '<' in text:  # 태그가 없는 텍스트는 정규식 스캔 생략
+            text = _RE_BR.sub('\n', text)          # <br> → 줄바꿈
+            text = _RE_P_CLOSE.sub('\n\n', text)    # </p> → 단락 구분
+            text = _RE_P_OPEN.sub('\n', text)      # <p> → 줄바꿈
+            text = _RE_LI_OPEN.sub('\n• ', text)   # <li> → 불릿포인트
+            text = _RE_LI_CLOSE.sub('', text)      # </li> 제거
+            text = _RE_HTML_TAG.sub('', text)      # 나머지 HTML 태그 모두 제거
+            logging.debug(f"HTML 태그 제거 후 길이: {len(text)}")
         
         # 5단계: 구 앱 이름을 바이블 애플로 통일 (브랜드 일관성 유지)
-        text = re.sub(r'바이블\s*애플\s*\(구\)\s*다번역\s*성경\s*찬송', '바이블 애플', text, flags=re.IGNORECASE)
-        text = re.sub(r'바이블\s*애플\s*\(구\)\s*다번역성경찬송', '바이블 애플', text, flags=re.IGNORECASE)
-        text = re.sub(r'\(구\)\s*다번역\s*성경\s*찬송', '바이블 애플', text, flags=re.IGNORECASE)
-        text = re.sub(r'\(구\)\s*다번역성경찬송', '바이블 애플', text, flags=re.IGNORECASE)
-        text = re.sub(r'다번역\s*성경\s*찬송', '바이블 애플', text, flags=re.IGNORECASE)
-        text = re.sub(r'다번역성경찬송', '바이블 애플', text, flags=re.IGNORECASE)
+        # 모든 패턴에 '다번역'이 들어가므로 없으면 6번의 정규식 스캔 생략
+        # (앞 패턴의 치환 결과가 뒤 패턴과 다시 결합될 수 있어 패턴별 순차 적용은 유지)
+        if '다번역' in text:
+            for rx in _OLD_APP_NAME_RES:
+                text = rx.sub('바이블 애플', text)
         
         # 6단계: 공백 및 줄바꿈 정규화 - AI 처리에 최적화된 형태로 변환
-        text = re.sub(r'\n{3,}', '\n\n', text)    # 3개 이상 줄바꿈 → 2개로 제한 (가독성)
-        text = re.sub(r'[ \t]+', ' ', text)       # 연속 공백/탭 → 단일 공백 (토큰 절약)
-        text = text.strip()                       # 앞뒤 공백 제거 (깔끔한 처리)
+        # 3개 이상 줄바꿈 → 2개로 제한 (가독성), 연속 공백/탭 → 단일 공백 (토큰 절약)
+        text = _WS.sub(_ws_sub, text)
+        text = text.strip()  # 앞뒤 공백 제거 (깔끔한 처리)
         
         # 7단계: 전처리 완료 로깅
-        logging.info(f"전처리 완료: 최종 길이={len(text)}")
+        logging.debug(f"전처리 완료: 최종 길이={len(text)}")
         # logging.info(f"전처리 결과 미리보기: {text[:100]}...")
         
         return text
@@ -77,25 +165,28 @@ class TextPreprocessor:
         
         # 2단계: 기본 텍스트 정제
         text = str(text)  # 안전한 문자열 변환
-        text = html.unescape(text)  # HTML 엔티티 디코딩
+        if '&' in text:  # 엔티티가 없는 텍스트는 디코딩 스캔 생략
+            text = html.unescape(text)  # HTML 엔티티 디코딩
         
         # 3단계: HTML 태그 제거 (메타데이터용 간소화)
-        text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)  # <br> → 줄바꿈
-        text = re.sub(r'</p>', '\n', text, flags=re.IGNORECASE)       # </p> → 줄바꿈
-        text = re.sub(r'<p[^>]*>', '', text, flags=re.IGNORECASE)     # <p> 제거
-        text = re.sub(r'<[^>]+>', '', text)                           # 모든 HTML 태그 제거
+        # <br>, </p> → 줄바꿈, <p> 및 나머지 HTML 태그 제거
+        if '<' in text:
+            text = _RE_BR.sub('\n', text)        # <br> → 줄바꿈
+            text = _RE_P_CLOSE.sub('\n', text)   # </p> → 줄바꿈
+            text = _RE_P_OPEN.sub('', text)      # <p> 제거
+            text = _RE_HTML_TAG.sub('', text)    # 모든 HTML 태그 제거
         
-        # 4단계: 유니코드 정규화 (NFC: 정규 결합)
-        text = unicodedata.normalize('NFC', text)
+        # 4단계: 유니코드 정규화 (NFC: 정규 결합, ASCII 텍스트는 이미 정규형이므로 생략)
+        if not text.isascii():
+            text = unicodedata.normalize('NFC', text)
         
         # 5단계: 공백 정리 (메타데이터 용도에 따라 분기)
         if for_metadata:
             # 메타데이터용: 구조 유지하며 정리
-            text = re.sub(r'\n{3,}', '\n\n', text)  # 과도한 줄바꿈 제한
-            text = re.sub(r'[ \t]+', ' ', text)     # 연속 공백 정리
+            text = _WS.sub(_ws_sub, text)  # 과도한 줄바꿈 제한 및 연속 공백 정리
         else:
             # 일반용: 모든 공백을 단일 공백으로 통일
-            text = re.sub(r'\s+', ' ', text)
+            text = _RE_WHITESPACE.sub(' ', text)
         
         text = text.strip()  # 앞뒤 공백 제거
         
@@ -113,27 +204,29 @@ class TextPreprocessor:
             return ""
         
         # 2단계: JSON 직렬화로 특수문자 이스케이프 (한글 보존)
-        escaped = json_module.dumps(text, ensure_ascii=False) # ensure_ascii=False: 한글 깨짐 방지
+        # orjson은 항상 UTF-8로 출력하므로 ensure_ascii=False와 같은 결과
+        # (짝이 없는 서로게이트 문자처럼 orjson이 거부하는 텍스트는 표준 json으로 처리)
+        escaped = None
+        if orjson is not None:
+            try:
+                escaped = orjson.dumps(text).decode('utf-8')
+            except TypeError:
+                pass
+        if escaped is None:
+            escaped = json.dumps(text, ensure_ascii=False) # ensure_ascii=False: 한글 깨짐 방지
         
         # 3단계: 앞뒤 따옴표 제거하여 순수 이스케이프된 문자열 반환
         return escaped[1:-1]
 
     # 이전 앱 이름을 제거하는 메서드 (브랜드 통일성)
     def remove_old_app_name(self, text: str) -> str:
-        # 1단계: 제거할 구 앱 이름 패턴 정의
-        patterns_to_remove = [
-            r'\s*\(구\)\s*다번역성경찬송',
-            r'\s*\(구\)다번역성경찬송',
-            r'바이블\s*애플\s*\(구\)\s*다번역성경찬송',
-            r'바이블애플\s*\(구\)다번역성경찬송',
-        ]
-        
-        # 2단계: 각 패턴을 순차적으로 제거 (대소문자 무시)
-        for pattern in patterns_to_remove:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        # 1단계: 구 앱 이름 패턴을 순차적으로 제거 (대소문자 무시, 모든 패턴에 '다번역'이 들어가므로 없으면 생략)
+        if '다번역' in text:
+            for rx in _OLD_APP_NAME_REMOVE_RES:
+                text = rx.sub('', text)
         
-        # 3단계: GOODTV 바이블 애플 뒤 불필요한 공백 정리
-        text = re.sub(r'(GOODTV\s+바이블\s*애플)\s+', r'\1', text)
+        # 2단계: GOODTV 바이블 애플 뒤 불필요한 공백 정리
+        text = _RE_GOODTV_APP_SPACE.sub(r'\1', text)
         
         return text
 
@@ -144,20 +237,19 @@ class TextPreprocessor:
             return ""
         
         # 2단계: 제어 문자 제거 (ASCII 제어 문자)
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)  # NULL, 백스페이스 등
-        text = re.sub(r'[\b\r\f\v]', '', text)  # 백스페이스, 캐리지 리턴, 폼 피드, 세로 탭
+        text = text.translate(_CTRL_TABLE)  # NULL, 백스페이스, 캐리지 리턴, 폼 피드, 세로 탭 등
 
         # 3단계: 불필요한 언어 문자 제거 (한국어 앱용 정제)
-        text = re.sub(r'\b[a-z]{1,2}\b(?:\s+[a-z]{1,2}\b)*', '', text, flags=re.IGNORECASE)  # 영어 약어
-        text = re.sub(r'[а-я]+', '', text)  # 키릴 문자 (러시아어)
-        text = re.sub(r'[α-ω]+', '', text)  # 그리스 문자
+        text = _RE_SHORT_LATIN_WORDS.sub('', text)  # 영어 약어
+        text = _RE_CYRILLIC.sub('', text)           # 키릴 문자 (러시아어)
+        text = _RE_GREEK.sub('', text)              # 그리스 문자
 
         # 4단계: 특수 문자 및 과도한 구두점 정리
-        text = re.sub(r'[^\w\s가-힣.,!?()"\'-]{3,}', '', text)  # 3개 이상 연속 특수문자 제거
-        text = re.sub(r'[.,;:!?]{3,}', '.', text)  # 과도한 구두점을 마침표로 통일
+        text = _RE_SPECIAL_RUN.sub('', text)   # 3개 이상 연속 특수문자 제거
+        text = _RE_PUNCT_RUN.sub('.', text)    # 과도한 구두점을 마침표로 통일
 
         # 5단계: 공백 정리 및 최종 정제
-        text = re.sub(r'\s+', ' ', text)  # 연속 공백 → 단일 공백
+        text = _RE_WHITESPACE.sub(' ', text)  # 연속 공백 → 단일 공백
         text = text.strip()  # 앞뒤 공백 제거
         
         return text
@@ -169,17 +261,16 @@ class TextPreprocessor:
             return ""
         
         # 2단계: 제어 문자만 선별 제거 (HTML 태그 보존)
-        text = re.sub(r'[\b\r\f\v]', '', text)  # 백스페이스, 캐리지 리턴, 폼 피드, 세로 탭
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)  # ASCII 제어 문자
+        text = text.translate(_CTRL_TABLE)  # 백스페이스, 캐리지 리턴, 폼 피드, 세로 탭 및 ASCII 제어 문자
 
         # 3단계: 마크다운 스타일 제거 (Quill 에디터 호환성)
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # **굵게** → 굵게
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)      # *기울임* → 기울임
+        text = _RE_MD_BOLD.sub(r'\1', text)    # **굵게** → 굵게
+        text = _RE_MD_ITALIC.sub(r'\1', text)  # *기울임* → 기울임
         
         # 4단계: HTML 태그 내부 공백만 정리 (태그 자체는 유지)
-        text = re.sub(r'>\s+<', '><', text)      # 태그 사이 공백 제거
-        text = re.sub(r'<p>\s+', '<p>', text)    # <p> 태그 내부 앞 공백 제거
-        text = re.sub(r'\s+</p>', '</p>', text)  # </p> 태그 앞 공백 제거
+        text = _RE_SPACE_BETWEEN_TAGS.sub('><', text)   # 태그 사이 공백 제거
+        text = _RE_P_LEADING_SPACE.sub('<p>', text)     # <p> 태그 내부 앞 공백 제거
+        text = _RE_P_TRAILING_SPACE.sub('</p>', text)   # </p> 태그 앞 공백 제거
         
         # 5단계: 구 앱 이름 제거 (브랜드 통일)
         text = self.remove_old_app_name(text)
@@ -188,24 +279,21 @@ class TextPreprocessor:
 
     # 텍스트에서 핵심 키워드 추출 (검색 최적화용)
     def extract_keywords(self, text: str) -> list:
-        # 1단계: 한국어 불용어 정의 (조사, 어미 등)
-        stop_words = {'는', '은', '이', '가', '을', '를', '에', '에서', '로', '으로', '와', '과', '의', '도', '만', '까지', '부터', '께서', '에게', '한테', '로부터', '으로부터'}
-        
-        # 2단계: 정규식으로 의미있는 단어 추출 (한글, 영어, 숫자)
-        words = re.findall(r'[가-힣a-zA-Z0-9]+', text)
+        # 1단계: 정규식으로 의미있는 단어 추출 (한글, 영어, 숫자)
+        words = _RE_KEYWORD.findall(text)
         
-        # 3단계: 불용어 제거 및 길이 필터링 (2글자 이상)
-        keywords = [word for word in words if len(word) >= 2 and word not in stop_words]
+        # 2단계: 불용어 제거 및 길이 필터링 (2글자 이상)
+        keywords = [word for word in words if len(word) >= 2 and word not in _KEYWORD_STOP_WORDS]
         
         return keywords
 
     # 텍스트에서 핵심 개념을 추출 (의미 분석용)
     def extract_key_concepts(self, text: str) -> list:
         # 1단계: 한글 명사 추출 (2글자 이상)
-        korean_nouns = re.findall(r'[가-힣]{2,}', text)
+        korean_nouns = _RE_KOREAN_NOUN.findall(text)
         
         # 2단계: 영어 단어 추출 (3글자 이상)
-        english_words = re.findall(r'[a-zA-Z]{3,}', text)
+        english_words = _RE_ENGLISH_WORD.findall(text)
         
         # 3단계: 모든 단어 통합 및 정제
         concepts = []
@@ -220,31 +308,15 @@ class TextPreprocessor:
 
     # 텍스트에서 성경 번역본명을 추출 (성경 앱 특화)
     def extract_translations_from_text(self, text: str) -> list:
-        # 1단계: 성경 번역본 패턴 정의 (영어 + 한국어)
-        translation_patterns = [
-            r'NIV',                # New International Version
-            r'KJV',                # King James Version
-            r'ESV',                # English Standard Version
-            r'개역개정',            # 개역개정판
-            r'개역한글',            # 개역한글판
-            r'개역\s*개정',        # 개역 개정 (공백 허용)
-            r'개역\s*한글',        # 개역 한글 (공백 허용)
-            r'영어\s*번역본',      # 영어 번역본
-            r'영문\s*성경',        # 영문 성경
-            r'한글\s*번역본',      # 한글 번역본
-            r'한국어\s*성경'       # 한국어 성경
-        ]
-        
-        # 2단계: 각 패턴으로 텍스트에서 매칭되는 번역본명 찾기
+        # 1단계: 각 번역본 패턴(영어 + 한국어)으로 텍스트에서 매칭되는 번역본명 찾기
         found_translations = []
-        for pattern in translation_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)  # 대소문자 무시
-            found_translations.extend(matches)
+        for rx in _TRANSLATION_RES:
+            found_translations.extend(rx.findall(text))  # 대소문자 무시
         
-        # 3단계: 중복 제거 및 정규화 (공백 제거 및 통일)
+        # 2단계: 중복 제거 및 정규화 (공백 제거 및 통일)
         normalized = []
         for trans in found_translations:
-            trans = re.sub(r'\s+', '', trans)  # 공백 제거로 정규화
+            trans = _RE_WHITESPACE.sub('', trans)  # 공백 제거로 정규화
             if trans not in normalized:
                 normalized.append(trans)
         
@@ -9,7 +9,22 @@
 import logging
 import json
 from typing import Dict, Tuple
-from src.utils.memory_manager import memory_cleanup
+
+try:
+    import orjson  # C 구현 JSON 직렬화 (미설치시 표준 json 사용)
+except ImportError:
+    orjson = None
+
+
+# 로그 출력용 JSON 직렬화 (한글은 이스케이프 없이 그대로 출력)
+# Args:
+#     obj: 직렬화할 객체
+# Returns:
+#     str: JSON 문자열
+def _json_dumps(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
 
 class UnifiedTextAnalyzer:
     """오타 수정 + 의도 분석을 통합한 분석기"""
@@ -25,11 +40,10 @@ class UnifiedTextAnalyzer:
     #     Tuple[str, Dict]: (수정된_텍스트, 의도_분석_결과)
     def analyze_and_correct(self, text: str) -> Tuple[str, Dict]:
         try:
-            with memory_cleanup():
-                logging.info(f"====================== 의도 분석 + 오타 수정 시작 ======================")
-                
-                # 통합 시스템 프롬프트
-                system_prompt = """As a Bible Apple application inquiry expert analyst, perform the following two tasks simultaneously on the user's question:
+            logging.info(f"====================== 의도 분석 + 오타 수정 시작 ======================")
+            
+            # 통합 시스템 프롬프트
+            system_prompt = """As a Bible Apple application inquiry expert analyst, perform the following two tasks simultaneously on the user's question:
 
     1. Typo correction: Correct typos, spacing, and spelling in the input text to make it a natural and correct Korean text. Maintain the meaning and tone.
     2. Intent analysis: Based on the corrected text, analyze the user's core intent and related elements.
@@ -55,91 +69,93 @@ class UnifiedTextAnalyzer:
     - All field values in JSON must be in Korean
     - Analyze the user's question directly without including any prompt text in corrected_text."""
 
-    # """바이블 앱 문의 전문 분석가로서, 사용자의 질문에 대해 다음 두 가지 작업을 동시에 수행하세요:
+# """바이블 앱 문의 전문 분석가로서, 사용자의 질문에 대해 다음 두 가지 작업을 동시에 수행하세요:
 
-    # 1. 오타 수정: 입력 텍스트의 오타, 띄어쓰기, 맞춤법을 교정하여 자연스럽고 올바른 한글 텍스트로 수정하세요. 의미와 어조는 유지하세요.
-    # 2. 의도 분석: 수정된 텍스트를 기반으로 사용자의 핵심 의도와 관련 요소를 분석하세요.
+# 1. 오타 수정: 입력 텍스트의 오타, 띄어쓰기, 맞춤법을 교정하여 자연스럽고 올바른 한글 텍스트로 수정하세요. 의미와 어조는 유지하세요.
+# 2. 의도 분석: 수정된 텍스트를 기반으로 사용자의 핵심 의도와 관련 요소를 분석하세요.
 
-    # 응답 형식 (JSON):
-    # {
-    #     "corrected_text": "수정된 텍스트",
-    #     "intent_analysis": {
-    #         "core_intent": "핵심 의도",
-    #         "intent_category": "카테고리",
-    #         "primary_action": "주요 행동",
-    #         "semantic_keywords": ["의미론적 핵심 키워드들"]
-    #     }
-    # }
+# 응답 형식 (JSON):
+# {
+#     "corrected_text": "수정된 텍스트",
+#     "intent_analysis": {
+#         "core_intent": "핵심 의도",
+#         "intent_category": "카테고리",
+#         "primary_action": "주요 행동",
+#         "semantic_keywords": ["의미론적 핵심 키워드들"]
+#     }
+# }
 
-    # 규칙:
-    # - 앱/어플리케이션 → 앱 통일
-    # - 띄어쓰기, 맞춤법 교정
-    # - 의미/어조 유지
-    # - 유효한 JSON만 반환
-    # - 바이블 애플 앱 기능과 관련없는 키워드는 수집하지 말 것"""
+# 규칙:
+# - 앱/어플리케이션 → 앱 통일
+# - 띄어쓰기, 맞춤법 교정
+# - 의미/어조 유지
+# - 유효한 JSON만 반환
+# - 바이블 애플 앱 기능과 관련없는 키워드는 수집하지 말 것"""
 
-                user_prompt = text
+            user_prompt = text
+            
+            # GPT API 호출 (gpt-5-mini 모델에 맞는 파라미터 사용)
+            response = self.openai_client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_completion_tokens=120000,
+                response_format={"type": "json_object"}
+                # temperature 파라미터 제거 (gpt-5-mini에서 지원하지 않음)
+            )
+            
+            raw_content = response.choices[0].message.content
+            if isinstance(raw_content, list):
+                # content가 리스트인 경우 (새 SDK 포맷)
+                result_text = "".join([c.get("text", "") for c in raw_content if c.get("type") == "text"]).strip()
+            else:
+                result_text = (raw_content or "").strip()
+            
+            # 🔍 GPT 응답 검증 및 로깅 강화
+            logging.info(f"통합 분석 - GPT 원본 응답: {result_text}")
+            # 응답 전체 직렬화는 DEBUG 로그가 켜져 있을 때만 수행
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"GPT 응답 전체 구조: {response.model_dump_json(indent=2)}")
+            # 빈 응답 체크 및 상세 로깅
+            if not result_text or result_text.isspace():
+                logging.error("GPT 응답이 비어있음 - 기본값 반환")
+                logging.error(f"GPT 응답 상세: result_text='{result_text}', len={len(result_text) if result_text else 0}")
+                logging.error(f"GPT 응답 객체: {response}")
+                logging.error(f"GPT 응답 choices: {response.choices if hasattr(response, 'choices') else 'N/A'}")
+                return text, self._get_default_intent_analysis(text)
+            
+            # JSON 파싱 시도
+            try:
+                result = json.loads(result_text)
+                corrected_text = result.get('corrected_text', text)
+                intent_analysis_raw = result.get('intent_analysis', {})
                 
-                # GPT API 호출 (gpt-5-mini 모델에 맞는 파라미터 사용)
-                response = self.openai_client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    max_completion_tokens=120000,
-                    response_format={"type": "json_object"}
-                    # temperature 파라미터 제거 (gpt-5-mini에서 지원하지 않음)
-                )
+                # 기존 호환성을 위한 필드 추가
+                intent_analysis = {
+                    'core_intent': intent_analysis_raw.get('core_intent', '일반 문의'),
+                    'intent_category': intent_analysis_raw.get('intent_category', '일반'),
+                    'primary_action': intent_analysis_raw.get('primary_action', '정보 제공'),
+                    'semantic_keywords': intent_analysis_raw.get('semantic_keywords', [])
+                }
+       
+                # 상세 결과 로그
+                logging.info(f"🔍 오타 수정된 텍스트: '{corrected_text}'")
+                logging.info(f"🔍 의도 분석 결과: {_json_dumps(intent_analysis)}")
+
+                return corrected_text, intent_analysis
                 
-                raw_content = response.choices[0].message.content
-                if isinstance(raw_content, list):
-                    # content가 리스트인 경우 (새 SDK 포맷)
-                    result_text = "".join([c.get("text", "") for c in raw_content if c.get("type") == "text"]).strip()
-                else:
-                    result_text = (raw_content or "").strip()
+            except json.JSONDecodeError as e:
+                logging.error(f"통합 분석 JSON 파싱 실패: {e}")
+                logging.error(f"파싱 실패한 응답: {result_text}")
                 
-                # 🔍 GPT 응답 검증 및 로깅 강화
-                logging.info(f"통합 분석 - GPT 원본 응답: {result_text}")
-                logging.debug(f"GPT 응답 전체 구조: {response.model_dump_json(indent=2)}")
-                # 빈 응답 체크 및 상세 로깅
-                if not result_text or result_text.isspace():
-                    logging.error("GPT 응답이 비어있음 - 기본값 반환")
-                    logging.error(f"GPT 응답 상세: result_text='{result_text}', len={len(result_text) if result_text else 0}")
-                    logging.error(f"GPT 응답 객체: {response}")
-                    logging.error(f"GPT 응답 choices: {response.choices if hasattr(response, 'choices') else 'N/A'}")
-                    return text, self._get_default_intent_analysis(text)
+                # JSON 파싱 실패시 텍스트 기반 파싱 시도
+                corrected_text, intent_analysis = self._parse_text_response(result_text, text)
                 
-                # JSON 파싱 시도
-                try:
-                    result = json.loads(result_text)
-                    corrected_text = result.get('corrected_text', text)
-                    intent_analysis_raw = result.get('intent_analysis', {})
-                    
-                    # 기존 호환성을 위한 필드 추가
-                    intent_analysis = {
-                        'core_intent': intent_analysis_raw.get('core_intent', '일반 문의'),
-                        'intent_category': intent_analysis_raw.get('intent_category', '일반'),
-                        'primary_action': intent_analysis_raw.get('primary_action', '정보 제공'),
-                        'semantic_keywords': intent_analysis_raw.get('semantic_keywords', [])
-                    }
-           
-                    # 상세 결과 로그
-                    logging.info(f"🔍 오타 수정된 텍스트: '{corrected_text}'")
-                    logging.info(f"🔍 의도 분석 결과: {json.dumps(intent_analysis, ensure_ascii=False)}")
-
-                    return corrected_text, intent_analysis
-                    
-                except json.JSONDecodeError as e:
-                    logging.error(f"통합 분석 JSON 파싱 실패: {e}")
-                    logging.error(f"파싱 실패한 응답: {result_text}")
-                    
-                    # JSON 파싱 실패시 텍스트 기반 파싱 시도
-                    corrected_text, intent_analysis = self._parse_text_response(result_text, text)
-                    
-                    if not intent_analysis:
-                        logging.warning("텍스트 파싱도 실패, 기본값 반환")
-                        return text, self._get_default_intent_analysis(text)
+                if not intent_analysis:
+                    logging.warning("텍스트 파싱도 실패, 기본값 반환")
+                    return text, self._get_default_intent_analysis(text)
                     
         except Exception as e:
             logging.error(f"통합 텍스트 분석 실패: {e}")
@@ -180,7 +196,7 @@ class UnifiedTextAnalyzer:
                         intent_analysis["target_object"] = line.split(':')[-1].strip() if ':' in line else "기타"
             
             logging.info(f"텍스트 파싱 결과 - 수정된 텍스트: '{corrected_text}'")
-            logging.info(f"텍스트 파싱 결과 - 의도 분석: {json.dumps(intent_analysis, ensure_ascii=False)}")
+            logging.info(f"텍스트 파싱 결과 - 의도 분석: {_json_dumps(intent_analysis)}")
             
             return corrected_text, intent_analysis
             
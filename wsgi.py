@@ -0,0 +1,13 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+WSGI 진입점
+- Gunicorn 등 WSGI 서버가 불러갈 Flask 앱 객체 노출
+- 실행: gunicorn -c gunicorn.conf.py wsgi:app
+- 외부 서비스 클라이언트(Pinecone, OpenAI, MSSQL 풀, Redis)는 이 모듈을 import하는
+  각 워커 프로세스 안에서 생성됨 (gunicorn.conf.py의 preload_app = False)
+"""
+
+from free_4_ai_answer_generator import app
+
+__all__ = ['app']